@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Aplicação de Traduções
+Mede apply_translations e save_translations em XMLs sintéticos de tamanhos
+crescentes (uma entrada a cada ~350 bytes, como 60 mil entradas em 20 MB).
+A reconstrução antiga por fatiamento (antes + tradução + depois a cada
+entrada) só roda nos tamanhos pequenos: ela é quadrática
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from file_processor import FileProcessor
+
+
+def write_xml(path: str, size_mb: float) -> int:
+    """Escreve um XML com entradas distintas; retorna o número de entradas"""
+    target = int(size_mb * 1024 * 1024)
+    written = 0
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n<LanguageData>\n')
+        while written < target:
+            line = (f'  <Item_{count}.description>An ancient blade forged in the northern '
+                    f'mountains, passed down through generations of the royal guard, '
+                    f'carried into battle number {count} by a hero of the realm.'
+                    f'</Item_{count}.description>\n'
+                    f'  <!-- comment block to pad the file like real game data {count} -->\n')
+            f.write(line)
+            written += len(line)
+            count += 1
+        f.write('</LanguageData>\n')
+    return count
+
+
+def legacy_apply(processor: FileProcessor, translations: dict) -> str:
+    """Reconstrução anterior: uma cópia do conteúdo inteiro por entrada"""
+    result = processor.original_content
+    for entry in sorted(processor.entries, key=lambda e: e.position, reverse=True):
+        if entry.original_text in translations:
+            translated = translations[entry.original_text]
+            before = result[:entry.position]
+            after = result[entry.position + len(entry.original_text):]
+            result = before + translated + after
+    return result
+
+
+def measure(size_mb: float, legacy_limit_mb: float, tmp_dir: str) -> dict:
+    """Carrega um XML do tamanho pedido e mede as três formas de gravar"""
+    path = os.path.join(tmp_dir, f"data_{size_mb}.xml")
+    write_xml(path, size_mb)
+
+    processor = FileProcessor()
+    processor.load_file(path)
+    entries = processor.extract_texts()
+    translations = {e.original_text: f"Tradução {e.index}: " + e.original_text[::-1] for e in entries}
+
+    start = time.perf_counter()
+    joined = processor.apply_translations(translations)
+    apply_elapsed = time.perf_counter() - start
+
+    output = os.path.join(tmp_dir, "out.xml")
+    start = time.perf_counter()
+    processor.save_translations(output, translations, create_backup=False)
+    stream_elapsed = time.perf_counter() - start
+
+    legacy_elapsed = None
+    if size_mb <= legacy_limit_mb:
+        start = time.perf_counter()
+        legacy = legacy_apply(processor, translations)
+        legacy_elapsed = time.perf_counter() - start
+        assert legacy == joined
+
+    os.remove(path)
+    return {
+        'entries': len(entries),
+        'apply': apply_elapsed,
+        'stream': stream_elapsed,
+        'legacy': legacy_elapsed,
+    }
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de aplicação de traduções")
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1, 2, 5, 10, 20, 40],
+                        help="Tamanhos dos XMLs em MB")
+    parser.add_argument('--legacy-limit', type=float, default=2,
+                        help="Maior tamanho (MB) medido com a reconstrução antiga")
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("📊 BENCHMARK - apply_translations em passada única")
+    print("=" * 78)
+    print(f"{'MB':>5} {'Entradas':>9} {'join':>9} {'ms/MB':>7} {'streaming':>10} {'antigo':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size_mb in args.sizes:
+            r = measure(size_mb, args.legacy_limit, tmp_dir)
+            legacy = f"{r['legacy']:>9.2f}s" if r['legacy'] is not None else f"{'-':>10}"
+            print(f"{size_mb:>5g} {r['entries']:>9} {r['apply']:>8.3f}s "
+                  f"{r['apply'] * 1000 / size_mb:>7.1f} {r['stream']:>9.3f}s {legacy}")
+
+    print("=" * 78)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
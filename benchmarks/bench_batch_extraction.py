@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Extração em Lote Paralela
+Gera uma árvore sintética de mod (2000 arquivos XML e JSON por padrão, em
+subpastas) e mede BatchProcessor.extract_all_texts com diferentes números
+de processos, conferindo que todos extraem as mesmas entradas
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from batch_processor import BatchProcessor
+from regex_profiles import RegexProfileManager
+
+
+def make_tree(root: str, files: int, items: int):
+    """Árvore de mod: metade XML no estilo RimWorld, metade JSON de idioma"""
+    for i in range(files):
+        folder = os.path.join(root, f"Mod{i % 20}", "Defs" if i % 2 == 0 else "Languages")
+        os.makedirs(folder, exist_ok=True)
+
+        if i % 2 == 0:
+            parts = ['<?xml version="1.0" encoding="utf-8"?>\n<Defs>\n']
+            for j in range(items):
+                parts.append(f'  <!-- <label>old {i}.{j}</label> -->\n'
+                             f'  <ThingDef><defName>Thing_{i}_{j}</defName>\n'
+                             f'    <label>Thing label {i}.{j}</label>\n'
+                             f'    <description>Description of thing {i}.{j} for the mod.</description>\n'
+                             f'  </ThingDef>\n')
+            parts.append('</Defs>\n')
+            name = f"Things_{i}.xml"
+        else:
+            parts = ['{\n']
+            parts.append(',\n'.join(f'  "line_{j}": "Dialogue line {i}.{j}, spoken by the merchant",\n'
+                                    f'  "id_{j}": "dlg_{i}_{j}"' for j in range(items)))
+            parts.append('\n}\n')
+            name = f"Strings_{i}.json"
+
+        with open(os.path.join(folder, name), 'w', encoding='utf-8') as f:
+            f.write(''.join(parts))
+
+
+def run_extraction(tree: str, manager: RegexProfileManager, workers: int) -> tuple:
+    """Extrai a árvore com o número de processos dado: (entradas, segundos)"""
+    processor = BatchProcessor(manager, max_workers=workers)
+    processor.scan_directory(tree)
+    start = time.perf_counter()
+    entries = processor.extract_all_texts()
+    elapsed = time.perf_counter() - start
+    return [(info.filepath, entry.original_text, entry.position) for info, entry in entries], elapsed
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de extração em lote paralela")
+    parser.add_argument('--files', type=int, default=2000,
+                        help="Arquivos na árvore sintética")
+    parser.add_argument('--items', type=int, default=50,
+                        help="Definições (XML) ou pares de linhas (JSON) por arquivo")
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+                        help="Números de processos a medir")
+    args = parser.parse_args()
+
+    print("=" * 64)
+    print("📊 BENCHMARK - Extração em lote com ProcessPoolExecutor")
+    print("=" * 64)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tree = os.path.join(tmp_dir, "tree")
+        make_tree(tree, args.files, args.items)
+        manager = RegexProfileManager(os.path.join(tmp_dir, "profiles"))
+
+        print(f"Árvore: {args.files} arquivos | Núcleos: {os.cpu_count()}")
+        print(f"{'Processos':>9} {'Tempo':>9} {'Arquivos/s':>11} {'Entradas':>9} {'Ganho':>7}")
+
+        baseline_entries, baseline = None, None
+        for workers in args.workers:
+            entries, elapsed = run_extraction(tree, manager, workers)
+            if baseline_entries is None:
+                baseline_entries, baseline = entries, elapsed
+            assert entries == baseline_entries
+
+            print(f"{workers:>9} {elapsed:>8.2f}s {args.files / elapsed:>11.0f} "
+                  f"{len(entries):>9} {baseline / elapsed:>6.2f}x")
+
+    print("=" * 64)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark do Pool de Conexões da Memória de Tradução
+Mede buscas/segundo de N threads leitoras enquanto uma thread escritora
+executa transações longas com add_translations_batch
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from database import TranslationMemory
+
+
+def seed_memory(memory: TranslationMemory, rows: int) -> list:
+    """Popula a memória com traduções sintéticas e retorna os textos originais"""
+    originals = [f"Seed text number {i}" for i in range(rows)]
+    memory.add_translations_batch([(text, f"Texto semente {i}") for i, text in enumerate(originals)])
+    return originals
+
+
+def run_benchmark(readers: int, rows: int, duration: float, batch_size: int) -> dict:
+    """
+    Executa o benchmark
+
+    Args:
+        readers: Número de threads leitoras
+        rows: Quantidade de traduções pré-carregadas
+        duration: Duração da medição em segundos
+        batch_size: Tamanho de cada lote escrito pela thread escritora
+
+    Returns:
+        Dicionário com os resultados
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        memory = TranslationMemory(os.path.join(tmp_dir, "bench.db"))
+        originals = seed_memory(memory, rows)
+
+        stop = threading.Event()
+        lookups = [0] * readers
+        batches_written = [0]
+
+        def reader(slot: int):
+            rng = random.Random(slot)
+            count = 0
+            while not stop.is_set():
+                memory.get_translation(rng.choice(originals))
+                count += 1
+            lookups[slot] = count
+
+        def writer():
+            counter = 0
+            while not stop.is_set():
+                batch = [(f"Writer text {counter}-{i}", f"Texto escritor {counter}-{i}")
+                         for i in range(batch_size)]
+                memory.add_translations_batch(batch)
+                batches_written[0] += 1
+                counter += 1
+
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+        threads.append(threading.Thread(target=writer))
+
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+
+        time.sleep(duration)
+        stop.set()
+
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        memory.close()
+
+    total_lookups = sum(lookups)
+    return {
+        'readers': readers,
+        'lookups': total_lookups,
+        'lookups_per_sec': total_lookups / elapsed,
+        'batches_written': batches_written[0],
+        'elapsed': elapsed,
+    }
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark do pool de conexões")
+    parser.add_argument('--readers', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help="Quantidades de threads leitoras a testar")
+    parser.add_argument('--rows', type=int, default=20000,
+                        help="Traduções pré-carregadas na memória")
+    parser.add_argument('--duration', type=float, default=3.0,
+                        help="Duração de cada rodada em segundos")
+    parser.add_argument('--batch-size', type=int, default=5000,
+                        help="Tamanho dos lotes da thread escritora")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📊 BENCHMARK - Pool de Conexões (1 escritor + N leitores)")
+    print("=" * 60)
+
+    for readers in args.readers:
+        result = run_benchmark(readers, args.rows, args.duration, args.batch_size)
+        print(f"Leitores: {result['readers']:>3} | "
+              f"Buscas/s: {result['lookups_per_sec']:>10.0f} | "
+              f"Lotes escritos: {result['batches_written']}")
+
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark da Exportação em Streaming da Memória de Tradução
+Mede linhas/segundo de export_to_file em cada formato e compressão, para
+bancos de tamanhos diferentes, e opcionalmente o pico de memória Python
+(uma segunda passada com tracemalloc, que é lento demais para cronometrar)
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from database import TranslationMemory, ZSTD_AVAILABLE
+
+
+TARGETS = ['export.csv', 'export.tsv', 'export.jsonl', 'export.csv.gz', 'export.jsonl.gz']
+if ZSTD_AVAILABLE:
+    TARGETS.append('export.jsonl.zst')
+
+
+def seed_memory(memory: TranslationMemory, rows: int):
+    """Popula a memória com traduções sintéticas sem montar a lista inteira"""
+    memory.add_translations_bulk(
+        (f"Synthetic source text number {i} with some padding",
+         f"Texto sintético de destino número {i} com enchimento")
+        for i in range(rows)
+    )
+
+
+def run_benchmark(rows: int, targets: list, trace_memory: bool) -> list:
+    """
+    Executa o benchmark
+
+    Args:
+        rows: Quantidade de traduções no banco
+        targets: Nomes de arquivo de destino (formato deduzido pela extensão)
+        trace_memory: Se True, repete cada exportação medindo o pico de memória
+
+    Returns:
+        Lista de dicionários com os resultados de cada destino
+    """
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        memory = TranslationMemory(os.path.join(tmp_dir, "bench.db"))
+        seed_memory(memory, rows)
+
+        for target in targets:
+            path = os.path.join(tmp_dir, target)
+
+            start = time.perf_counter()
+            success = memory.export_to_file(path)
+            elapsed = time.perf_counter() - start
+
+            peak = None
+            if trace_memory:
+                tracemalloc.start()
+                memory.export_to_file(path)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+            results.append({
+                'target': target,
+                'success': success,
+                'rows_per_sec': rows / elapsed if elapsed > 0 else 0,
+                'peak_mb': peak / (1024 * 1024) if peak is not None else None,
+                'size_mb': os.path.getsize(path) / (1024 * 1024) if success else 0,
+            })
+
+        memory.close()
+
+    return results
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark da exportação em streaming")
+    parser.add_argument('--rows', type=int, nargs='+', default=[100000, 1000000],
+                        help="Tamanhos de banco a testar")
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="Mede também o pico de memória Python (tracemalloc)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📊 BENCHMARK - Exportação em Streaming")
+    print("=" * 60)
+
+    for rows in args.rows:
+        print(f"Traduções: {rows}")
+        for result in run_benchmark(rows, TARGETS, args.trace_memory):
+            status = "" if result['success'] else " (falhou)"
+            peak = ""
+            if result['peak_mb'] is not None:
+                peak = f" | Pico Python: {result['peak_mb']:>6.1f} MB"
+            print(f"  {result['target']:<18} | "
+                  f"Linhas/s: {result['rows_per_sec']:>10.0f} | "
+                  f"Arquivo: {result['size_mb']:>7.1f} MB{peak}{status}")
+
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
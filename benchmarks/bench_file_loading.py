@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Carregamento de Arquivos
+Gera um XML no limite LIMITS.MAX_FILE_SIZE_MB e compara o carregamento
+antigo (arquivo lido inteiro para detectar o encoding e aberto de novo para
+decodificar) com o atual (mmap único, detecção incremental, decodificação
+sobre o mesmo buffer), em UTF-8 e em Latin-1. Cada medição roda em um processo novo para que o pico de
+memória (RSS e alocações Python) não seja contaminado pela anterior
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from file_processor import FileProcessor, _detect_encoding_fallback
+from security import LIMITS
+
+
+def write_xml(path: str, size_mb: int, encoding: str = 'utf-8'):
+    """Escreve um XML de jogo sintético com o tamanho pedido"""
+    target = size_mb * 1024 * 1024
+    written = 0
+    with open(path, 'w', encoding=encoding, newline='\n') as f:
+        f.write(f'<?xml version="1.0" encoding="{encoding}"?>\n<LanguageData>\n')
+        i = 0
+        while written < target:
+            line = (f'  <Item_{i}.label>Ancient forged blade number {i}, '
+                    f'with a long description of café and ação</Item_{i}.label>\n')
+            f.write(line)
+            written += len(line.encode(encoding))
+            i += 1
+        f.write('</LanguageData>\n')
+
+
+def legacy_load(path: str) -> str:
+    """Carregamento anterior: leitura completa para detecção e nova leitura em modo texto"""
+    with open(path, 'rb') as f:
+        raw_data = f.read()
+        encoding = _detect_encoding_fallback(raw_data)
+    with open(path, 'r', encoding=encoding) as f:
+        return f.read()
+
+
+def mmap_load(path: str) -> str:
+    """Carregamento atual do FileProcessor"""
+    processor = FileProcessor()
+    processor.load_file(path)
+    return processor.original_content
+
+
+def worker(mode: str, path: str):
+    """Executa um carregamento e imprime tempo, pico de alocações e de RSS (MB)"""
+    load = legacy_load if mode == 'legacy' else mmap_load
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    content = load(path)
+    elapsed = time.perf_counter() - start
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{elapsed:.4f} {traced_peak / (1024 * 1024):.1f} {(rss_peak - rss_before) / 1024:.1f} "
+          f"{len(content)}")
+
+
+def measure(mode: str, path: str, repeat: int) -> dict:
+    """Mede um modo em processos separados e devolve a melhor execução"""
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', mode, path],
+                                capture_output=True, text=True, check=True).stdout.split()
+        runs.append(tuple(float(value) for value in output))
+    elapsed, traced, rss, chars = min(runs)
+    return {'elapsed': elapsed, 'traced': traced, 'rss': rss, 'chars': int(chars)}
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de carregamento de arquivos")
+    parser.add_argument('--size-mb', type=int, default=LIMITS.MAX_FILE_SIZE_MB,
+                        help="Tamanho do XML gerado (padrão: LIMITS.MAX_FILE_SIZE_MB)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Execuções por modo (vale a mais rápida)")
+    parser.add_argument('--worker', nargs=2, metavar=('MODO', 'ARQUIVO'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(*args.worker)
+        return 0
+
+    print("=" * 70)
+    print(f"📊 BENCHMARK - Carregamento de XML de {args.size_mb} MB")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for encoding in ('utf-8', 'latin-1'):
+            path = os.path.join(tmp_dir, f"big-{encoding}.xml")
+            write_xml(path, args.size_mb, encoding)
+            print(encoding)
+
+            for label, mode in (("Leitura dupla (antigo)", 'legacy'), ("mmap + incremental", 'mmap')):
+                r = measure(mode, path, args.repeat)
+                print(f"  {label:<24} | Tempo: {r['elapsed']:>6.2f}s | Pico Python: {r['traced']:>6.1f} MB | "
+                      f"Pico RSS: {r['rss']:>6.1f} MB | Caracteres: {r['chars']}")
+
+    print("=" * 70)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
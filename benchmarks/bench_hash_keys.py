@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Chaves por Hash do Texto Original
+Compara, em um corpus de textos longos (descrições de 500 a 5000
+caracteres), o esquema antigo (original_text UNIQUE, índice sobre o texto
+completo) com o atual (índice sobre origem, destino e original_text_hash,
+texto comparado só para confirmar): tamanho dos índices e latência das
+buscas exatas, acertos e falhas
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from database import TranslationMemory, text_hash
+
+WORDS = ("ancient", "blade", "forged", "kingdom", "shadow", "mountain", "river", "crown",
+         "dragon", "merchant", "village", "storm", "silver", "guardian", "forest", "ember")
+
+# Esquema 1.0: o texto original completo é a chave única
+LEGACY_TABLE_SQL = '''
+    CREATE TABLE translations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        original_text TEXT NOT NULL UNIQUE,
+        translated_text TEXT NOT NULL,
+        source_language TEXT DEFAULT 'en',
+        target_language TEXT DEFAULT 'pt',
+        category TEXT DEFAULT 'general',
+        notes TEXT DEFAULT '',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        usage_count INTEGER DEFAULT 1
+    )
+'''
+
+
+def make_corpus(count: int, seed: int = 42) -> list:
+    """Gera descrições longas distintas (o prefixo comum força comparações longas)"""
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(count):
+        length = rng.randint(500, 5000)
+        words = []
+        size = 0
+        while size < length:
+            word = rng.choice(WORDS)
+            words.append(word)
+            size += len(word) + 1
+        # Diferença só no fim: o pior caso para um índice sobre o texto completo
+        corpus.append("Item description: " + " ".join(words) + f" #{i}")
+    return corpus
+
+
+def index_bytes(conn: sqlite3.Connection, names: list) -> int:
+    """Bytes ocupados pelos índices (tabela virtual dbstat)"""
+    placeholders = ','.join('?' * len(names))
+    try:
+        row = conn.execute(
+            f"SELECT COALESCE(SUM(pgsize), 0) FROM dbstat WHERE name IN ({placeholders})", names
+        ).fetchone()
+        return row[0]
+    except sqlite3.OperationalError:
+        return 0
+
+
+def time_lookups(execute, probes: list) -> float:
+    """Latência média (µs) de uma função de busca"""
+    start = time.perf_counter()
+    for text in probes:
+        execute(text)
+    return (time.perf_counter() - start) / len(probes) * 1_000_000
+
+
+def run_benchmark(count: int, probes: int) -> dict:
+    """
+    Executa o benchmark
+
+    Args:
+        count: Textos no corpus
+        probes: Buscas de acerto e de falha medidas em cada esquema
+
+    Returns:
+        Dicionário com tamanhos de índice e latências de cada esquema
+    """
+    corpus = make_corpus(count)
+    rng = random.Random(7)
+    hits = rng.sample(corpus, min(probes, count))
+    misses = [text + " (missing)" for text in hits]
+    rows = [(text, f"Tradução {i}") for i, text in enumerate(corpus)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy = sqlite3.connect(os.path.join(tmp_dir, "legacy.db"))
+        legacy.execute(LEGACY_TABLE_SQL)
+        legacy.executemany("INSERT INTO translations (original_text, translated_text) VALUES (?, ?)",
+                           rows)
+        legacy.commit()
+        legacy_index = legacy.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'translations'"
+        ).fetchall()
+
+        def legacy_lookup(text):
+            legacy.execute("SELECT id, translated_text FROM translations WHERE original_text = ?",
+                           (text,)).fetchone()
+
+        memory = TranslationMemory(os.path.join(tmp_dir, "hashed.db"))
+        memory.add_translations_bulk(rows)
+        reader = memory._pool.get_reader()
+
+        def hashed_lookup(text):
+            reader.execute('''
+                SELECT id, translated_text FROM translations
+                WHERE source_language = ? AND target_language = ?
+                  AND original_text_hash = ? AND original_text = ?
+            ''', ('en', 'pt', text_hash(text), text)).fetchone()
+
+        def api_lookup(text):
+            memory._lookup_cache.clear()
+            memory.lookup_translation(text)
+
+        result = {
+            'legacy_index': index_bytes(legacy, [row[0] for row in legacy_index]),
+            'hashed_index': index_bytes(reader, ['idx_language_pair_hash']),
+            'legacy_hit': time_lookups(legacy_lookup, hits),
+            'legacy_miss': time_lookups(legacy_lookup, misses),
+            'hashed_hit': time_lookups(hashed_lookup, hits),
+            'hashed_miss': time_lookups(hashed_lookup, misses),
+            'api_hit': time_lookups(api_lookup, hits),
+            'api_miss': time_lookups(api_lookup, misses),
+            'avg_chars': sum(len(text) for text in corpus) / len(corpus),
+        }
+
+        legacy.close()
+        memory.close()
+
+    return result
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de chaves por hash do texto original")
+    parser.add_argument('--count', type=int, default=50000,
+                        help="Textos longos no corpus")
+    parser.add_argument('--probes', type=int, default=5000,
+                        help="Buscas medidas por cenário")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("📊 BENCHMARK - Índice sobre texto completo x hash de 64 bits")
+    print("=" * 70)
+
+    r = run_benchmark(args.count, args.probes)
+    mb = 1024 * 1024
+    print(f"Corpus: {args.count} textos (média {r['avg_chars']:.0f} caracteres)")
+    print(f"{'Esquema':<28} {'Índice':>10} {'Acerto':>10} {'Falha':>10}")
+    print(f"{'Texto UNIQUE (1.0)':<28} {r['legacy_index'] / mb:>8.1f}MB "
+          f"{r['legacy_hit']:>8.1f}µs {r['legacy_miss']:>8.1f}µs")
+    print(f"{'Hash + confirmação (SQL)':<28} {r['hashed_index'] / mb:>8.1f}MB "
+          f"{r['hashed_hit']:>8.1f}µs {r['hashed_miss']:>8.1f}µs")
+    print(f"{'lookup_translation (sem LRU)':<28} {'':>10} "
+          f"{r['api_hit']:>8.1f}µs {r['api_miss']:>8.1f}µs")
+    print("=" * 70)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
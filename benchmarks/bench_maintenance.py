@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Manutenção do Banco
+Compara o VACUUM completo com o incremental (fatias de incremental_vacuum):
+tempo total e maior espera de uma edição feita em paralelo
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from database import TranslationMemory
+
+
+def fill_and_delete(memory: TranslationMemory, rows: int):
+    """Insere linhas e apaga metade delas, deixando páginas livres espalhadas"""
+    memory.add_translations_bulk((f"Synthetic line {i} " + "x" * 200, f"Linha {i}")
+                                 for i in range(rows))
+    memory.delete_translations_by_ids(list(range(1, rows + 1, 2)))
+
+
+def measure_vacuum(memory: TranslationMemory, full: bool) -> dict:
+    """
+    Executa o vacuum enquanto outra thread grava edições
+
+    Returns:
+        Dicionário com tempo total, páginas liberadas e maior espera de escrita
+    """
+    before = memory.get_maintenance_stats()
+    done = threading.Event()
+    waits = []
+
+    def editor():
+        i = 0
+        while not done.is_set():
+            start = time.perf_counter()
+            memory.add_translation(f"Edit {i}", f"Edição {i}")
+            waits.append(time.perf_counter() - start)
+            i += 1
+            time.sleep(0.005)
+
+    thread = threading.Thread(target=editor)
+    thread.start()
+
+    start = time.perf_counter()
+    memory.vacuum(full=full)
+    elapsed = time.perf_counter() - start
+
+    done.set()
+    thread.join()
+    after = memory.get_maintenance_stats()
+
+    return {
+        'elapsed': elapsed,
+        'freed_mb': (before['file_bytes'] - after['file_bytes']) / (1024 * 1024),
+        'edits': len(waits),
+        'max_wait_ms': max(waits) * 1000 if waits else 0,
+    }
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de VACUUM completo x incremental")
+    parser.add_argument('--rows', type=int, default=200000,
+                        help="Linhas inseridas antes de apagar metade")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📊 BENCHMARK - VACUUM completo x incremental")
+    print("=" * 60)
+
+    for label, full in (("Completo", True), ("Incremental", False)):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            memory = TranslationMemory(os.path.join(tmp_dir, "bench.db"))
+            fill_and_delete(memory, args.rows)
+            memory.checkpoint('TRUNCATE')
+
+            result = measure_vacuum(memory, full)
+            memory.close()
+
+        print(f"{label:<12} | Tempo: {result['elapsed']:>6.2f}s | "
+              f"Liberado: {result['freed_mb']:>6.1f} MB | Edições: {result['edits']:>5} | "
+              f"Maior espera: {result['max_wait_ms']:>8.1f} ms")
+
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Mesclagem entre Memórias
+Cria uma memória (500 mil linhas por padrão), copia o arquivo, altera
+algumas linhas da cópia e mede a mesclagem inicial (tudo comparado) e a
+mesclagem incremental (só o delta desde a marca d'água)
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from database import TranslationMemory
+
+
+def timed_merge(memory: TranslationMemory, remote_path: str) -> dict:
+    """Executa uma mesclagem medindo tempo e linhas gravadas no banco local"""
+    changes_before = memory.conn.total_changes
+    start = time.perf_counter()
+    report = memory.merge_from(remote_path)
+    report['elapsed'] = time.perf_counter() - start
+    report['sqlite_changes'] = memory.conn.total_changes - changes_before
+    return report
+
+
+def run_benchmark(rows: int, changed: int) -> dict:
+    """
+    Executa o benchmark
+
+    Args:
+        rows: Linhas de cada memória
+        changed: Linhas alteradas na cópia entre as mesclagens
+
+    Returns:
+        Dicionário com os relatórios das duas mesclagens
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        local_path = os.path.join(tmp_dir, "local.db")
+        remote_path = os.path.join(tmp_dir, "remote.db")
+
+        memory = TranslationMemory(local_path)
+        memory.add_translations_bulk((f"Synthetic line {i}", f"Linha sintética {i}")
+                                     for i in range(rows))
+        memory.close()
+        shutil.copyfile(local_path, remote_path)
+
+        memory = TranslationMemory(local_path)
+        initial = timed_merge(memory, remote_path)
+
+        # Edições na cópia depois da primeira mesclagem (próximo segundo do relógio)
+        time.sleep(1.1)
+        remote = TranslationMemory(remote_path)
+        step = max(1, rows // changed)
+        for translation_id in range(1, rows + 1, step)[:changed]:
+            remote.update_translation(translation_id, translated_text=f"Revisada {translation_id}")
+        remote.close()
+
+        delta = timed_merge(memory, remote_path)
+        memory.close()
+
+    return {'initial': initial, 'delta': delta}
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de mesclagem entre memórias")
+    parser.add_argument('--rows', type=int, default=500000,
+                        help="Linhas de cada memória")
+    parser.add_argument('--changed', type=int, default=1000,
+                        help="Linhas alteradas entre as mesclagens")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📊 BENCHMARK - Mesclagem por marca d'água (updated_at)")
+    print("=" * 60)
+
+    result = run_benchmark(args.rows, args.changed)
+    for label, report in (("Inicial", result['initial']), ("Delta", result['delta'])):
+        print(f"{label:<8} | Tempo: {report['elapsed']:>7.2f}s | Inseridas: {report['inserted']:>7} | "
+              f"Atualizadas: {report['updated']:>6} | Iguais: {report['unchanged']:>7} | "
+              f"Conflitos: {report['conflict_count']:>5} | Escritas SQLite: {report['sqlite_changes']:>7}")
+
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Extração por Perfil
+Gera XMLs no estilo RimWorld (uma tag traduzível e um comentário por
+entrada) e compara a extração antiga (um finditer por padrão e busca linear
+em todos os trechos excluídos para cada ocorrência) com o perfil compilado
+(padrões intercalados por posição e busca binária). A extração antiga é
+quadrática e só roda até --legacy-limit ocorrências
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from file_processor import FileProcessor
+from regex_profiles import RegexProfile
+
+PROFILE = RegexProfile(
+    name="RimWorld XML",
+    capture_patterns=[
+        r'<label>([^<]+)</label>',
+        r'<description>([^<]+)</description>',
+        r'<[a-zA-Z_]+>([^<>]+)</[a-zA-Z_]+>',
+    ],
+    exclude_patterns=[
+        r'<defName>.*?</defName>',
+        r'<!--.*?-->',
+    ],
+    file_type="xml"
+)
+
+
+def make_content(matches: int) -> str:
+    """XML com o número pedido de ocorrências de captura"""
+    parts = ['<?xml version="1.0" encoding="utf-8"?>\n<Defs>\n']
+    for i in range(matches // 2):
+        parts.append(f'  <!-- <label>commented label {i}</label> -->\n'
+                     f'  <ThingDef><defName>Thing_{i}</defName>\n'
+                     f'    <label>Thing label {i}</label>\n'
+                     f'    <description>A long description for thing number {i}.</description>\n'
+                     f'  </ThingDef>\n')
+    parts.append('</Defs>\n')
+    return ''.join(parts)
+
+
+def legacy_extract(content: str, profile: RegexProfile) -> list:
+    """Extração anterior: um finditer por padrão e any() sobre os trechos excluídos"""
+    excluded_positions = set()
+    for exclude_pattern in profile.exclude_patterns:
+        for match in re.finditer(exclude_pattern, content):
+            excluded_positions.add((match.start(), match.end()))
+
+    texts = []
+    for capture_pattern in profile.capture_patterns:
+        for match in re.finditer(capture_pattern, content):
+            groups = match.groups()
+            if not groups:
+                continue
+            text = groups[-1].strip()
+            if not text or len(text) < 2:
+                continue
+            position = match.start()
+            if any(start <= position <= end for start, end in excluded_positions):
+                continue
+            texts.append(text)
+
+    return list(dict.fromkeys(texts))
+
+
+def compiled_extract(content: str, profile: RegexProfile) -> list:
+    """Extração atual do FileProcessor"""
+    processor = FileProcessor(profile)
+    processor.original_content = content
+    processor.file_type = 'xml'
+    return [entry.original_text for entry in processor.extract_texts()]
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de extração por perfil")
+    parser.add_argument('--matches', type=int, nargs='+', default=[2000, 5000, 10000, 100000],
+                        help="Ocorrências de captura por arquivo")
+    parser.add_argument('--legacy-limit', type=int, default=10000,
+                        help="Maior arquivo medido com a extração antiga")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("📊 BENCHMARK - Extração por perfil compilado")
+    print("=" * 70)
+    print(f"{'Ocorrências':>11} {'Excluídos':>10} {'Compilado':>10} {'Antigo':>10} {'Ganho':>8}")
+
+    for matches in args.matches:
+        content = make_content(matches)
+        texts, elapsed = timed(compiled_extract, content, PROFILE)
+
+        legacy_text = f"{'-':>10} {'-':>8}"
+        if matches <= args.legacy_limit:
+            legacy, legacy_elapsed = timed(legacy_extract, content, PROFILE)
+            assert set(legacy) == set(texts)
+            legacy_text = f"{legacy_elapsed:>9.3f}s {legacy_elapsed / elapsed:>7.0f}x"
+
+        print(f"{matches:>11} {matches:>10} {elapsed:>9.3f}s {legacy_text}")
+
+    print("=" * 70)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos Perfis de Desempenho
+Para cada banco em bds/*.db (trabalhando sempre em uma cópia) e cada perfil,
+mede buscas exatas, leitura completa e importação de um CSV sintético
+"""
+
+import argparse
+import csv
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from database import TranslationMemory
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def write_import_csv(path: str, rows: int):
+    """Escreve o CSV sintético usado na medição de importação"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['id', 'original', 'translation'])
+        for i in range(rows):
+            writer.writerow([i, f"Imported line {i} with some text", f"Linha importada {i}"])
+
+
+def rate(count: int, elapsed: float) -> str:
+    """Formata uma taxa por segundo (ou '-' sem amostras)"""
+    if not count or elapsed <= 0:
+        return f"{'-':>10}"
+    return f"{count / elapsed:>10.0f}"
+
+
+def measure_profile(db_file: str, profile: str, import_csv: str, passes: int) -> dict:
+    """
+    Mede um perfil em uma cópia do banco
+
+    Returns:
+        Dicionário com taxas de busca, leitura e importação
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, os.path.basename(db_file))
+        shutil.copyfile(db_file, db_path)
+
+        memory = TranslationMemory(db_path)
+        memory.set_performance_profile(profile)
+        originals = [t['original_text'] for t in memory.iter_translations()]
+
+        # Buscas exatas sem o cache LRU (cada passada vai ao banco)
+        start = time.perf_counter()
+        for _ in range(passes):
+            memory._lookup_cache.clear()
+            for text in originals:
+                memory.lookup_translation(text)
+        lookup_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scanned = 0
+        for _ in range(passes):
+            scanned += sum(1 for _ in memory.iter_translations())
+        scan_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        imported, _ = memory.import_from_file(import_csv)
+        import_elapsed = time.perf_counter() - start
+
+        page_size = memory.get_maintenance_stats().get('page_size')
+        memory.close()
+
+    return {
+        'rows': len(originals),
+        'page_size': page_size,
+        'lookups': rate(len(originals) * passes, lookup_elapsed),
+        'scan': rate(scanned, scan_elapsed),
+        'import': rate(imported, import_elapsed),
+    }
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark dos perfis de desempenho")
+    parser.add_argument('--databases', nargs='+',
+                        default=sorted(glob.glob(os.path.join(ROOT, 'bds', '*.db'))),
+                        help="Bancos a testar (padrão: bds/*.db)")
+    parser.add_argument('--import-rows', type=int, default=50000,
+                        help="Linhas do CSV sintético importado")
+    parser.add_argument('--passes', type=int, default=20,
+                        help="Passadas de busca e leitura por perfil")
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("📊 BENCHMARK - Perfis de desempenho")
+    print("=" * 78)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        import_csv = os.path.join(tmp_dir, "import.csv")
+        write_import_csv(import_csv, args.import_rows)
+
+        for db_file in args.databases:
+            print(f"{os.path.basename(db_file)}")
+            print(f"  {'Perfil':<18} {'Página':>6} {'Buscas/s':>10} {'Leitura/s':>10} {'Import/s':>10}")
+
+            for profile in TranslationMemory.PERFORMANCE_PROFILES:
+                result = measure_profile(db_file, profile, import_csv, args.passes)
+                print(f"  {profile:<18} {result['page_size']:>6} {result['lookups']} "
+                      f"{result['scan']} {result['import']}")
+
+    print("=" * 78)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
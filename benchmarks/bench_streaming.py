@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark da Extração em Fluxo
+Gera XMLs de tamanhos crescentes e mede, em um processo novo para cada
+medição, o tempo e o pico de memória (RSS) da extração em janelas e da
+gravação das traduções. O pico deve ficar constante enquanto o arquivo cresce
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from regex_profiles import RegexProfile
+from streaming_extractor import StreamingExtractor
+
+PROFILE = RegexProfile(
+    name="RimWorld XML",
+    capture_patterns=[
+        r'<label>([^<]+)</label>',
+        r'<description>([^<]+)</description>',
+    ],
+    exclude_patterns=[
+        r'<defName>.*?</defName>',
+        r'<!--.*?-->',
+    ],
+    file_type="xml",
+    max_match_span=4096
+)
+
+
+def write_xml(path: str, size_mb: int):
+    """Escreve um XML sintético com o tamanho pedido, em blocos"""
+    target = size_mb * 1024 * 1024
+    written = 0
+    i = 0
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n<Defs>\n')
+        while written < target:
+            block = ''.join(f'  <!-- item {n} -->\n'
+                            f'  <ThingDef><defName>Thing_{n}</defName>\n'
+                            f'    <label>Espada de aço {n}</label>\n'
+                            f'    <description>Uma lâmina antiga forjada nas montanhas ({n}).</description>\n'
+                            f'  </ThingDef>\n' for n in range(i, i + 1000))
+            f.write(block)
+            written += len(block.encode('utf-8'))
+            i += 1000
+        f.write('</Defs>\n')
+
+
+def worker(mode: str, path: str):
+    """Executa uma medição e imprime tempo, pico de RSS (MB) e entradas"""
+    extractor = StreamingExtractor(PROFILE)
+    start = time.perf_counter()
+    if mode == 'extract':
+        count = sum(1 for _ in extractor.iter_entries(path))
+    else:
+        translations = {f"Espada de aço {n}": f"Steel sword {n}" for n in range(0, 200000, 3)}
+        count = extractor.write_translations(path, path + ".out", translations)
+        os.remove(path + ".out")
+    elapsed = time.perf_counter() - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{elapsed:.3f} {rss:.1f} {count}")
+
+
+def measure(mode: str, path: str) -> tuple:
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', mode, path],
+                            capture_output=True, text=True, check=True).stdout.split()
+    return float(output[0]), float(output[1]), int(output[2])
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark da extração em fluxo")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[128, 512, 2048],
+                        help="Tamanhos dos XMLs em MB")
+    parser.add_argument('--worker', nargs=2, metavar=('MODO', 'ARQUIVO'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(*args.worker)
+        return 0
+
+    print("=" * 78)
+    print("📊 BENCHMARK - Extração e gravação em fluxo")
+    print("=" * 78)
+    print(f"{'MB':>6} {'Entradas':>10} {'Extração':>9} {'MB/s':>6} {'RSS':>8} "
+          f"{'Gravação':>9} {'Trocas':>7} {'RSS':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size_mb in args.sizes:
+            path = os.path.join(tmp_dir, f"dump_{size_mb}.xml")
+            write_xml(path, size_mb)
+
+            extract_elapsed, extract_rss, entries = measure('extract', path)
+            write_elapsed, write_rss, replaced = measure('write', path)
+            os.remove(path)
+
+            print(f"{size_mb:>6} {entries:>10} {extract_elapsed:>8.2f}s "
+                  f"{size_mb / extract_elapsed:>6.0f} {extract_rss:>6.1f}MB "
+                  f"{write_elapsed:>8.2f}s {replaced:>7} {write_rss:>6.1f}MB")
+
+    print("=" * 78)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
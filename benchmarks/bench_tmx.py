@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Importação e Exportação TMX
+Gera um TMX sintético (500 mil unidades por padrão), mede unidades/segundo
+da importação em streaming e da exportação, e opcionalmente o pico de
+memória Python da importação (tracemalloc)
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from database import TranslationMemory
+
+
+def write_synthetic_tmx(path: str, units: int):
+    """Escreve um TMX com variantes en-US/pt-BR sem manter nada na memória"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<tmx version="1.4">\n')
+        f.write('  <header creationtool="bench" datatype="plaintext" segtype="sentence" '
+                'adminlang="en-US" srclang="en-US" o-tmf="bench"/>\n  <body>\n')
+        for i in range(units):
+            f.write(
+                f'    <tu tuid="{i}">\n'
+                f'      <tuv xml:lang="en-US"><seg>Synthetic unit {i} &amp; its text</seg></tuv>\n'
+                f'      <tuv xml:lang="pt-BR"><seg>Unidade sintética {i} e seu texto</seg></tuv>\n'
+                f'    </tu>\n'
+            )
+        f.write('  </body>\n</tmx>\n')
+
+
+def run_benchmark(units: int, trace_memory: bool) -> dict:
+    """
+    Executa o benchmark
+
+    Args:
+        units: Quantidade de unidades <tu> no TMX sintético
+        trace_memory: Se True, repete a importação medindo o pico de memória
+
+    Returns:
+        Dicionário com os resultados
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source = os.path.join(tmp_dir, "synthetic.tmx")
+        write_synthetic_tmx(source, units)
+
+        memory = TranslationMemory(os.path.join(tmp_dir, "bench.db"))
+
+        start = time.perf_counter()
+        imported, errors = memory.import_from_tmx(source)
+        import_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        memory.export_to_file(os.path.join(tmp_dir, "export.tmx"))
+        export_elapsed = time.perf_counter() - start
+
+        peak = None
+        if trace_memory:
+            memory.clear_all()
+            tracemalloc.start()
+            memory.import_from_tmx(source)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        memory.close()
+        file_mb = os.path.getsize(source) / (1024 * 1024)
+
+    return {
+        'units': units,
+        'imported': imported,
+        'errors': errors,
+        'file_mb': file_mb,
+        'import_per_sec': units / import_elapsed if import_elapsed > 0 else 0,
+        'export_per_sec': imported / export_elapsed if export_elapsed > 0 else 0,
+        'peak_mb': peak / (1024 * 1024) if peak is not None else None,
+    }
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de importação/exportação TMX")
+    parser.add_argument('--units', type=int, nargs='+', default=[500000],
+                        help="Quantidades de unidades <tu> a testar")
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="Mede também o pico de memória Python da importação")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("📊 BENCHMARK - TMX (iterparse + bulk upsert)")
+    print("=" * 60)
+
+    for units in args.units:
+        result = run_benchmark(units, args.trace_memory)
+        peak = ""
+        if result['peak_mb'] is not None:
+            peak = f" | Pico Python: {result['peak_mb']:.1f} MB"
+        print(f"Unidades: {result['units']} ({result['file_mb']:.1f} MB) | "
+              f"Importadas: {result['imported']} | Erros: {result['errors']}")
+        print(f"  Importação: {result['import_per_sec']:>10.0f} unidades/s | "
+              f"Exportação: {result['export_per_sec']:>10.0f} unidades/s{peak}")
+
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Extração de XML: regex x parser
+Gera XMLs no estilo RimWorld e compara, com o perfil RimWorld, a extração
+com uma passada de regex por padrão, o perfil compilado (padrões intercalados)
+e os seletores pelo parser expat, em memória e em fluxo a partir do arquivo
+(com o pico de memória alocada medido pelo tracemalloc)
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from file_processor import FileProcessor
+from interval_index import IntervalIndex
+from regex_profiles import RegexProfile
+from streaming_extractor import StreamingExtractor
+
+CAPTURE_PATTERNS = [
+    r'<label>([^<]+)</label>',
+    r'<description>([^<]+)</description>',
+    r'<[a-zA-Z_]+>([^<>]+)</[a-zA-Z_]+>',
+]
+EXCLUDE_PATTERNS = [
+    r'<defName>.*?</defName>',
+    r'<!--.*?-->',
+]
+
+REGEX_PROFILE = RegexProfile("RimWorld (regex)", capture_patterns=CAPTURE_PATTERNS,
+                             exclude_patterns=EXCLUDE_PATTERNS, file_type="xml")
+SELECTOR_PROFILE = RegexProfile("RimWorld (seletores)", capture_patterns=CAPTURE_PATTERNS,
+                                exclude_patterns=EXCLUDE_PATTERNS, file_type="xml",
+                                selectors=['//*'])
+
+
+def make_content(things: int) -> str:
+    """XML com uma definição (rótulo, descrição, valor e comentário) por item"""
+    parts = ['<?xml version="1.0" encoding="utf-8"?>\n<Defs>\n']
+    for i in range(things):
+        parts.append(f'  <!-- <label>commented label {i}</label> -->\n'
+                     f'  <ThingDef ParentName="BaseWeapon"><defName>Thing_{i}</defName>\n'
+                     f'    <label>Thing label {i}</label>\n'
+                     f'    <description>A long description for thing number {i} &amp; more.</description>\n'
+                     f'    <statBases><MarketValue>{i % 500}</MarketValue></statBases>\n'
+                     f'  </ThingDef>\n')
+    parts.append('</Defs>\n')
+    return ''.join(parts)
+
+
+def multipass_extract(content: str) -> list:
+    """Uma passada completa por padrão (exclusões consultadas no IntervalIndex)"""
+    excluded = IntervalIndex.from_matches([re.compile(p, re.DOTALL) for p in EXCLUDE_PATTERNS],
+                                          content)
+    found = []
+    for pattern in CAPTURE_PATTERNS:
+        for match in re.finditer(pattern, content):
+            text = match.group(match.re.groups).strip()
+            if len(text) < 2 or excluded.overlaps(match.start(1), match.end(1)):
+                continue
+            found.append((match.start(1), text))
+    found.sort()
+    return list(dict.fromkeys(text for _, text in found))
+
+
+def processor_extract(content: str, profile: RegexProfile) -> list:
+    """Extração do FileProcessor com o perfil dado"""
+    processor = FileProcessor(profile)
+    processor.original_content = content
+    processor.file_type = 'xml'
+    return [entry.original_text for entry in processor.extract_texts()]
+
+
+def streaming_extract(path: str) -> int:
+    """Extração em fluxo pelos seletores, a partir do arquivo"""
+    return sum(1 for _ in StreamingExtractor(SELECTOR_PROFILE).iter_entries(path, 'utf-8'))
+
+
+def traced_peak(function, *args) -> int:
+    """Pico de memória alocada (bytes) durante a função, medido à parte
+    porque o tracemalloc deixa a execução bem mais lenta"""
+    tracemalloc.start()
+    function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Função principal do benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark de extração de XML")
+    parser.add_argument('--things', type=int, nargs='+', default=[10000, 100000, 300000],
+                        help="Definições por arquivo")
+    args = parser.parse_args()
+
+    print("=" * 86)
+    print("📊 BENCHMARK - Extração de XML: regex x parser expat")
+    print("=" * 86)
+    print(f"{'Itens':>7} {'MB':>6} | {'Passadas':>9} {'Compilado':>10} {'Parser':>9} | "
+          f"{'Fluxo':>8} {'Pico':>9} {'Entradas':>9}")
+
+    mb = 1024 * 1024
+    for things in args.things:
+        content = make_content(things)
+
+        multipass, multipass_elapsed = timed(multipass_extract, content)
+        compiled, compiled_elapsed = timed(processor_extract, content, REGEX_PROFILE)
+        parsed, parsed_elapsed = timed(processor_extract, content, SELECTOR_PROFILE)
+        assert parsed == multipass
+        assert set(compiled) == set(parsed)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'Defs.xml')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            streamed, streaming_elapsed = timed(streaming_extract, path)
+            peak = traced_peak(streaming_extract, path)
+
+        print(f"{things:>7} {len(content) / mb:>6.1f} | {multipass_elapsed:>8.2f}s "
+              f"{compiled_elapsed:>9.2f}s {parsed_elapsed:>8.2f}s | {streaming_elapsed:>7.2f}s "
+              f"{peak / mb:>7.1f}MB {streamed:>9}")
+
+    print("=" * 86)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,8 @@ Permite traduzir múltiplos arquivos de um diretório de uma vez
 """
 
 import os
-from typing import List, Dict, Tuple, Optional, Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Tuple, Optional, Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +14,26 @@ from file_processor import FileProcessor, TranslationEntry
 from regex_profiles import RegexProfileManager, RegexProfile
 
 
+def _extract_file(filepath: str, profile_data: Optional[dict]) -> Tuple[Optional[List[TranslationEntry]], str]:
+    """
+    Carrega e extrai um arquivo (executada nos processos de trabalho).
+
+    O perfil chega como dicionário (RegexProfile.to_dict), que é serializável;
+    cada processo compila os padrões uma vez e reaproveita nos arquivos seguintes.
+
+    Returns:
+        Tupla (entradas, mensagem de erro); entradas é None em caso de erro
+    """
+    try:
+        profile = RegexProfile.from_dict(profile_data) if profile_data else None
+        processor = FileProcessor(profile)
+        if not processor.load_file(filepath):
+            return None, 'Falha ao carregar arquivo'
+        return processor.extract_texts(), ''
+    except Exception as e:
+        return None, str(e)
+
+
 @dataclass
 class BatchFileInfo:
     """Informações sobre um arquivo no lote"""
@@ -50,15 +71,24 @@ class BatchProcessor:
     """
     
     SUPPORTED_EXTENSIONS = ['.json', '.xml']
+
+    # Sem max_workers: no máximo este número de processos, e só em lotes com
+    # pelo menos PARALLEL_MIN_FILES arquivos (iniciar os processos custa mais
+    # que extrair poucos arquivos)
+    DEFAULT_MAX_WORKERS = 4
+    PARALLEL_MIN_FILES = 64
     
-    def __init__(self, profile_manager: RegexProfileManager = None):
+    def __init__(self, profile_manager: RegexProfileManager = None, max_workers: int = None):
         """
         Inicializa o processador em lote.
         
         Args:
             profile_manager: Gerenciador de perfis regex
+            max_workers: Processos usados na extração (None = um por núcleo
+                até DEFAULT_MAX_WORKERS, 1 = extrai no próprio processo)
         """
         self.profile_manager = profile_manager or RegexProfileManager()
+        self.max_workers = max_workers
         self.files: List[BatchFileInfo] = []
         self.all_entries: List[Tuple[BatchFileInfo, TranslationEntry]] = []
         self._progress_callback: Optional[Callable[[int, int, str], None]] = None
@@ -179,54 +209,110 @@ class BatchProcessor:
         self.files = []
         self.all_entries = []
     
-    def extract_all_texts(self, profile_name: str = None) -> List[Tuple[BatchFileInfo, TranslationEntry]]:
+    def extract_all_texts(self, profile_name: str = None,
+                          max_workers: int = None) -> List[Tuple[BatchFileInfo, TranslationEntry]]:
         """
         Extrai textos de todos os arquivos do lote.
         
         Args:
             profile_name: Nome do perfil regex a usar (None = auto-detectar)
+            max_workers: Processos usados (None = valor do processador)
             
         Returns:
-            Lista de tuplas (arquivo, entrada) com todos os textos
+            Lista de tuplas (arquivo, entrada) com todos os textos, na ordem
+            dos arquivos do lote
+        """
+        for _ in self.iter_extracted(profile_name, max_workers):
+            pass
+
+        self.all_entries = [(file_info, entry)
+                            for file_info in self.files
+                            for entry in file_info.entries]
+        return self.all_entries
+
+    def iter_extracted(self, profile_name: str = None,
+                       max_workers: int = None) -> Iterator[Tuple[BatchFileInfo, List[TranslationEntry]]]:
+        """
+        Extrai os arquivos do lote em paralelo, entregando cada um ao terminar.
+
+        A extração por regex usa só CPU, então os arquivos são distribuídos
+        entre processos (ProcessPoolExecutor); os perfis vão como dicionário.
+        O progresso é reportado a cada arquivo concluído, no processo atual.
+
+        Args:
+            profile_name: Nome do perfil regex a usar (None = auto-detectar)
+            max_workers: Processos usados (None = valor do processador)
+
+        Yields:
+            Tuplas (arquivo, entradas) na ordem em que terminam; arquivos com
+            erro saem com status 'error' e nenhuma entrada
         """
-        self.all_entries = []
         total = len(self.files)
-        
-        for i, file_info in enumerate(self.files):
-            self._report_progress(i + 1, total, f"Extraindo: {file_info.filename}")
-            
-            try:
-                # Determina perfil
-                if profile_name:
-                    profile = self.profile_manager.get_profile(profile_name)
-                else:
-                    # Auto-detecta baseado no tipo de arquivo
-                    profile = self._auto_detect_profile(file_info)
-                
-                # Cria processador
-                processor = FileProcessor(profile)
-                
-                # Carrega arquivo
-                if not processor.load_file(file_info.filepath):
-                    file_info.status = 'error'
-                    file_info.error_message = 'Falha ao carregar arquivo'
-                    continue
-                
-                # Extrai textos
-                entries = processor.extract_texts()
+        workers = max_workers or self.max_workers
+        if workers is None:
+            workers = 1
+            if total >= self.PARALLEL_MIN_FILES:
+                workers = min(self.DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+        workers = min(workers, total)
+
+        jobs = []
+        for file_info in self.files:
+            file_info.entries = []
+            file_info.entries_count = 0
+            file_info.status = 'processing'
+            file_info.error_message = ''
+
+            # Determina perfil
+            if profile_name:
+                profile = self.profile_manager.get_profile(profile_name)
+            else:
+                # Auto-detecta baseado no tipo de arquivo
+                profile = self._auto_detect_profile(file_info)
+            jobs.append((file_info, profile.to_dict() if profile else None))
+
+        if workers <= 1:
+            results = ((file_info, _extract_file(file_info.filepath, profile_data))
+                       for file_info, profile_data in jobs)
+            yield from self._collect_results(results, total)
+            return
+
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        except (OSError, NotImplementedError, ValueError) as e:
+            print(f"Extração paralela indisponível, usando um processo: {e}")
+            yield from self.iter_extracted(profile_name, max_workers=1)
+            return
+
+        with executor:
+            futures = {executor.submit(_extract_file, file_info.filepath, profile_data): file_info
+                       for file_info, profile_data in jobs}
+            results = ((futures[future], self._future_result(future))
+                       for future in as_completed(futures))
+            yield from self._collect_results(results, total)
+
+    @staticmethod
+    def _future_result(future) -> Tuple[Optional[List[TranslationEntry]], str]:
+        """Resultado de um arquivo extraído em outro processo"""
+        try:
+            return future.result()
+        except Exception as e:
+            # Processo de trabalho encerrado ou resultado não serializável
+            return None, str(e)
+
+    def _collect_results(self, results, total: int) -> Iterator[Tuple[BatchFileInfo, List[TranslationEntry]]]:
+        """Registra os resultados nos arquivos e reporta o progresso"""
+        for done, (file_info, (entries, error)) in enumerate(results, 1):
+            if entries is None:
+                file_info.status = 'error'
+                file_info.error_message = error
+                entries = []
+            else:
                 file_info.entries = entries
                 file_info.entries_count = len(entries)
                 file_info.status = 'extracted'
-                
-                # Adiciona à lista consolidada
-                for entry in entries:
-                    self.all_entries.append((file_info, entry))
-                
-            except Exception as e:
-                file_info.status = 'error'
-                file_info.error_message = str(e)
-        
-        return self.all_entries
+
+            self._report_progress(done, total, f"Extraído: {file_info.filename}")
+            yield file_info, entries
     
     def _auto_detect_profile(self, file_info: BatchFileInfo) -> Optional[RegexProfile]:
         """Auto-detecta o perfil baseado no tipo de arquivo"""
@@ -330,9 +416,7 @@ class BatchProcessor:
                 processor = FileProcessor(profile)
                 
                 if processor.load_file(file_info.filepath):
-                    content = processor.apply_translations(translations)
-                    
-                    if processor.save_file(output_path, content, create_backup):
+                    if processor.save_translations(output_path, translations, create_backup):
                         file_info.status = 'completed'
                         result.processed_files += 1
                     else:
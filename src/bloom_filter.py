@@ -0,0 +1,138 @@
+"""
+Módulo de Filtro de Bloom
+Responde "com certeza não existe" sem consultar o banco
+
+- Chaves são os hashes de 64 bits já gravados em original_text_hash,
+  então o filtro é construído lendo só uma coluna inteira do índice
+- k posições derivadas por hashing duplo das duas metades do hash
+- Serializável em bytes para ser persistido na tabela metadata
+"""
+
+import math
+import struct
+from typing import Iterable, Optional
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom sobre inteiros de 64 bits.
+
+    Não há falsos negativos: se `might_contain` retorna False, a chave nunca
+    foi adicionada. Falsos positivos acontecem com a taxa configurada
+    enquanto o número de chaves não passar da capacidade.
+
+    Não é thread-safe: add/update fazem leitura-modificação-escrita nos
+    bytes do vetor, então escritas concorrentes precisam de um lock externo
+    (TranslationMemory usa o próprio lock do escritor). Consultas podem
+    rodar em paralelo com uma escrita.
+    """
+
+    # Cabeçalho da serialização: versão, bits, funções de hash, capacidade, chaves
+    _HEADER = struct.Struct('<BQBQQ')
+    _FORMAT_VERSION = 1
+
+    _MASK_64 = 0xFFFFFFFFFFFFFFFF
+    _MASK_32 = 0xFFFFFFFF
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        """
+        Cria um filtro vazio dimensionado para a capacidade informada.
+
+        Args:
+            capacity: Número de chaves esperado
+            false_positive_rate: Taxa de falsos positivos desejada (0-1)
+        """
+        capacity = max(1, capacity)
+        num_bits = int(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+
+        self.capacity = capacity
+        self.num_bits = max(8, num_bits)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: int):
+        """Posições dos bits de uma chave (hashing duplo)"""
+        key &= self._MASK_64
+        h1 = key & self._MASK_32
+        h2 = (key >> 32) | 1  # ímpar: percorre posições distintas
+        num_bits = self.num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: int):
+        """Adiciona uma chave ao filtro"""
+        bits = self._bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, keys: Iterable[int]):
+        """Adiciona várias chaves ao filtro"""
+        bits = self._bits
+        num_bits = self.num_bits
+        hash_range = range(self.num_hashes)
+        added = 0
+
+        for key in keys:
+            key &= self._MASK_64
+            h1 = key & self._MASK_32
+            h2 = (key >> 32) | 1
+            for i in hash_range:
+                position = (h1 + i * h2) % num_bits
+                bits[position >> 3] |= 1 << (position & 7)
+            added += 1
+
+        self.count += added
+
+    def might_contain(self, key: int) -> bool:
+        """
+        Verifica se a chave pode estar no filtro.
+
+        Returns:
+            False se a chave com certeza não foi adicionada
+        """
+        bits = self._bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def is_saturated(self) -> bool:
+        """True quando há mais chaves que a capacidade (taxa de erro acima da configurada)"""
+        return self.count > self.capacity
+
+    @property
+    def size_bytes(self) -> int:
+        """Tamanho do vetor de bits em bytes"""
+        return len(self._bits)
+
+    def to_bytes(self) -> bytes:
+        """Serializa o filtro (cabeçalho + vetor de bits)"""
+        header = self._HEADER.pack(self._FORMAT_VERSION, self.num_bits, self.num_hashes,
+                                   self.capacity, self.count)
+        return header + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Optional['BloomFilter']:
+        """
+        Restaura um filtro serializado por to_bytes.
+
+        Returns:
+            BloomFilter ou None se os dados forem inválidos
+        """
+        try:
+            version, num_bits, num_hashes, capacity, count = cls._HEADER.unpack_from(data)
+        except (struct.error, TypeError):
+            return None
+
+        bits = data[cls._HEADER.size:]
+        if version != cls._FORMAT_VERSION or len(bits) != (num_bits + 7) // 8 or num_hashes < 1:
+            return None
+
+        bloom = cls.__new__(cls)
+        bloom.capacity = capacity
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.count = count
+        bloom._bits = bytearray(bits)
+        return bloom
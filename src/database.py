@@ -6,24 +6,369 @@ Melhorias implementadas:
 - Context managers para evitar vazamento de conexão
 - Batch insert otimizado para grandes volumes
 - Thread-safety com locks
+- Pool de conexões: um escritor e leitores somente leitura por thread (WAL)
+- Buscas sem efeitos colaterais: contadores de uso acumulados em memória
+  e gravados em lote (timer, salvamento de arquivo ou encerramento)
+- Importação em massa com executemany, commits periódicos e progresso
+- Chave composta (idioma de origem, idioma de destino, hash do texto):
+  um mesmo banco atende vários pares de idiomas
+- Índice de texto completo FTS5 (trigram) sincronizado por triggers
+- Exportação em streaming (CSV, TSV, JSON Lines) com compressão opcional
+- Importação e exportação TMX 1.4 em streaming
+- Cache LRU de buscas exatas (inclusive misses) com invalidação exata
+- Filtro de Bloom dos textos originais: misses certos não consultam o SQLite
 - Tratamento robusto de erros
 """
 
 import sqlite3
 import os
+import io
+import csv
+import gzip
+import json
+import hashlib
 import threading
-from typing import Optional, List, Tuple, Dict, Generator
+import time
+import uuid
+from collections import Counter, defaultdict
+from itertools import groupby, islice
+from pathlib import Path
+from typing import Optional, List, Tuple, Dict, Generator, Iterable, Callable, BinaryIO
 from datetime import datetime
-from contextlib import contextmanager
+from contextlib import contextmanager, closing
+
+from bloom_filter import BloomFilter
+from memory_cache import LookupCache
+from tmx_handler import iter_tmx_pairs, write_tmx
+from write_behind import WriteBehindQueue
+
+# zstandard é opcional: sem ele, só a compressão gzip fica disponível
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+# Versão atual do esquema (gravada em metadata.version)
+SCHEMA_VERSION = '2.0'
+
+# Par de idiomas padrão da memória
+DEFAULT_SOURCE_LANGUAGE = 'en'
+DEFAULT_TARGET_LANGUAGE = 'pt'
+
+
+def text_hash(text: str) -> int:
+    """
+    Calcula o hash de 64 bits (blake2b) usado como chave do texto original.
+
+    O valor é um inteiro com sinal para caber em uma coluna INTEGER do SQLite.
+
+    Args:
+        text: Texto original
+
+    Returns:
+        Hash do texto como inteiro de 64 bits com sinal
+    """
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def _parse_version(version: Optional[str]) -> Tuple[int, ...]:
+    """Converte uma versão '1.1' em tupla comparável (1, 1)"""
+    try:
+        return tuple(int(part) for part in str(version).split('.'))
+    except (TypeError, ValueError):
+        return (0,)
+
+
+class ConnectionPool:
+    """
+    Pool de conexões SQLite para um único arquivo de banco.
+
+    Mantém uma conexão de escrita compartilhada (protegida pelo lock da
+    TranslationMemory) e uma conexão somente leitura por thread. Com o
+    journal em modo WAL, os leitores enxergam o último commit sem esperar
+    transações longas do escritor (ex: importação em lote).
+    """
+
+    # Tempo máximo (segundos) que uma conexão espera por um lock do SQLite
+    BUSY_TIMEOUT_SEC = 10.0
+
+    def __init__(self, db_path: str):
+        """
+        Abre a conexão de escrita do pool
+
+        Args:
+            db_path: Caminho para o arquivo .db
+        """
+        self.db_path = db_path
+        self._readers: Dict[int, Tuple[threading.Thread, sqlite3.Connection, int]] = {}
+        self._readers_lock = threading.Lock()
+
+        # PRAGMAs e bancos anexados (alias, caminho) das conexões de leitura;
+        # a geração muda a cada reconfiguração
+        self._reader_pragmas: List[str] = ["PRAGMA cache_size=10000"]
+        self._reader_attachments: List[Tuple[str, str]] = []
+        self._reader_generation = 0
+
+        self.writer = sqlite3.connect(db_path, timeout=self.BUSY_TIMEOUT_SEC,
+                                      check_same_thread=False)
+        self.writer.row_factory = sqlite3.Row
+        # Disponível em SQL para migrações (ex: preencher original_text_hash)
+        self.writer.create_function('text_hash', 1, text_hash, deterministic=True)
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Abre uma nova conexão somente leitura para o mesmo arquivo"""
+        uri = Path(os.path.abspath(self.db_path)).as_uri() + '?mode=ro'
+        conn = sqlite3.connect(uri, uri=True, timeout=self.BUSY_TIMEOUT_SEC,
+                               check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def configure_readers(self, pragmas: List[str]):
+        """
+        Define os PRAGMAs das conexões de leitura.
+
+        Conexões já abertas são reconfiguradas na próxima vez que a thread
+        dona chamar get_reader(), nunca a partir de outra thread.
+
+        Args:
+            pragmas: Comandos PRAGMA a executar em cada leitor
+        """
+        with self._readers_lock:
+            self._reader_pragmas = list(pragmas)
+            self._reader_generation += 1
+
+    def set_attachments(self, attachments: List[Tuple[str, str]]):
+        """
+        Define os bancos anexados (ATTACH) às conexões de leitura.
+
+        Como em configure_readers, cada leitor é sincronizado pela própria
+        thread na próxima chamada de get_reader().
+
+        Args:
+            attachments: Lista de tuplas (alias, caminho) abertas somente leitura
+        """
+        with self._readers_lock:
+            self._reader_attachments = list(attachments)
+            self._reader_generation += 1
+
+    def _sync_attachments(self, conn: sqlite3.Connection):
+        """Anexa/desanexa bancos de uma conexão de leitura conforme a lista atual"""
+        attached = {row[1] for row in conn.execute('PRAGMA database_list')} - {'main', 'temp'}
+        wanted = dict(self._reader_attachments)
+
+        for alias in attached - wanted.keys():
+            conn.execute(f'DETACH DATABASE {alias}')
+
+        for alias, path in self._reader_attachments:
+            if alias not in attached:
+                uri = Path(os.path.abspath(path)).as_uri() + '?mode=ro'
+                conn.execute(f'ATTACH DATABASE ? AS {alias}', (uri,))
+
+    def get_reader(self) -> sqlite3.Connection:
+        """
+        Retorna a conexão de leitura da thread atual (criando se necessário).
+
+        Conexões de threads que já terminaram são fechadas aqui, para que
+        workers temporários (QThread) não acumulem conexões abertas.
+
+        Returns:
+            Conexão SQLite somente leitura exclusiva da thread atual
+        """
+        current = threading.current_thread()
+
+        with self._readers_lock:
+            entry = self._readers.get(current.ident)
+            if entry is not None and entry[0] is current:
+                conn = entry[1]
+                if entry[2] == self._reader_generation:
+                    return conn
+            else:
+                self._prune_dead_readers()
+                conn = self._open_reader()
+
+            for pragma in self._reader_pragmas:
+                conn.execute(pragma)
+            self._sync_attachments(conn)
+            self._readers[current.ident] = (current, conn, self._reader_generation)
+            return conn
+
+    def _prune_dead_readers(self):
+        """Fecha conexões de leitura cujas threads não existem mais"""
+        for ident, (thread, conn, _) in list(self._readers.items()):
+            if not thread.is_alive():
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+                del self._readers[ident]
+
+    def reader_count(self) -> int:
+        """Retorna quantas conexões de leitura estão abertas"""
+        with self._readers_lock:
+            return len(self._readers)
+
+    def close(self):
+        """Fecha todas as conexões de leitura e a conexão de escrita"""
+        with self._readers_lock:
+            for _, conn, _ in self._readers.values():
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._readers.clear()
+
+        try:
+            self.writer.close()
+        except Exception:
+            pass
 
 
 class TranslationMemory:
     """
     Gerencia a memória de tradução persistente em arquivo local.
 
-    Thread-safe e otimizado para operações em lote.
+    Thread-safe e otimizado para operações em lote. Escritas passam pela
+    conexão única do escritor (serializadas pelo lock); leituras usam uma
+    conexão somente leitura por thread e rodam em paralelo às escritas.
     """
 
+    # Intervalo (segundos) entre gravações automáticas dos contadores de uso
+    USAGE_FLUSH_INTERVAL_SEC = 60
+
+    # Importação em massa: linhas por executemany e linhas por commit
+    BULK_CHUNK_SIZE = 1000
+    BULK_COMMIT_EVERY = 10000
+    # Linhas a partir das quais a indexação FTS5 por trigger é suspensa em
+    # importações e mesclagens; lotes menores (ex.: fila de escrita) mantêm os
+    # triggers, já que recriá-los custaria mais do que indexar linha a linha
+    FTS_SUSPEND_MIN_ROWS = 5000
+
+    # Triggers que sincronizam o índice FTS5 com a tabela de traduções
+    _FTS_INSERT_TRIGGER_SQL = '''
+        CREATE TRIGGER IF NOT EXISTS translations_fts_ai AFTER INSERT ON translations BEGIN
+            INSERT INTO translations_fts(rowid, original_text, translated_text)
+            VALUES (new.id, new.original_text, new.translated_text);
+        END
+    '''
+    _FTS_DELETE_TRIGGER_SQL = '''
+        CREATE TRIGGER IF NOT EXISTS translations_fts_ad AFTER DELETE ON translations BEGIN
+            INSERT INTO translations_fts(translations_fts, rowid, original_text, translated_text)
+            VALUES ('delete', old.id, old.original_text, old.translated_text);
+        END
+    '''
+    _FTS_UPDATE_TRIGGER_SQL = '''
+        CREATE TRIGGER IF NOT EXISTS translations_fts_au
+        AFTER UPDATE OF original_text, translated_text ON translations {when} BEGIN
+            INSERT INTO translations_fts(translations_fts, rowid, original_text, translated_text)
+            VALUES ('delete', old.id, old.original_text, old.translated_text);
+            INSERT INTO translations_fts(rowid, original_text, translated_text)
+            VALUES (new.id, new.original_text, new.translated_text);
+        END
+    '''
+
+    # Cache de buscas exatas: limite de entradas e de bytes estimados
+    LOOKUP_CACHE_MAX_ENTRIES = 50000
+    LOOKUP_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+    # Filtro de Bloom dos hashes dos textos originais (persistido em metadata)
+    BLOOM_FALSE_POSITIVE_RATE = 0.01
+    BLOOM_MIN_CAPACITY = 100000
+    BLOOM_PERSIST = True
+
+    # Memórias anexadas (ATTACH) consultadas depois do banco principal;
+    # o SQLite aceita 10 bancos anexados por conexão
+    MAX_ATTACHED_MEMORIES = 9
+
+    # Mesclagem entre memórias: políticas de conflito e conflitos detalhados no relatório
+    MERGE_POLICIES = ('last-writer-wins', 'keep-local', 'keep-remote')
+    MERGE_MAX_CONFLICT_DETAILS = 1000
+
+    # Edições manuais: gravadas em segundo plano a cada intervalo ou N itens
+    WRITE_BEHIND_INTERVAL_MS = 250
+    WRITE_BEHIND_MAX_PENDING = 500
+
+    # Perfis de desempenho (o nome ativo fica em metadata['performance_profile']).
+    # synchronous=OFF não mediu ganho nas importações com WAL, então todos
+    # mantêm NORMAL; page_size só muda com set_performance_profile (reconstrói)
+    PERFORMANCE_PROFILES = {
+        # Edição na interface: buscas exatas e paginação do visualizador
+        'interactive': {
+            'synchronous': 'NORMAL', 'cache_kib': 16 * 1024,
+            'mmap_size': 64 * 1024 * 1024, 'temp_store': 'MEMORY', 'page_size': 4096,
+        },
+        # Importações: cache grande para as páginas de índice e do FTS
+        'bulk-import': {
+            'synchronous': 'NORMAL', 'cache_kib': 64 * 1024,
+            'mmap_size': 256 * 1024 * 1024, 'temp_store': 'MEMORY', 'page_size': 4096,
+        },
+        # Memórias grandes só consultadas: arquivo mapeado e páginas maiores
+        'read-only-archive': {
+            'synchronous': 'NORMAL', 'cache_kib': 8 * 1024,
+            'mmap_size': 1024 * 1024 * 1024, 'temp_store': 'MEMORY', 'page_size': 8192,
+        },
+    }
+    DEFAULT_PERFORMANCE_PROFILE = 'interactive'
+
+    # Manutenção em segundo plano: só roda com o banco ocioso, em passos curtos
+    MAINTENANCE_INTERVAL_SEC = 30
+    MAINTENANCE_IDLE_SEC = 5
+    VACUUM_SLICE_PAGES = 256
+    VACUUM_MIN_FREE_PAGES = 64
+    WAL_TRUNCATE_BYTES = 64 * 1024 * 1024
+    OPTIMIZE_INTERVAL_SEC = 3600
+    ANALYSIS_LIMIT = 1000
+    CHECKPOINT_MODES = ('PASSIVE', 'FULL', 'RESTART', 'TRUNCATE')
+
+    # Exportação: linhas lidas por fetchmany (e intervalo entre progressos)
+    EXPORT_FETCH_SIZE = 5000
+    EXPORT_FORMATS = ('csv', 'tsv', 'jsonl', 'tmx')
+
+    # Upsert de uma tradução editada (add_translation e fila de escrita)
+    _UPSERT_SQL = '''
+        INSERT INTO translations
+        (original_text, original_text_hash, translated_text,
+         source_language, target_language, category, notes)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(source_language, target_language, original_text_hash) DO UPDATE SET
+            translated_text = excluded.translated_text,
+            updated_at = CURRENT_TIMESTAMP,
+            usage_count = usage_count + 1,
+            category = excluded.category,
+            notes = excluded.notes
+    '''
+
+    # Upsert usado pelas inserções em lote
+    _BULK_UPSERT_SQL = '''
+        INSERT INTO translations
+        (original_text, original_text_hash, translated_text,
+         source_language, target_language, category)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(source_language, target_language, original_text_hash) DO UPDATE SET
+            translated_text = excluded.translated_text,
+            updated_at = CURRENT_TIMESTAMP,
+            usage_count = usage_count + 1
+    '''
+
+    # Definição da tabela principal (esquema 2.0)
+    _TRANSLATIONS_TABLE_SQL = '''
+        CREATE TABLE IF NOT EXISTS {table} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            original_text TEXT NOT NULL,
+            original_text_hash INTEGER NOT NULL,
+            translated_text TEXT NOT NULL,
+            source_language TEXT NOT NULL DEFAULT 'en',
+            target_language TEXT NOT NULL DEFAULT 'pt',
+            category TEXT DEFAULT 'general',
+            notes TEXT DEFAULT '',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            usage_count INTEGER DEFAULT 1
+        )
+    '''
+
     def __init__(self, db_path: str = None):
         """
         Inicializa a conexão com o banco de dados
@@ -35,8 +380,47 @@ class TranslationMemory:
         self.db_path = db_path
         self.conn: Optional[sqlite3.Connection] = None
         self.cursor: Optional[sqlite3.Cursor] = None
+        self._pool: Optional[ConnectionPool] = None
         self._lock = threading.RLock()
 
+        # Par de idiomas usado quando os métodos não recebem idiomas explícitos
+        self.source_language = DEFAULT_SOURCE_LANGUAGE
+        self.target_language = DEFAULT_TARGET_LANGUAGE
+
+        # Tokenizer do índice FTS5 ('trigram', 'unicode61' ou None se indisponível)
+        self._fts_tokenizer: Optional[str] = None
+
+        # Cache de buscas exatas {(origem, destino, texto): (id, tradução) ou None}
+        self._lookup_cache = LookupCache(self.LOOKUP_CACHE_MAX_ENTRIES,
+                                         self.LOOKUP_CACHE_MAX_BYTES)
+
+        # Filtro de Bloom de original_text_hash (None = desativado/indisponível)
+        self._bloom: Optional[BloomFilter] = None
+        self._bloom_dirty = False
+        self._bloom_skips = 0
+
+        # Contadores de uso pendentes {id: incremento}, gravados por flush_usage_counts()
+        self._pending_usage: Counter = Counter()
+        self._usage_lock = threading.Lock()
+        self._usage_timer: Optional[threading.Timer] = None
+
+        # Memórias anexadas em ordem de prioridade: {'alias', 'path', 'bloom'}
+        self._attached: List[Dict] = []
+        self._attach_sequence = 0
+
+        # Perfil de desempenho persistido e o aplicado no momento no escritor
+        self._performance_profile = self.DEFAULT_PERFORMANCE_PROFILE
+        self._applied_profile: Optional[str] = None
+
+        # Manutenção: última atividade no banco e último PRAGMA optimize (monotonic)
+        self._last_activity = time.monotonic()
+        self._last_optimize = 0.0
+        self._maintenance_timer: Optional[threading.Timer] = None
+
+        # Fila de escrita das edições manuais (criada no primeiro queue_translation)
+        self._write_queue: Optional[WriteBehindQueue] = None
+        self._write_queue_lock = threading.Lock()
+
         if db_path:
             self.connect(db_path)
 
@@ -55,12 +439,14 @@ class TranslationMemory:
             if not self.is_connected():
                 raise ConnectionError("Banco de dados não conectado")
 
+            self._last_activity = time.monotonic()
             try:
                 yield self.cursor
                 self.conn.commit()
-            except sqlite3.Error as e:
+            except Exception:
+                # Qualquer erro (inclusive do código chamador) desfaz a transação
                 self.conn.rollback()
-                raise e
+                raise
 
     @contextmanager
     def _transaction(self) -> Generator[sqlite3.Cursor, None, None]:
@@ -76,13 +462,38 @@ class TranslationMemory:
             if not self.is_connected():
                 raise ConnectionError("Banco de dados não conectado")
 
+            self._last_activity = time.monotonic()
             try:
                 self.cursor.execute("BEGIN TRANSACTION")
                 yield self.cursor
                 self.conn.commit()
-            except sqlite3.Error as e:
+            except Exception:
+                # Qualquer erro (inclusive do código chamador) desfaz a transação
                 self.conn.rollback()
-                raise e
+                raise
+
+    @contextmanager
+    def _read_cursor(self) -> Generator[sqlite3.Cursor, None, None]:
+        """
+        Context manager para consultas somente leitura.
+
+        Usa a conexão de leitura da thread atual, sem adquirir o lock do
+        escritor. O cursor é fechado ao sair para não manter o snapshot
+        de leitura aberto (o que impediria checkpoints do WAL).
+
+        Yields:
+            Cursor de uma conexão somente leitura
+        """
+        pool = self._pool
+        if pool is None or not self.is_connected():
+            raise ConnectionError("Banco de dados não conectado")
+
+        self._last_activity = time.monotonic()
+        cursor = pool.get_reader().cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
 
     def connect(self, db_path: str) -> bool:
         """
@@ -94,47 +505,52 @@ class TranslationMemory:
         Returns:
             True se conectou com sucesso
         """
+        # Fora do lock: a thread escritora da fila precisa dele para gravar
+        self._close_write_queue()
+
         with self._lock:
             try:
                 # Fecha conexão anterior se existir
                 self.close()
 
                 self.db_path = db_path
-                self.conn = sqlite3.connect(db_path, check_same_thread=False)
-                self.conn.row_factory = sqlite3.Row
+                self._lookup_cache.clear()
+                self._pool = ConnectionPool(db_path)
+                self.conn = self._pool.writer
                 self.cursor = self.conn.cursor()
 
-                # Otimizações de performance
+                # Bancos novos liberam espaço em fatias (incremental_vacuum);
+                # precisa vir antes do WAL, que já grava o cabeçalho do arquivo
+                self.cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+
                 self.cursor.execute("PRAGMA journal_mode=WAL")
-                self.cursor.execute("PRAGMA synchronous=NORMAL")
-                self.cursor.execute("PRAGMA cache_size=10000")
+                # Limita o custo do ANALYZE feito por PRAGMA optimize
+                self.cursor.execute(f"PRAGMA analysis_limit={int(self.ANALYSIS_LIMIT)}")
 
                 # Cria tabelas se não existirem
                 self._initialize_tables()
 
+                # Otimizações de performance do perfil salvo no banco
+                profile = self.get_metadata('performance_profile', self.DEFAULT_PERFORMANCE_PROFILE)
+                if profile not in self.PERFORMANCE_PROFILES:
+                    profile = self.DEFAULT_PERFORMANCE_PROFILE
+                self._performance_profile = profile
+                self._apply_profile(profile)
+
+                self._load_bloom_filter()
+                self._restore_attachments()
+
+                self._schedule_usage_flush()
+                self._last_optimize = time.monotonic()
+                self._schedule_maintenance()
+
                 return True
             except Exception as e:
                 print(f"Erro ao conectar ao banco de dados: {e}")
                 return False
 
     def _initialize_tables(self):
-        """Cria as tabelas necessárias no banco de dados"""
-        # Tabela principal de traduções
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS translations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                original_text TEXT NOT NULL UNIQUE,
-                translated_text TEXT NOT NULL,
-                source_language TEXT DEFAULT 'en',
-                target_language TEXT DEFAULT 'pt',
-                category TEXT DEFAULT 'general',
-                notes TEXT DEFAULT '',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                usage_count INTEGER DEFAULT 1
-            )
-        ''')
-
+        """Cria as tabelas necessárias no banco de dados (migrando esquemas antigos)"""
         # Tabela de metadados do banco
         self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS metadata (
@@ -143,10 +559,33 @@ class TranslationMemory:
             )
         ''')
 
-        # Índices para busca rápida
+        self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'translations'"
+        )
+        table_exists = self.cursor.fetchone() is not None
+
+        if table_exists and _parse_version(self.get_metadata('version')) < _parse_version(SCHEMA_VERSION):
+            self._migrate_to_language_pair_key()
+
+        # Tabela principal de traduções
+        self.cursor.execute(self._TRANSLATIONS_TABLE_SQL.format(table='translations'))
+        self._create_indexes()
+        self._initialize_fts()
+
+        # Insere metadados padrão (memory_id identifica a memória nas mesclagens)
+        self.cursor.execute('''
+            INSERT OR IGNORE INTO metadata (key, value)
+            VALUES ('version', ?), ('created_at', ?), ('memory_id', ?)
+        ''', (SCHEMA_VERSION, datetime.now().isoformat(), uuid.uuid4().hex))
+
+        self.conn.commit()
+
+    def _create_indexes(self):
+        """Cria os índices da tabela de traduções"""
+        # Chave única por par de idiomas; o texto completo só é comparado para confirmar
         self.cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_original_text
-            ON translations(original_text)
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_language_pair_hash
+            ON translations(source_language, target_language, original_text_hash)
         ''')
 
         self.cursor.execute('''
@@ -154,18 +593,413 @@ class TranslationMemory:
             ON translations(category)
         ''')
 
+        # Delta da mesclagem: linhas alteradas desde a última marca d'água
         self.cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_usage_count
-            ON translations(usage_count DESC)
+            CREATE INDEX IF NOT EXISTS idx_updated_at
+            ON translations(updated_at)
         ''')
 
-        # Insere metadados padrão
+        # (usage_count, id) atende a ordenação do visualizador e a paginação por chave
+        self.cursor.execute('DROP INDEX IF EXISTS idx_usage_count')
         self.cursor.execute('''
-            INSERT OR IGNORE INTO metadata (key, value)
-            VALUES ('version', '1.1'), ('created_at', ?)
-        ''', (datetime.now().isoformat(),))
+            CREATE INDEX IF NOT EXISTS idx_usage_count_id
+            ON translations(usage_count, id)
+        ''')
+
+    def _initialize_fts(self):
+        """
+        Cria o índice de texto completo (FTS5) e os triggers de sincronização.
+
+        O índice usa a tabela translations como conteúdo externo, então só
+        armazena os tokens. Usa o tokenizer trigram (busca por substring,
+        SQLite 3.34+) e cai para unicode61 (busca por palavras/prefixos) em
+        versões antigas. Sem FTS5, as buscas continuam usando LIKE.
+        """
+        self.cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'translations_fts'"
+        )
+        row = self.cursor.fetchone()
+
+        if row:
+            self._fts_tokenizer = 'trigram' if 'trigram' in row[0] else 'unicode61'
+        else:
+            self._fts_tokenizer = None
+            for tokenizer in ('trigram', 'unicode61'):
+                try:
+                    self.cursor.execute(f'''
+                        CREATE VIRTUAL TABLE translations_fts USING fts5(
+                            original_text, translated_text,
+                            content='translations', content_rowid='id',
+                            tokenize='{tokenizer}'
+                        )
+                    ''')
+                    self._fts_tokenizer = tokenizer
+                    break
+                except sqlite3.OperationalError:
+                    continue
+
+            if self._fts_tokenizer is None:
+                return
+
+            # Indexa as traduções já existentes
+            self.cursor.execute("INSERT INTO translations_fts(translations_fts) VALUES ('rebuild')")
+
+        # Triggers mantêm o índice sincronizado (recriados após migrações da tabela)
+        self.cursor.execute(self._FTS_INSERT_TRIGGER_SQL)
+        self.cursor.execute(self._FTS_DELETE_TRIGGER_SQL)
+        self.cursor.execute(self._FTS_UPDATE_TRIGGER_SQL.format(when=''))
+
+    def _build_fts_query(self, term: str) -> Optional[str]:
+        """
+        Converte um termo digitado em expressão MATCH do FTS5.
+
+        Args:
+            term: Texto digitado pelo usuário
 
+        Returns:
+            Expressão MATCH ou None quando o índice não pode ser usado
+            (FTS5 indisponível ou termo curto demais para trigramas)
+        """
+        term = term.strip()
+        if not term or self._fts_tokenizer is None:
+            return None
+
+        if self._fts_tokenizer == 'trigram':
+            # Trigramas exigem ao menos 3 caracteres; a frase entre aspas busca a substring
+            if len(term) < 3:
+                return None
+            return '"' + term.replace('"', '""') + '"'
+
+        # unicode61: cada palavra vira um prefixo ("espa"*)
+        words = [w for w in term.replace('"', ' ').split() if w]
+        if not words:
+            return None
+        return ' '.join('"' + w + '"*' for w in words)
+
+    def _load_bloom_filter(self):
+        """
+        Carrega o filtro de Bloom persistido ou reconstrói a partir do banco.
+
+        O filtro salvo guarda o maior ID já incluído; só as linhas inseridas
+        depois disso (IDs são AUTOINCREMENT) são lidas ao reconectar.
+        """
+        self._bloom = None
+        self._bloom_dirty = False
+
+        try:
+            bloom = None
+            if self.BLOOM_PERSIST:
+                data = self.get_metadata('bloom_filter')
+                if data is not None:
+                    bloom = BloomFilter.from_bytes(bytes(data))
+
+            if bloom is not None:
+                max_id = int(self.get_metadata('bloom_filter_max_id', '0'))
+                before = bloom.count
+                self.cursor.execute(
+                    'SELECT original_text_hash FROM translations WHERE id > ?', (max_id,)
+                )
+                bloom.update(row[0] for row in self.cursor)
+                self._bloom = bloom
+                self._bloom_dirty = bloom.count != before
+
+            if self._bloom is None or self._bloom.is_saturated():
+                self._rebuild_bloom_filter()
+        except Exception as e:
+            # Sem filtro as buscas continuam corretas, só consultam sempre o banco
+            self._bloom = None
+            print(f"Erro ao carregar filtro de Bloom: {e}")
+
+    def _rebuild_bloom_filter(self):
+        """Reconstrói o filtro com folga para o dobro das traduções atuais"""
+        with self._lock:
+            self.cursor.execute('SELECT COUNT(*) FROM translations')
+            count = self.cursor.fetchone()[0]
+
+            bloom = BloomFilter(max(self.BLOOM_MIN_CAPACITY, count * 2),
+                                self.BLOOM_FALSE_POSITIVE_RATE)
+            # Lê só a coluna inteira (coberta pelo índice do par de idiomas)
+            self.cursor.execute('SELECT original_text_hash FROM translations')
+            bloom.update(row[0] for row in self.cursor)
+
+            self._bloom = bloom
+            self._bloom_dirty = True
+
+    def _bloom_add(self, hashes: Iterable[int]):
+        """
+        Inclui hashes no filtro antes da escrita correspondente.
+
+        Incluir antes garante que nenhuma leitura veja a linha gravada com o
+        filtro ainda dizendo "não existe"; se a escrita falhar, sobra só um
+        falso positivo.
+
+        O chamador deve segurar self._lock desde esta chamada até o commit da
+        escrita: a reconstrução do filtro (também sob o lock) lê o banco, e
+        um hash incluído no filtro antigo com a linha ainda não gravada se
+        perderia na troca (falso negativo).
+        """
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.update(hashes)
+                self._bloom_dirty = True
+
+    def _ensure_bloom_capacity(self):
+        """Reconstrói o filtro maior quando passou da capacidade"""
+        with self._lock:
+            if self._bloom is not None and self._bloom.is_saturated():
+                self._rebuild_bloom_filter()
+
+    def _save_bloom_filter(self):
+        """Persiste o filtro em metadata junto com o maior ID incluído"""
+        if not self.BLOOM_PERSIST or self._bloom is None or not self._bloom_dirty:
+            return
+
+        with self._lock:
+            self.cursor.execute('SELECT COALESCE(MAX(id), 0) FROM translations')
+            max_id = self.cursor.fetchone()[0]
+
+            with self._transaction() as cursor:
+                cursor.executemany('''
+                    INSERT INTO metadata (key, value) VALUES (?, ?)
+                    ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                ''', [('bloom_filter', sqlite3.Binary(self._bloom.to_bytes())),
+                      ('bloom_filter_max_id', str(max_id))])
+
+            self._bloom_dirty = False
+
+    def _profile_pragmas(self, name: str) -> List[str]:
+        """PRAGMAs de tempo de execução de um perfil (sem page_size)"""
+        profile = self.PERFORMANCE_PROFILES[name]
+        return [
+            f"PRAGMA synchronous={profile['synchronous']}",
+            f"PRAGMA cache_size=-{int(profile['cache_kib'])}",
+            f"PRAGMA mmap_size={int(profile['mmap_size'])}",
+            f"PRAGMA temp_store={profile['temp_store']}",
+        ]
+
+    def _apply_profile(self, name: str, readers: bool = True):
+        """
+        Aplica os PRAGMAs de um perfil no escritor (e nos leitores).
+
+        Args:
+            name: Nome do perfil
+            readers: Se True, reconfigura também as conexões de leitura
+        """
+        pragmas = self._profile_pragmas(name)
+        with self._lock:
+            for pragma in pragmas:
+                self.conn.execute(pragma)
+            self._applied_profile = name
+        if readers:
+            self._pool.configure_readers(pragmas)
+
+    def get_performance_profile(self) -> str:
+        """Retorna o nome do perfil de desempenho salvo no banco"""
+        return self._performance_profile
+
+    def set_performance_profile(self, name: str) -> bool:
+        """
+        Ativa e salva um perfil de desempenho.
+
+        Se o perfil usa outro page_size, o arquivo é reconstruído (VACUUM
+        fora do modo WAL) e reaberto: feche diálogos e workers que estejam
+        lendo a memória antes de trocar.
+
+        Args:
+            name: 'interactive', 'bulk-import' ou 'read-only-archive'
+
+        Returns:
+            True se o perfil foi aplicado
+        """
+        if name not in self.PERFORMANCE_PROFILES:
+            print(f"Perfil de desempenho desconhecido: {name}")
+            return False
+
+        if not self.is_connected():
+            return False
+
+        try:
+            page_size = self.PERFORMANCE_PROFILES[name]['page_size']
+            with self._read_cursor() as cursor:
+                current_page_size = cursor.execute('PRAGMA page_size').fetchone()[0]
+
+            # Só grava o perfil depois da reconstrução: se o VACUUM falhar,
+            # a memória continua com o perfil e o page_size anteriores
+            if current_page_size != page_size and not self._rebuild_page_size(page_size):
+                return False
+
+            if not self.set_metadata('performance_profile', name):
+                return False
+
+            self._performance_profile = name
+            self._apply_profile(name)
+            return True
+        except Exception as e:
+            print(f"Erro ao aplicar perfil de desempenho: {e}")
+            return False
+
+    def _rebuild_page_size(self, page_size: int) -> bool:
+        """
+        Reconstrói o arquivo com outro tamanho de página e reconecta.
+
+        O page_size não pode mudar em modo WAL: o banco é fechado, passa
+        por journal_mode=DELETE + VACUUM em uma conexão exclusiva e volta
+        para WAL ao ser reaberto por connect(), mesmo se o VACUUM falhar.
+
+        Returns:
+            True se o arquivo foi reconstruído e reaberto
+        """
+        db_path = self.db_path
+        self.close()
+
+        rebuilt = False
+        try:
+            with closing(sqlite3.connect(db_path)) as conn:
+                conn.execute('PRAGMA journal_mode=DELETE')
+                conn.execute(f'PRAGMA page_size={int(page_size)}')
+                conn.execute('VACUUM')
+            rebuilt = True
+        except Exception as e:
+            print(f"Erro ao reconstruir banco com page_size={page_size}: {e}")
+        finally:
+            connected = self.connect(db_path)
+
+        return rebuilt and connected
+
+    @contextmanager
+    def _temporary_profile(self, name: str) -> Generator[None, None, None]:
+        """
+        Usa outro perfil no escritor durante um bloco (ex: importação).
+
+        Só os PRAGMAs de tempo de execução mudam; o perfil salvo volta a
+        valer ao sair, mesmo em caso de erro.
+        """
+        previous = self._applied_profile
+        if previous is None or previous == name:
+            yield
+            return
+
+        self._apply_profile(name, readers=False)
+        try:
+            yield
+        finally:
+            if self.is_connected():
+                self._apply_profile(previous, readers=False)
+
+    def _migrate_to_language_pair_key(self):
+        """
+        Migra o esquema 1.x (UNIQUE(original_text) + idx_original_text) para 2.0.
+
+        O SQLite não remove restrições UNIQUE com ALTER TABLE, então a tabela
+        é reconstruída preservando IDs, contadores, datas e notas. O índice
+        redundante idx_original_text é descartado junto com a tabela antiga.
+        """
         self.conn.commit()
+        with self._transaction() as cursor:
+            cursor.execute(self._TRANSLATIONS_TABLE_SQL.format(table='translations_v2'))
+            cursor.execute('''
+                INSERT OR IGNORE INTO translations_v2
+                (id, original_text, original_text_hash, translated_text,
+                 source_language, target_language, category, notes,
+                 created_at, updated_at, usage_count)
+                SELECT id, original_text, text_hash(original_text), translated_text,
+                       COALESCE(source_language, 'en'), COALESCE(target_language, 'pt'),
+                       category, notes, created_at, updated_at, usage_count
+                FROM translations
+            ''')
+            cursor.execute('DROP TABLE translations')
+            cursor.execute('ALTER TABLE translations_v2 RENAME TO translations')
+            cursor.execute('''
+                INSERT INTO metadata (key, value) VALUES ('version', ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+            ''', (SCHEMA_VERSION,))
+
+    def get_metadata(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Lê um valor da tabela de metadados
+
+        Args:
+            key: Chave do metadado
+            default: Valor retornado se a chave não existir
+
+        Returns:
+            Valor armazenado ou default
+        """
+        if not self.is_connected():
+            return default
+
+        with self._lock:
+            cursor = self.conn.execute('SELECT value FROM metadata WHERE key = ?', (key,))
+            row = cursor.fetchone()
+            cursor.close()
+
+        return row[0] if row else default
+
+    def set_metadata(self, key: str, value: str) -> bool:
+        """
+        Grava um valor na tabela de metadados
+
+        Args:
+            key: Chave do metadado
+            value: Valor a gravar
+
+        Returns:
+            True se gravou com sucesso
+        """
+        if not self.is_connected():
+            return False
+
+        try:
+            with self._get_cursor() as cursor:
+                cursor.execute('''
+                    INSERT INTO metadata (key, value) VALUES (?, ?)
+                    ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                ''', (key, value))
+            return True
+        except Exception as e:
+            print(f"Erro ao gravar metadado: {e}")
+            return False
+
+    def set_language_pair(self, source_lang: str, target_lang: str):
+        """
+        Define o par de idiomas padrão usado por buscas e inserções
+
+        Args:
+            source_lang: Idioma de origem (ex: 'en')
+            target_lang: Idioma de destino (ex: 'pt')
+        """
+        self.source_language = source_lang
+        self.target_language = target_lang
+
+    def get_language_pair(self) -> Tuple[str, str]:
+        """Retorna o par de idiomas padrão (origem, destino)"""
+        return (self.source_language, self.target_language)
+
+    def _resolve_pair(self, source_lang: Optional[str],
+                      target_lang: Optional[str]) -> Tuple[str, str]:
+        """Completa idiomas não informados com o par padrão"""
+        return (source_lang or self.source_language, target_lang or self.target_language)
+
+    def get_language_pairs(self) -> List[Tuple[str, str]]:
+        """
+        Retorna os pares de idiomas presentes na memória
+
+        Returns:
+            Lista de tuplas (origem, destino)
+        """
+        if not self.is_connected():
+            return []
+
+        try:
+            with self._read_cursor() as cursor:
+                cursor.execute('''
+                    SELECT DISTINCT source_language, target_language
+                    FROM translations ORDER BY source_language, target_language
+                ''')
+                return [(row[0], row[1]) for row in cursor.fetchall()]
+        except Exception as e:
+            print(f"Erro ao buscar pares de idiomas: {e}")
+            return []
 
     def is_connected(self) -> bool:
         """Verifica se está conectado a um banco de dados"""
@@ -175,8 +1009,172 @@ class TranslationMemory:
         """Retorna o caminho do banco de dados atual"""
         return self.db_path
 
+    def attach_memory(self, db_path: str, position: int = None, persist: bool = True) -> bool:
+        """
+        Anexa outra memória (ex: glossário compartilhado) às buscas exatas.
+
+        O banco é anexado somente leitura às conexões de leitura. As buscas
+        exatas consultam primeiro o banco principal e depois as memórias
+        anexadas, na ordem de prioridade; escritas, listagens e buscas de
+        texto continuam só no banco principal. Memórias em esquema antigo
+        são migradas uma vez antes de anexar.
+
+        O filtro de Bloom da memória anexada é montado ao anexar: alterações
+        feitas nela por outro programa só aparecem depois de reanexar.
+
+        Args:
+            db_path: Caminho do arquivo .db a anexar
+            position: Posição na ordem de prioridade (None = última)
+            persist: Se True, a lista fica salva em metadata e é restaurada
+                ao reconectar
+
+        Returns:
+            True se a memória foi anexada
+        """
+        if not self.is_connected():
+            return False
+
+        db_path = os.path.abspath(db_path)
+
+        if not os.path.isfile(db_path):
+            print(f"Memória não encontrada: {db_path}")
+            return False
+        if db_path == os.path.abspath(self.db_path):
+            print("O banco principal não pode ser anexado a si mesmo")
+            return False
+        if db_path in self.get_attached_memories():
+            return True
+        if len(self._attached) >= self.MAX_ATTACHED_MEMORIES:
+            print(f"Limite de {self.MAX_ATTACHED_MEMORIES} memórias anexadas atingido")
+            return False
+
+        try:
+            self._prepare_peer_schema(db_path)
+            bloom = self._load_attached_bloom(db_path)
+
+            self._attach_sequence += 1
+            entry = {'alias': f'attached_{self._attach_sequence}', 'path': db_path, 'bloom': bloom}
+            if position is None:
+                self._attached.append(entry)
+            else:
+                self._attached.insert(max(0, position), entry)
+
+            self._sync_attachments(persist)
+
+            # Valida o ATTACH na conexão de leitura desta thread
+            with self._read_cursor() as cursor:
+                cursor.execute(f"SELECT 1 FROM {entry['alias']}.translations LIMIT 1")
+            return True
+        except Exception as e:
+            self._attached = [a for a in self._attached if a['path'] != db_path]
+            self._sync_attachments(persist)
+            print(f"Erro ao anexar memória: {e}")
+            return False
+
+    def detach_memory(self, db_path: str, persist: bool = True) -> bool:
+        """
+        Remove uma memória anexada.
+
+        Args:
+            db_path: Caminho do arquivo anexado
+            persist: Se True, atualiza a lista salva em metadata
+
+        Returns:
+            True se a memória estava anexada
+        """
+        db_path = os.path.abspath(db_path)
+        remaining = [a for a in self._attached if a['path'] != db_path]
+        if len(remaining) == len(self._attached):
+            return False
+
+        self._attached = remaining
+        self._sync_attachments(persist)
+        return True
+
+    def get_attached_memories(self) -> List[str]:
+        """Retorna os caminhos das memórias anexadas em ordem de prioridade"""
+        return [a['path'] for a in self._attached]
+
+    def _sync_attachments(self, persist: bool):
+        """Propaga a lista de anexos para os leitores, o cache e (opcionalmente) metadata"""
+        if self._pool is not None:
+            self._pool.set_attachments([(a['alias'], a['path']) for a in self._attached])
+
+        # Resultados em cache podem ter vindo de (ou faltado em) outra memória
+        self._lookup_cache.clear()
+
+        if persist:
+            self.set_metadata('attached_memories', json.dumps(self.get_attached_memories()))
+
+    def _restore_attachments(self):
+        """Reanexa as memórias salvas em metadata (ao conectar)"""
+        self._attached = []
+
+        try:
+            paths = json.loads(self.get_metadata('attached_memories', '[]'))
+        except (TypeError, ValueError):
+            paths = []
+
+        for path in paths:
+            if not self.attach_memory(path, persist=False):
+                print(f"Memória anexada ignorada: {path}")
+
+    def _prepare_peer_schema(self, db_path: str):
+        """Atualiza uma memória externa (anexada ou mesclada) criada por versões antigas"""
+        with closing(sqlite3.connect(Path(db_path).as_uri() + '?mode=ro', uri=True)) as conn:
+            metadata = dict(conn.execute(
+                "SELECT key, value FROM metadata WHERE key IN ('version', 'memory_id')"
+            ).fetchall())
+
+        outdated = _parse_version(metadata.get('version')) < _parse_version(SCHEMA_VERSION)
+        if outdated or not metadata.get('memory_id'):
+            other = TranslationMemory(db_path)
+            migrated = other.is_connected()
+            other.close()
+            if not migrated:
+                raise sqlite3.DatabaseError(f"não foi possível migrar {db_path}")
+
+    def _load_attached_bloom(self, db_path: str) -> Optional[BloomFilter]:
+        """
+        Filtro de Bloom de uma memória anexada.
+
+        Usa o filtro persistido pela própria memória (completando com as
+        linhas mais novas) ou monta um a partir da coluna de hashes.
+        """
+        with closing(sqlite3.connect(Path(db_path).as_uri() + '?mode=ro', uri=True)) as conn:
+            bloom = None
+            metadata = dict(conn.execute(
+                "SELECT key, value FROM metadata WHERE key IN ('bloom_filter', 'bloom_filter_max_id')"
+            ).fetchall())
+
+            if metadata.get('bloom_filter') is not None:
+                bloom = BloomFilter.from_bytes(bytes(metadata['bloom_filter']))
+
+            if bloom is not None:
+                max_id = int(metadata.get('bloom_filter_max_id') or 0)
+                bloom.update(row[0] for row in conn.execute(
+                    'SELECT original_text_hash FROM translations WHERE id > ?', (max_id,)
+                ))
+
+            if bloom is None or bloom.is_saturated():
+                count = conn.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+                bloom = BloomFilter(max(self.BLOOM_MIN_CAPACITY, count * 2),
+                                    self.BLOOM_FALSE_POSITIVE_RATE)
+                bloom.update(row[0] for row in conn.execute(
+                    'SELECT original_text_hash FROM translations'
+                ))
+
+        return bloom
+
+    def _lookup_sources(self) -> List[Tuple[int, str, Optional[BloomFilter]]]:
+        """Bancos consultados nas buscas exatas: (prioridade, schema, filtro de Bloom)"""
+        sources = [(0, 'main', self._bloom)]
+        sources.extend((priority, a['alias'], a['bloom'])
+                       for priority, a in enumerate(self._attached, start=1))
+        return sources
+
     def add_translation(self, original: str, translated: str,
-                       source_lang: str = 'en', target_lang: str = 'pt',
+                       source_lang: str = None, target_lang: str = None,
                        category: str = 'general', notes: str = '') -> bool:
         """
         Adiciona ou atualiza uma tradução na memória
@@ -184,8 +1182,8 @@ class TranslationMemory:
         Args:
             original: Texto original
             translated: Texto traduzido
-            source_lang: Idioma de origem
-            target_lang: Idioma de destino
+            source_lang: Idioma de origem (None = par padrão)
+            target_lang: Idioma de destino (None = par padrão)
             category: Categoria da tradução
             notes: Notas adicionais
 
@@ -195,26 +1193,119 @@ class TranslationMemory:
         if not self.is_connected():
             return False
 
+        source_lang, target_lang = self._resolve_pair(source_lang, target_lang)
+
         try:
-            with self._get_cursor() as cursor:
-                cursor.execute('''
-                    INSERT INTO translations
-                    (original_text, translated_text, source_language, target_language, category, notes)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(original_text) DO UPDATE SET
-                        translated_text = excluded.translated_text,
-                        updated_at = CURRENT_TIMESTAMP,
-                        usage_count = usage_count + 1,
-                        category = excluded.category,
-                        notes = excluded.notes
-                ''', (original, translated, source_lang, target_lang, category, notes))
+            original_hash = text_hash(original)
+
+            # Filtro, escrita e reconstrução sob o mesmo lock (ver _bloom_add)
+            with self._lock:
+                self._bloom_add([original_hash])
+
+                with self._get_cursor() as cursor:
+                    cursor.execute(self._UPSERT_SQL, (original, original_hash, translated,
+                                                      source_lang, target_lang, category, notes))
+                self._ensure_bloom_capacity()
+            self._lookup_cache.invalidate([(source_lang, target_lang, original)])
             return True
         except Exception as e:
             print(f"Erro ao adicionar tradução: {e}")
             return False
 
+    def queue_translation(self, original: str, translated: str,
+                          source_lang: str = None, target_lang: str = None,
+                          category: str = 'general', notes: str = '') -> bool:
+        """
+        Enfileira uma tradução para gravação em segundo plano.
+
+        Retorna imediatamente: a gravação acontece na thread da fila, em uma
+        única transação por lote. Edições repetidas do mesmo texto antes da
+        gravação são consolidadas (vale a última). As buscas exatas já
+        enxergam o valor enfileirado; use flush_writes() antes de depender
+        do conteúdo do arquivo (salvar, exportar, fechar). A gravação tem o
+        mesmo efeito de add_translation (categoria, notas e usage_count).
+
+        Args:
+            original: Texto original
+            translated: Texto traduzido
+            source_lang: Idioma de origem (None = par padrão)
+            target_lang: Idioma de destino (None = par padrão)
+            category: Categoria da tradução
+            notes: Notas adicionais
+
+        Returns:
+            True se a tradução foi enfileirada
+        """
+        if not self.is_connected():
+            return False
+
+        source_lang, target_lang = self._resolve_pair(source_lang, target_lang)
+
+        try:
+            with self._write_queue_lock:
+                if self._write_queue is None:
+                    self._write_queue = WriteBehindQueue(
+                        self._write_queued_batch,
+                        self.WRITE_BEHIND_INTERVAL_MS,
+                        self.WRITE_BEHIND_MAX_PENDING,
+                        name='TranslationMemoryWriter'
+                    )
+                self._write_queue.put((source_lang, target_lang, original),
+                                      (translated, category, notes))
+            return True
+        except Exception as e:
+            print(f"Erro ao enfileirar tradução: {e}")
+            return False
+
+    def _write_queued_batch(self, batch: List[Tuple[Tuple[str, str, str], Tuple[str, str, str]]]):
+        """
+        Grava um lote da fila de escrita em uma única transação (roda na
+        thread da fila). Erros não são tratados aqui: a exceção faz a fila
+        manter o lote e flush_writes() retornar False.
+        """
+        params = [(original, text_hash(original), translated,
+                   source_lang, target_lang, category, notes)
+                  for (source_lang, target_lang, original), (translated, category, notes) in batch]
+
+        with self._transaction() as cursor:
+            self._bloom_add(p[1] for p in params)
+            cursor.executemany(self._UPSERT_SQL, params)
+
+        self._lookup_cache.invalidate([key for key, _ in batch])
+        self._ensure_bloom_capacity()
+
+    def flush_writes(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda a gravação de todas as traduções enfileiradas até agora.
+
+        Args:
+            timeout: Tempo máximo de espera em segundos (None = sem limite)
+
+        Returns:
+            True se não restou nada pendente; False no tempo esgotado ou se
+            a gravação falhou (as traduções continuam enfileiradas)
+        """
+        queue = self._write_queue
+        if queue is None:
+            return True
+        return queue.flush(timeout)
+
+    def get_pending_write_count(self) -> int:
+        """Retorna quantas traduções enfileiradas ainda não foram gravadas"""
+        queue = self._write_queue
+        return queue.pending_count() if queue is not None else 0
+
+    def _close_write_queue(self):
+        """Grava as traduções enfileiradas e encerra a thread da fila"""
+        with self._write_queue_lock:
+            queue = self._write_queue
+            self._write_queue = None
+
+        if queue is not None:
+            queue.close()
+
     def add_translations_batch(self, translations: List[Tuple[str, str]],
-                               source_lang: str = 'en', target_lang: str = 'pt',
+                               source_lang: str = None, target_lang: str = None,
                                category: str = 'general') -> Tuple[int, int]:
         """
         Adiciona múltiplas traduções de uma vez (otimizado para grandes volumes).
@@ -223,84 +1314,405 @@ class TranslationMemory:
 
         Args:
             translations: Lista de tuplas (texto_original, texto_traduzido)
-            source_lang: Idioma de origem
-            target_lang: Idioma de destino
+            source_lang: Idioma de origem (None = par padrão)
+            target_lang: Idioma de destino (None = par padrão)
+            category: Categoria das traduções
+
+        Returns:
+            Tupla (inseridos_com_sucesso, erros)
+        """
+        if not translations:
+            return (0, 0)
+
+        return self.add_translations_bulk(translations, source_lang, target_lang, category)
+
+    def add_translations_bulk(self, translations: Iterable[Tuple[str, str]],
+                              source_lang: str = None, target_lang: str = None,
+                              category: str = 'general',
+                              chunk_size: int = None,
+                              commit_every: int = None,
+                              progress_callback: Callable[[int, int], None] = None) -> Tuple[int, int]:
+        """
+        Upsert em massa a partir de qualquer iterável (lista, gerador, leitor de CSV).
+
+        As tuplas são consumidas em chunks e enviadas com executemany; a
+        transação é confirmada a cada `commit_every` linhas para que o WAL não
+        cresça sem limite e outros escritores possam intercalar. Como o
+        iterável é consumido de forma incremental, o uso de RAM não depende
+        do tamanho da importação.
+
+        Se um chunk falhar, ele é desfeito (SAVEPOINT) e reprocessado linha a
+        linha para contabilizar apenas as linhas com erro.
+
+        Args:
+            translations: Iterável de tuplas (texto_original, texto_traduzido)
+            source_lang: Idioma de origem (None = par padrão)
+            target_lang: Idioma de destino (None = par padrão)
             category: Categoria das traduções
+            chunk_size: Linhas por executemany (None = BULK_CHUNK_SIZE)
+            commit_every: Linhas por commit (None = BULK_COMMIT_EVERY)
+            progress_callback: Função (processadas, total) chamada após cada
+                commit; total é 0 quando o iterável não tem tamanho conhecido
 
         Returns:
             Tupla (inseridos_com_sucesso, erros)
         """
-        if not self.is_connected() or not translations:
+        if not self.is_connected():
             return (0, 0)
 
+        source_lang, target_lang = self._resolve_pair(source_lang, target_lang)
+        chunk_size = max(1, chunk_size or self.BULK_CHUNK_SIZE)
+        commit_every = max(chunk_size, commit_every or self.BULK_COMMIT_EVERY)
+        total = len(translations) if hasattr(translations, '__len__') else 0
+
         inserted = 0
         errors = 0
+        processed = 0
+        rows = iter(translations)
+        exhausted = False
 
         try:
-            with self._transaction() as cursor:
-                for original, translated in translations:
-                    try:
-                        cursor.execute('''
-                            INSERT INTO translations
-                            (original_text, translated_text, source_language, target_language, category)
-                            VALUES (?, ?, ?, ?, ?)
-                            ON CONFLICT(original_text) DO UPDATE SET
-                                translated_text = excluded.translated_text,
-                                updated_at = CURRENT_TIMESTAMP,
-                                usage_count = usage_count + 1
-                        ''', (original, translated, source_lang, target_lang, category))
-                        inserted += 1
-                    except sqlite3.Error:
-                        errors += 1
+            while not exhausted:
+                written_keys = []
+
+                with self._transaction() as cursor:
+                    fts_after_id = None
+                    fts_suspended = False
+                    in_transaction = 0
+
+                    while in_transaction < commit_every:
+                        chunk = list(islice(rows, chunk_size))
+                        if not chunk:
+                            exhausted = True
+                            break
+
+                        # Suspende os triggers só quando o volume compensa (as
+                        # linhas já gravadas nesta transação foram indexadas por eles)
+                        if (not fts_suspended and
+                                max(total, processed + len(chunk)) >= self.FTS_SUSPEND_MIN_ROWS):
+                            fts_after_id = self._suspend_fts_sync(cursor)
+                            fts_suspended = True
+
+                        params = []
+                        for item in chunk:
+                            try:
+                                original, translated = item
+                                original_hash = text_hash(original)
+                            except (TypeError, ValueError, AttributeError):
+                                errors += 1
+                                continue
+                            params.append((original, original_hash, translated,
+                                           source_lang, target_lang, category))
+
+                        self._bloom_add(p[1] for p in params)
+                        ok, failed = self._execute_bulk_chunk(cursor, params)
+                        written_keys.extend((source_lang, target_lang, p[0]) for p in params)
+                        inserted += ok
+                        errors += failed
+                        in_transaction += len(chunk)
+                        processed += len(chunk)
+
+                    self._resume_fts_sync(cursor, fts_after_id)
+
+                # Invalida só depois do commit, quando as leituras já veem os novos dados
+                self._lookup_cache.invalidate(written_keys)
+                self._ensure_bloom_capacity()
+
+                if progress_callback and in_transaction:
+                    progress_callback(processed, total)
 
             return (inserted, errors)
         except Exception as e:
             print(f"Erro ao adicionar traduções em lote: {e}")
             return (inserted, errors)
 
-    def get_translation(self, original: str) -> Optional[str]:
+    def _suspend_fts_sync(self, cursor: sqlite3.Cursor) -> Optional[int]:
+        """
+        Suspende a indexação FTS5 linha a linha durante uma transação em massa.
+
+        O trigger de inserção é removido e o de atualização passa a ignorar as
+        linhas novas; _resume_fts_sync indexa as linhas novas com um único
+        INSERT ... SELECT (várias vezes mais rápido que o trigger por linha) e
+        restaura os triggers. Tudo ocorre dentro da mesma transação, então
+        nenhuma outra conexão vê o índice dessincronizado. Pode ser chamado no
+        meio da transação: as linhas gravadas antes já passaram pelos triggers.
+
+        Args:
+            cursor: Cursor do escritor com transação aberta
+
+        Returns:
+            Maior ID existente antes da importação, ou None sem índice FTS5
+        """
+        if self._fts_tokenizer is None:
+            return None
+
+        cursor.execute('SELECT COALESCE(MAX(id), 0) FROM translations')
+        after_id = int(cursor.fetchone()[0])
+
+        cursor.execute('DROP TRIGGER IF EXISTS translations_fts_ai')
+        cursor.execute('DROP TRIGGER IF EXISTS translations_fts_au')
+        # Linhas novas ainda não estão no índice: um 'delete' nelas o corromperia
+        cursor.execute(self._FTS_UPDATE_TRIGGER_SQL.format(when=f'WHEN old.id <= {after_id}'))
+        return after_id
+
+    def _resume_fts_sync(self, cursor: sqlite3.Cursor, after_id: Optional[int]):
+        """Indexa as linhas inseridas após after_id e restaura os triggers do FTS5"""
+        if after_id is None:
+            return
+
+        cursor.execute('''
+            INSERT INTO translations_fts(rowid, original_text, translated_text)
+            SELECT id, original_text, translated_text FROM translations WHERE id > ?
+        ''', (after_id,))
+
+        cursor.execute('DROP TRIGGER IF EXISTS translations_fts_au')
+        cursor.execute(self._FTS_UPDATE_TRIGGER_SQL.format(when=''))
+        cursor.execute(self._FTS_INSERT_TRIGGER_SQL)
+
+    def _execute_bulk_chunk(self, cursor: sqlite3.Cursor, params: List[tuple]) -> Tuple[int, int]:
+        """
+        Executa um chunk do upsert em massa dentro da transação atual
+
+        Args:
+            cursor: Cursor do escritor com transação aberta
+            params: Parâmetros do _BULK_UPSERT_SQL
+
+        Returns:
+            Tupla (inseridos_com_sucesso, erros)
+        """
+        if not params:
+            return (0, 0)
+
+        cursor.execute("SAVEPOINT bulk_chunk")
+        try:
+            cursor.executemany(self._BULK_UPSERT_SQL, params)
+            cursor.execute("RELEASE SAVEPOINT bulk_chunk")
+            return (len(params), 0)
+        except sqlite3.Error:
+            # Desfaz o chunk parcial e repete linha a linha para isolar os erros
+            cursor.execute("ROLLBACK TO SAVEPOINT bulk_chunk")
+
+        inserted = 0
+        errors = 0
+        for row in params:
+            try:
+                cursor.execute(self._BULK_UPSERT_SQL, row)
+                inserted += 1
+            except sqlite3.Error:
+                errors += 1
+
+        cursor.execute("RELEASE SAVEPOINT bulk_chunk")
+        return (inserted, errors)
+
+    def get_translation(self, original: str, source_lang: str = None,
+                        target_lang: str = None) -> Optional[str]:
         """
-        Busca uma tradução na memória
+        Busca uma tradução na memória e contabiliza o uso.
+
+        O incremento de usage_count não é gravado imediatamente: ele é
+        acumulado em memória e persistido em lote por flush_usage_counts().
+        Assim a busca não abre nenhuma transação de escrita.
 
         Args:
             original: Texto original
+            source_lang: Idioma de origem (None = par padrão)
+            target_lang: Idioma de destino (None = par padrão)
 
         Returns:
             Texto traduzido ou None se não encontrado
         """
-        if not self.is_connected():
+        result = self._lookup(original, source_lang, target_lang)
+
+        if result is None:
             return None
 
-        try:
-            with self._get_cursor() as cursor:
-                cursor.execute('''
-                    SELECT translated_text FROM translations
-                    WHERE original_text = ?
-                ''', (original,))
+        translation_id, translated_text = result
+        if translation_id is not None:
+            with self._usage_lock:
+                self._pending_usage[translation_id] += 1
+
+        return translated_text
+
+    def lookup_translation(self, original: str, source_lang: str = None,
+                           target_lang: str = None) -> Optional[str]:
+        """
+        Busca uma tradução sem nenhum efeito colateral (não conta uso).
+
+        Args:
+            original: Texto original
+            source_lang: Idioma de origem (None = par padrão)
+            target_lang: Idioma de destino (None = par padrão)
+
+        Returns:
+            Texto traduzido ou None se não encontrado
+        """
+        result = self._lookup(original, source_lang, target_lang)
+        return result[1] if result else None
 
-                result = cursor.fetchone()
+    def _lookup(self, original: str, source_lang: str = None,
+                target_lang: str = None) -> Optional[Tuple[int, str]]:
+        """
+        Consulta somente leitura de uma tradução exata.
 
-                if result:
-                    # Incrementa contador de uso
-                    cursor.execute('''
-                        UPDATE translations
-                        SET usage_count = usage_count + 1
-                        WHERE original_text = ?
-                    ''', (original,))
+        Traduções ainda na fila de escrita têm prioridade (a tupla vem com
+        id None). Depois passa pelo cache LRU (acertos e misses) e pelos
+        filtros de Bloom (misses certos). No banco, a busca usa o índice
+        (origem, destino, hash); o texto completo só é comparado para
+        confirmar a linha encontrada. Resultados de memórias anexadas
+        também vêm com id None (o uso não é contabilizado).
 
-                    return result[0]
+        Args:
+            original: Texto original
+            source_lang: Idioma de origem (None = par padrão)
+            target_lang: Idioma de destino (None = par padrão)
 
+        Returns:
+            Tupla (id, texto_traduzido) ou None se não encontrado
+        """
+        if not self.is_connected():
             return None
+
+        source_lang, target_lang = self._resolve_pair(source_lang, target_lang)
+
+        key = (source_lang, target_lang, original)
+        queue = self._write_queue
+        if queue is not None:
+            queued = queue.get(key)
+            if queued is not None:
+                return (None, queued[0])
+
+        cached = self._lookup_cache.get(key)
+        if cached is not LookupCache.MISSING:
+            return cached
+
+        original_hash = text_hash(original)
+
+        # Só consulta os bancos cujo filtro de Bloom admite o hash
+        branches = []
+        params = []
+        for priority, schema, bloom in self._lookup_sources():
+            if bloom is not None and not bloom.might_contain(original_hash):
+                continue
+            id_column = 'id' if priority == 0 else 'NULL'
+            branches.append(f'''
+                SELECT {priority} AS priority, {id_column} AS id, translated_text
+                FROM {schema}.translations
+                WHERE source_language = ? AND target_language = ?
+                  AND original_text_hash = ? AND original_text = ?
+            ''')
+            params.extend((source_lang, target_lang, original_hash, original))
+
+        if not branches:
+            # Miss certo: nenhuma linha tem esse hash
+            self._bloom_skips += 1
+            return None
+
+        try:
+            # Lida antes da consulta: se uma escrita invalidar o cache no meio
+            # do caminho, o resultado (possivelmente antigo) não é armazenado
+            version = self._lookup_cache.version
+
+            with self._read_cursor() as cursor:
+                # Memórias anexadas: uma consulta UNION ALL, vence a de maior prioridade
+                cursor.execute(
+                    'SELECT id, translated_text FROM ('
+                    + ' UNION ALL '.join(branches)
+                    + ') ORDER BY priority LIMIT 1',
+                    params
+                )
+
+                row = cursor.fetchone()
+
+            result = (row[0], row[1]) if row else None
+            self._lookup_cache.put(key, result, version)
+            return result
         except Exception as e:
             print(f"Erro ao buscar tradução: {e}")
             return None
 
-    def get_translations_batch(self, originals: List[str]) -> Dict[str, str]:
+    def flush_usage_counts(self) -> int:
+        """
+        Grava os contadores de uso acumulados em uma única transação.
+
+        Os IDs são agrupados pelo valor do incremento, gerando um
+        UPDATE ... WHERE id IN (...) por grupo em vez de um por busca.
+
+        Returns:
+            Número de traduções atualizadas
+        """
+        with self._usage_lock:
+            if not self._pending_usage:
+                return 0
+            pending = self._pending_usage
+            self._pending_usage = Counter()
+
+        if not self.is_connected():
+            return 0
+
+        # Agrupa IDs pelo incremento (na prática quase todos são +1)
+        by_increment: Dict[int, List[int]] = defaultdict(list)
+        for translation_id, increment in pending.items():
+            by_increment[increment].append(translation_id)
+
+        updated = 0
+        try:
+            with self._transaction() as cursor:
+                for increment, ids in by_increment.items():
+                    # Processa em lotes para evitar limite de parâmetros SQL
+                    batch_size = 500
+                    for i in range(0, len(ids), batch_size):
+                        batch = ids[i:i + batch_size]
+                        placeholders = ','.join('?' * len(batch))
+                        cursor.execute(f'''
+                            UPDATE translations
+                            SET usage_count = usage_count + ?
+                            WHERE id IN ({placeholders})
+                        ''', [increment] + batch)
+                        updated += cursor.rowcount
+            return updated
+        except Exception as e:
+            # Devolve os contadores para a próxima tentativa
+            with self._usage_lock:
+                self._pending_usage.update(pending)
+            print(f"Erro ao gravar contadores de uso: {e}")
+            return 0
+
+    def get_pending_usage_count(self) -> int:
+        """Retorna o total de usos ainda não gravados no banco"""
+        with self._usage_lock:
+            return sum(self._pending_usage.values())
+
+    def _schedule_usage_flush(self):
+        """Agenda a próxima gravação automática dos contadores de uso"""
+        self._usage_timer = threading.Timer(self.USAGE_FLUSH_INTERVAL_SEC,
+                                            self._on_usage_flush_timer,
+                                            args=(self._pool,))
+        self._usage_timer.daemon = True
+        self._usage_timer.start()
+
+    def _on_usage_flush_timer(self, pool: ConnectionPool):
+        """Callback do timer: grava contadores e reagenda"""
+        # Ignora timers de uma conexão anterior (banco fechado ou trocado)
+        if pool is None or pool is not self._pool:
+            return
+
+        self.flush_usage_counts()
+        self._schedule_usage_flush()
+
+    def get_translations_batch(self, originals: List[str], source_lang: str = None,
+                               target_lang: str = None) -> Dict[str, str]:
         """
         Busca múltiplas traduções de uma vez (otimizado).
 
+        Textos ainda na fila de escrita ou já presentes no cache (inclusive
+        misses) não vão ao banco; os demais são consultados e armazenados no
+        cache. Com memórias anexadas, vale a tradução do banco de maior
+        prioridade.
+
         Args:
             originals: Lista de textos originais
+            source_lang: Idioma de origem (None = par padrão)
+            target_lang: Idioma de destino (None = par padrão)
 
         Returns:
             Dicionário {texto_original: texto_traduzido}
@@ -308,21 +1720,90 @@ class TranslationMemory:
         if not self.is_connected() or not originals:
             return {}
 
+        source_lang, target_lang = self._resolve_pair(source_lang, target_lang)
+
         try:
             results = {}
-            with self._get_cursor() as cursor:
-                # Processa em lotes para evitar limite de parâmetros SQL
+            wanted = set()
+            queue = self._write_queue
+
+            for text in set(originals):
+                if queue is not None:
+                    queued = queue.get((source_lang, target_lang, text))
+                    if queued is not None:
+                        results[text] = queued[0]
+                        continue
+
+                cached = self._lookup_cache.get((source_lang, target_lang, text))
+                if cached is LookupCache.MISSING:
+                    wanted.add(text)
+                elif cached is not None:
+                    results[text] = cached[1]
+
+            sources = self._lookup_sources()
+            hashes = {text: text_hash(text) for text in wanted}
+
+            # Hashes que o filtro de cada banco admite; os que nenhum filtro
+            # admite são misses certos e não vão ao banco
+            admitted = []
+            for _, _, bloom in sources:
+                if bloom is None:
+                    admitted.append(set(hashes.values()))
+                else:
+                    admitted.append({h for h in hashes.values() if bloom.might_contain(h)})
+
+            before = len(wanted)
+            any_admitted = set().union(*admitted)
+            wanted = {text for text in wanted if hashes[text] in any_admitted}
+            self._bloom_skips += before - len(wanted)
+
+            if not wanted:
+                return results
+
+            version = self._lookup_cache.version
+            found = {}
+            found_priority = {}
+            unique_hashes = list({hashes[text] for text in wanted})
+
+            with self._read_cursor() as cursor:
+                # Processa em lotes para evitar limite de parâmetros SQL; com
+                # memórias anexadas, cada lote é uma única consulta UNION ALL
                 batch_size = 500
-                for i in range(0, len(originals), batch_size):
-                    batch = originals[i:i + batch_size]
-                    placeholders = ','.join('?' * len(batch))
-                    cursor.execute(f'''
-                        SELECT original_text, translated_text FROM translations
-                        WHERE original_text IN ({placeholders})
-                    ''', batch)
-
-                    for row in cursor.fetchall():
-                        results[row[0]] = row[1]
+                for i in range(0, len(unique_hashes), batch_size):
+                    batch = unique_hashes[i:i + batch_size]
+                    branches = []
+                    params = []
+
+                    for (priority, schema, _), source_admitted in zip(sources, admitted):
+                        source_hashes = [h for h in batch if h in source_admitted]
+                        if not source_hashes:
+                            continue
+                        id_column = 'id' if priority == 0 else 'NULL'
+                        placeholders = ','.join('?' * len(source_hashes))
+                        branches.append(f'''
+                            SELECT {priority}, {id_column}, original_text, translated_text
+                            FROM {schema}.translations
+                            WHERE source_language = ? AND target_language = ?
+                              AND original_text_hash IN ({placeholders})
+                        ''')
+                        params.extend([source_lang, target_lang] + source_hashes)
+
+                    if not branches:
+                        continue
+
+                    cursor.execute(' UNION ALL '.join(branches), params)
+
+                    for priority, translation_id, original, translated in cursor.fetchall():
+                        # Confirma o texto completo (protege contra colisão de hash)
+                        if original in wanted and priority < found_priority.get(original, len(sources)):
+                            found[original] = (translation_id, translated)
+                            found_priority[original] = priority
+
+            for text in wanted:
+                value = found.get(text)
+                self._lookup_cache.put((source_lang, target_lang, text), value, version)
+                if value is not None:
+                    results[text] = value[1]
 
             return results
         except Exception as e:
@@ -332,7 +1813,9 @@ class TranslationMemory:
     def get_all_translations(self, category: str = None,
                             search_term: str = None,
                             limit: int = None,
-                            offset: int = 0) -> List[Dict]:
+                            offset: int = 0,
+                            source_lang: str = None,
+                            target_lang: str = None) -> List[Dict]:
         """
         Retorna todas as traduções com filtros opcionais
 
@@ -341,6 +1824,8 @@ class TranslationMemory:
             search_term: Termo de busca
             limit: Limite de resultados
             offset: Offset para paginação
+            source_lang: Filtrar por idioma de origem (None = todos)
+            target_lang: Filtrar por idioma de destino (None = todos)
 
         Returns:
             Lista de dicionários com dados das traduções
@@ -362,9 +1847,24 @@ class TranslationMemory:
                 query += ' AND category = ?'
                 params.append(category)
 
+            if source_lang:
+                query += ' AND source_language = ?'
+                params.append(source_lang)
+
+            if target_lang:
+                query += ' AND target_language = ?'
+                params.append(target_lang)
+
             if search_term:
-                query += ' AND (original_text LIKE ? OR translated_text LIKE ?)'
-                params.extend([f'%{search_term}%', f'%{search_term}%'])
+                fts_query = self._build_fts_query(search_term)
+                if fts_query:
+                    query += ''' AND id IN (
+                        SELECT rowid FROM translations_fts WHERE translations_fts MATCH ?
+                    )'''
+                    params.append(fts_query)
+                else:
+                    query += ' AND (original_text LIKE ? OR translated_text LIKE ?)'
+                    params.extend([f'%{search_term}%', f'%{search_term}%'])
 
             query += ' ORDER BY usage_count DESC, updated_at DESC'
 
@@ -372,29 +1872,114 @@ class TranslationMemory:
                 query += ' LIMIT ? OFFSET ?'
                 params.extend([limit, offset])
 
-            with self._lock:
-                self.cursor.execute(query, params)
-                rows = self.cursor.fetchall()
-
-            return [
-                {
-                    'id': row[0],
-                    'original_text': row[1],
-                    'translated_text': row[2],
-                    'source_language': row[3],
-                    'target_language': row[4],
-                    'category': row[5],
-                    'notes': row[6],
-                    'created_at': row[7],
-                    'updated_at': row[8],
-                    'usage_count': row[9]
-                }
-                for row in rows
-            ]
+            with self._read_cursor() as cursor:
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+
+            return [self._row_to_dict(row) for row in rows]
         except Exception as e:
             print(f"Erro ao buscar traduções: {e}")
             return []
 
+    def get_translations_page(self, after: Optional[Tuple[int, int]] = None,
+                              limit: int = 200, category: str = None,
+                              source_lang: str = None,
+                              target_lang: str = None) -> List[Dict]:
+        """
+        Retorna uma página de traduções usando paginação por chave (keyset).
+
+        As linhas seguem a ordem (usage_count DESC, id DESC). Em vez de OFFSET,
+        que percorre todas as linhas anteriores, a próxima página começa logo
+        após a última chave vista, então cada página custa o mesmo
+        independentemente do tamanho do banco.
+
+        Args:
+            after: Chave (usage_count, id) da última linha da página anterior
+                   (None = primeira página)
+            limit: Máximo de linhas da página
+            category: Filtrar por categoria
+            source_lang: Filtrar por idioma de origem (None = todos)
+            target_lang: Filtrar por idioma de destino (None = todos)
+
+        Returns:
+            Lista de dicionários com as traduções da página
+        """
+        if not self.is_connected():
+            return []
+
+        try:
+            filters = ''
+            filter_params = []
+
+            if category:
+                filters += ' AND category = ?'
+                filter_params.append(category)
+
+            if source_lang:
+                filters += ' AND source_language = ?'
+                filter_params.append(source_lang)
+
+            if target_lang:
+                filters += ' AND target_language = ?'
+                filter_params.append(target_lang)
+
+            select = '''
+                SELECT id, original_text, translated_text, source_language,
+                       target_language, category, notes, created_at,
+                       updated_at, usage_count
+                FROM translations
+            '''
+
+            rows = []
+            with self._read_cursor() as cursor:
+                if after is None:
+                    cursor.execute(
+                        select + f' WHERE 1=1{filters} ORDER BY usage_count DESC, id DESC LIMIT ?',
+                        filter_params + [limit]
+                    )
+                    rows = cursor.fetchall()
+                else:
+                    # (usage_count, id) < (?, ?) dividido em duas buscas no índice:
+                    # o SQLite não posiciona a comparação de row values na segunda
+                    # coluna em varreduras decrescentes, e percorreria todo o grupo
+                    # de mesmo usage_count (normalmente o maior) a cada página.
+                    usage_count, last_id = after
+                    cursor.execute(
+                        select + f' WHERE usage_count = ? AND id < ?{filters}'
+                                 ' ORDER BY id DESC LIMIT ?',
+                        [usage_count, last_id] + filter_params + [limit]
+                    )
+                    rows = cursor.fetchall()
+
+                    if len(rows) < limit:
+                        cursor.execute(
+                            select + f' WHERE usage_count < ?{filters}'
+                                     ' ORDER BY usage_count DESC, id DESC LIMIT ?',
+                            [usage_count] + filter_params + [limit - len(rows)]
+                        )
+                        rows.extend(cursor.fetchall())
+
+            return [self._row_to_dict(row) for row in rows]
+        except Exception as e:
+            print(f"Erro ao buscar página de traduções: {e}")
+            return []
+
+    @staticmethod
+    def _row_to_dict(row) -> Dict:
+        """Converte uma linha (10 primeiras colunas padrão) em dicionário"""
+        return {
+            'id': row[0],
+            'original_text': row[1],
+            'translated_text': row[2],
+            'source_language': row[3],
+            'target_language': row[4],
+            'category': row[5],
+            'notes': row[6],
+            'created_at': row[7],
+            'updated_at': row[8],
+            'usage_count': row[9]
+        }
+
     def get_translation_by_id(self, translation_id: int) -> Optional[Dict]:
         """
         Busca uma tradução pelo ID
@@ -409,8 +1994,8 @@ class TranslationMemory:
             return None
 
         try:
-            with self._lock:
-                self.cursor.execute('''
+            with self._read_cursor() as cursor:
+                cursor.execute('''
                     SELECT id, original_text, translated_text, source_language,
                            target_language, category, notes, created_at,
                            updated_at, usage_count
@@ -418,21 +2003,10 @@ class TranslationMemory:
                     WHERE id = ?
                 ''', (translation_id,))
 
-                row = self.cursor.fetchone()
+                row = cursor.fetchone()
 
             if row:
-                return {
-                    'id': row[0],
-                    'original_text': row[1],
-                    'translated_text': row[2],
-                    'source_language': row[3],
-                    'target_language': row[4],
-                    'category': row[5],
-                    'notes': row[6],
-                    'created_at': row[7],
-                    'updated_at': row[8],
-                    'usage_count': row[9]
-                }
+                return self._row_to_dict(row)
 
             return None
         except Exception as e:
@@ -486,7 +2060,10 @@ class TranslationMemory:
 
             with self._get_cursor() as cursor:
                 cursor.execute(query, params)
-                return cursor.rowcount > 0
+                updated = cursor.rowcount > 0
+
+            self._lookup_cache.invalidate_ids([translation_id])
+            return updated
 
         except Exception as e:
             print(f"Erro ao atualizar tradução: {e}")
@@ -508,7 +2085,10 @@ class TranslationMemory:
         try:
             with self._get_cursor() as cursor:
                 cursor.execute('DELETE FROM translations WHERE id = ?', (translation_id,))
-                return cursor.rowcount > 0
+                deleted = cursor.rowcount > 0
+
+            self._lookup_cache.invalidate_ids([translation_id])
+            return deleted
         except Exception as e:
             print(f"Erro ao deletar tradução: {e}")
             return False
@@ -533,7 +2113,10 @@ class TranslationMemory:
                 query = f'DELETE FROM translations WHERE id IN ({placeholders})'
 
                 cursor.execute(query, ids)
-                return cursor.rowcount
+                deleted = cursor.rowcount
+
+            self._lookup_cache.invalidate_ids(ids)
+            return deleted
         except Exception as e:
             print(f"Erro ao deletar múltiplas traduções: {e}")
             return 0
@@ -549,19 +2132,164 @@ class TranslationMemory:
             return []
 
         try:
-            with self._lock:
-                self.cursor.execute('SELECT DISTINCT category FROM translations ORDER BY category')
-                return [row[0] for row in self.cursor.fetchall()]
+            with self._read_cursor() as cursor:
+                cursor.execute('SELECT DISTINCT category FROM translations ORDER BY category')
+                return [row[0] for row in cursor.fetchall()]
         except Exception as e:
             print(f"Erro ao buscar categorias: {e}")
             return []
 
-    def export_to_file(self, filepath: str) -> bool:
+    def iter_translations(self, batch_size: int = None, category: str = None,
+                          source_lang: str = None,
+                          target_lang: str = None) -> Generator[Dict, None, None]:
+        """
+        Percorre todas as traduções em streaming, na ordem de inserção.
+
+        Lê em blocos com fetchmany em uma conexão somente leitura, então o
+        consumo de memória não depende do tamanho do banco. A leitura vê um
+        retrato consistente do banco enquanto o gerador estiver aberto.
+
+        Args:
+            batch_size: Linhas por fetchmany (padrão: EXPORT_FETCH_SIZE)
+            category: Filtrar por categoria
+            source_lang: Filtrar por idioma de origem (None = todos)
+            target_lang: Filtrar por idioma de destino (None = todos)
+
+        Yields:
+            Dicionários com os dados de cada tradução
+        """
+        if not self.is_connected():
+            return
+
+        batch_size = batch_size or self.EXPORT_FETCH_SIZE
+
+        query = '''
+            SELECT id, original_text, translated_text, source_language,
+                   target_language, category, notes, created_at,
+                   updated_at, usage_count
+            FROM translations
+            WHERE 1=1
+        '''
+        params = []
+
+        if category:
+            query += ' AND category = ?'
+            params.append(category)
+
+        if source_lang:
+            query += ' AND source_language = ?'
+            params.append(source_lang)
+
+        if target_lang:
+            query += ' AND target_language = ?'
+            params.append(target_lang)
+
+        query += ' ORDER BY id'
+
+        with self._read_cursor() as cursor:
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._row_to_dict(row)
+
+    @staticmethod
+    def detect_export_format(filepath: str) -> Tuple[str, Optional[str]]:
+        """
+        Deduz formato e compressão pela extensão do arquivo.
+
+        Ex.: 'memoria.tsv' -> ('tsv', None), 'memoria.jsonl.gz' -> ('jsonl', 'gzip')
+
+        Args:
+            filepath: Caminho do arquivo
+
+        Returns:
+            Tupla (formato, compressão)
+        """
+        name = filepath.lower()
+        compression = None
+
+        if name.endswith('.gz'):
+            compression = 'gzip'
+            name = name[:-3]
+        elif name.endswith('.zst'):
+            compression = 'zstd'
+            name = name[:-4]
+
+        if name.endswith('.tsv'):
+            return ('tsv', compression)
+        if name.endswith(('.jsonl', '.ndjson')):
+            return ('jsonl', compression)
+        if name.endswith('.tmx'):
+            return ('tmx', compression)
+        return ('csv', compression)
+
+    @staticmethod
+    def _open_export_file(filepath: str, compression: Optional[str]):
+        """Abre o arquivo de exportação em modo texto, com compressão opcional"""
+        if compression == 'gzip':
+            return gzip.open(filepath, 'wt', encoding='utf-8', newline='', compresslevel=6)
+
+        if compression == 'zstd':
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("Compressão zstd requer o pacote 'zstandard' (pip install zstandard)")
+            raw = open(filepath, 'wb')
+            writer = zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=True)
+            return io.TextIOWrapper(writer, encoding='utf-8', newline='')
+
+        if compression:
+            raise ValueError(f"Compressão não suportada: {compression}")
+
+        return open(filepath, 'w', encoding='utf-8', newline='')
+
+    @staticmethod
+    def _open_import_file(filepath: str, compression: Optional[str]) -> Tuple[BinaryIO, BinaryIO]:
+        """
+        Abre o arquivo de importação em modo binário, descompactando se preciso.
+
+        Returns:
+            Tupla (arquivo em disco, fluxo descompactado); a posição do
+            primeiro dá o progresso em bytes do arquivo
+        """
+        raw = open(filepath, 'rb')
+        try:
+            if compression == 'gzip':
+                return raw, gzip.GzipFile(fileobj=raw, mode='rb')
+
+            if compression == 'zstd':
+                if not ZSTD_AVAILABLE:
+                    raise RuntimeError("Compressão zstd requer o pacote 'zstandard' (pip install zstandard)")
+                return raw, zstandard.ZstdDecompressor().stream_reader(raw)
+
+            if compression:
+                raise ValueError(f"Compressão não suportada: {compression}")
+
+            return raw, raw
+        except Exception:
+            raw.close()
+            raise
+
+    def export_to_file(self, filepath: str, file_format: str = None,
+                       compression: str = None,
+                       progress_callback: Callable[[int, int], None] = None,
+                       batch_size: int = None) -> bool:
         """
-        Exporta a memória de tradução para um arquivo CSV
+        Exporta a memória de tradução em streaming
+
+        As linhas são lidas com fetchmany e escritas à medida que chegam,
+        mantendo o uso de memória constante em bancos de qualquer tamanho.
+        CSV e TSV mantêm as colunas lidas por import_from_file; JSON Lines
+        grava todos os campos de cada tradução; TMX grava cada tradução com
+        o próprio par de idiomas.
 
         Args:
             filepath: Caminho do arquivo de destino
+            file_format: 'csv', 'tsv', 'jsonl' ou 'tmx' (None = deduz pela extensão)
+            compression: 'gzip', 'zstd' ou None (None = deduz pela extensão)
+            progress_callback: Função (exportadas, total) chamada a cada bloco
+            batch_size: Linhas por bloco de leitura (padrão: EXPORT_FETCH_SIZE)
 
         Returns:
             True se a exportação foi bem-sucedida
@@ -569,36 +2297,87 @@ class TranslationMemory:
         if not self.is_connected():
             return False
 
-        try:
-            import csv
-
-            translations = self.get_all_translations()
+        # O arquivo exportado inclui as edições ainda na fila de escrita
+        self.flush_writes()
 
-            with open(filepath, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['ID', 'Original', 'Tradução', 'Categoria', 'Notas', 'Usos'])
-
-                for t in translations:
-                    writer.writerow([
-                        t['id'],
-                        t['original_text'],
-                        t['translated_text'],
-                        t['category'],
-                        t['notes'],
-                        t['usage_count']
-                    ])
+        try:
+            detected_format, detected_compression = self.detect_export_format(filepath)
+            file_format = file_format or detected_format
+            compression = compression or detected_compression
+            batch_size = batch_size or self.EXPORT_FETCH_SIZE
+
+            if file_format not in self.EXPORT_FORMATS:
+                raise ValueError(f"Formato de exportação não suportado: {file_format}")
+
+            total = 0
+            if progress_callback:
+                with self._read_cursor() as cursor:
+                    cursor.execute('SELECT COUNT(*) FROM translations')
+                    total = cursor.fetchone()[0]
+
+            translations = self.iter_translations(batch_size=batch_size)
+            exported = 0
+
+            with closing(translations), self._open_export_file(filepath, compression) as f:
+                if file_format == 'tmx':
+                    def counted():
+                        for written, t in enumerate(translations, 1):
+                            yield t
+                            if progress_callback and written % batch_size == 0:
+                                progress_callback(written, total)
+
+                    exported = write_tmx(f, counted(), self.source_language)
+                    if progress_callback:
+                        progress_callback(exported, total)
+                    return True
+
+                if file_format == 'jsonl':
+                    def write_batch(batch):
+                        f.writelines(json.dumps(t, ensure_ascii=False) + '\n' for t in batch)
+                else:
+                    writer = csv.writer(f, delimiter='\t' if file_format == 'tsv' else ',')
+                    writer.writerow(['ID', 'Original', 'Tradução', 'Categoria', 'Notas', 'Usos'])
+
+                    def write_batch(batch):
+                        writer.writerows(
+                            (t['id'], t['original_text'], t['translated_text'],
+                             t['category'], t['notes'], t['usage_count'])
+                            for t in batch
+                        )
+
+                while True:
+                    batch = list(islice(translations, batch_size))
+                    if not batch:
+                        break
+
+                    write_batch(batch)
+                    exported += len(batch)
+
+                    if progress_callback:
+                        progress_callback(exported, total)
 
             return True
         except Exception as e:
             print(f"Erro ao exportar memória: {e}")
             return False
 
-    def import_from_file(self, filepath: str) -> Tuple[int, int]:
+    def import_from_file(self, filepath: str,
+                         progress_callback: Callable[[int, int], None] = None) -> Tuple[int, int]:
         """
-        Importa traduções de um arquivo CSV
+        Importa traduções de um arquivo exportado por export_to_file
+
+        O formato e a compressão são deduzidos pela extensão, como na
+        exportação: CSV, TSV, JSON Lines ou TMX, opcionalmente .gz ou .zst.
+        O arquivo é lido em streaming e enviado direto para
+        add_translations_bulk, sem carregar todas as linhas na memória.
+        Em JSON Lines cada registro mantém o próprio par de idiomas; nos
+        demais formatos as traduções entram no par padrão. Durante a
+        importação o escritor usa o perfil 'bulk-import'.
 
         Args:
             filepath: Caminho do arquivo de origem
+            progress_callback: Função (bytes_lidos, bytes_totais) chamada
+                durante a importação (bytes do arquivo em disco)
 
         Returns:
             Tupla (importados, erros)
@@ -606,31 +2385,385 @@ class TranslationMemory:
         if not self.is_connected():
             return (0, 0)
 
+        file_format, compression = self.detect_export_format(filepath)
+        if file_format == 'tmx':
+            return self.import_from_tmx(filepath, progress_callback=progress_callback)
+
         try:
-            import csv
+            total_bytes = os.path.getsize(filepath)
+            raw, stream = self._open_import_file(filepath, compression)
+
+            with closing(raw), closing(stream), self._temporary_profile('bulk-import'):
+                f = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+
+                bulk_progress = None
+                if progress_callback:
+                    # Posição no arquivo em disco: progresso em bytes do arquivo
+                    def bulk_progress(processed, total):
+                        progress_callback(raw.tell(), total_bytes)
 
-            translations_to_import = []
+                if file_format == 'jsonl':
+                    return self._import_jsonl(f, bulk_progress)
 
-            with open(filepath, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                next(reader)  # Pula cabeçalho
+                reader = csv.reader(f, delimiter='\t' if file_format == 'tsv' else ',')
+                next(reader, None)  # Pula cabeçalho
 
-                for row in reader:
-                    try:
+                def rows():
+                    for row in reader:
                         if len(row) >= 2:
                             original = row[1] if len(row) > 1 else row[0]
                             translated = row[2] if len(row) > 2 else row[1]
-                            translations_to_import.append((original, translated))
-                    except Exception:
-                        pass
+                            yield (original, translated)
 
-            # Usa batch insert para performance
-            return self.add_translations_batch(translations_to_import, category='imported')
+                # Usa bulk insert para performance
+                return self.add_translations_bulk(rows(), category='imported',
+                                                  progress_callback=bulk_progress)
 
         except Exception as e:
             print(f"Erro ao importar memória: {e}")
             return (0, 0)
 
+    def _import_jsonl(self, f: io.TextIOBase,
+                      progress_callback: Callable[[int, int], None] = None) -> Tuple[int, int]:
+        """
+        Importa as linhas JSON Lines de export_to_file, um upsert em massa por
+        sequência de registros do mesmo par de idiomas
+
+        Returns:
+            Tupla (importados, erros)
+        """
+        def records():
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    yield (record.get('source_language'), record.get('target_language'),
+                           (record['original_text'], record['translated_text']))
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    # Registro inválido: contado como erro pelo upsert em massa
+                    yield (None, None, None)
+
+        inserted = 0
+        errors = 0
+        for (source_lang, target_lang), group in groupby(records(), key=lambda r: r[:2]):
+            ok, failed = self.add_translations_bulk((r[2] for r in group), source_lang, target_lang,
+                                                    category='imported',
+                                                    progress_callback=progress_callback)
+            inserted += ok
+            errors += failed
+        return (inserted, errors)
+
+    def import_from_tmx(self, filepath: str, source_lang: str = None,
+                        target_lang: str = None, category: str = 'imported',
+                        progress_callback: Callable[[int, int], None] = None) -> Tuple[int, int]:
+        """
+        Importa traduções de um arquivo TMX em streaming
+
+        Cada <tu> é lido, convertido em par (original, tradução) e descartado,
+        então o consumo de memória é constante. As variantes de idioma
+        (pt-BR, en-US...) são associadas ao par informado, ou ao par atual
+        da memória. Durante a importação o escritor usa o perfil
+        'bulk-import'.
+
+        Args:
+            filepath: Caminho do arquivo TMX (.tmx, .tmx.gz ou .tmx.zst)
+            source_lang: Idioma de origem (None = padrão da memória)
+            target_lang: Idioma de destino (None = padrão da memória)
+            category: Categoria das traduções importadas
+            progress_callback: Função (bytes_lidos, bytes_totais) chamada
+                durante a importação
+
+        Returns:
+            Tupla (importados, erros)
+        """
+        if not self.is_connected():
+            return (0, 0)
+
+        try:
+            source_lang, target_lang = self._resolve_pair(source_lang, target_lang)
+            total_bytes = os.path.getsize(filepath)
+            raw, stream = self._open_import_file(filepath, self.detect_export_format(filepath)[1])
+
+            with closing(raw), closing(stream), self._temporary_profile('bulk-import'):
+                bulk_progress = None
+                if progress_callback:
+                    def bulk_progress(processed, total):
+                        progress_callback(raw.tell(), total_bytes)
+
+                return self.add_translations_bulk(
+                    iter_tmx_pairs(stream, source_lang, target_lang),
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    category=category,
+                    progress_callback=bulk_progress
+                )
+
+        except Exception as e:
+            print(f"Erro ao importar TMX: {e}")
+            return (0, 0)
+
+    def merge_from(self, db_path: str, conflict_policy='last-writer-wins',
+                   progress_callback: Callable[[int, int], None] = None) -> Dict:
+        """
+        Mescla outra memória nesta, aplicando só o que mudou desde a última mesclagem.
+
+        A cada mesclagem são salvas em metadata duas marcas d'água de
+        updated_at: a maior da outra memória (o delta seguinte começa nela)
+        e a maior desta memória (linhas locais acima dela foram editadas
+        depois da mesclagem). Assim só as linhas alteradas são lidas e
+        gravadas; usage_count, datas, categoria e notas são preservados.
+
+        Uma linha alterada dos dois lados desde a última mesclagem, com
+        conteúdo diferente, é um conflito resolvido pela política:
+
+        - 'last-writer-wins': vence o updated_at mais recente (empate = local)
+        - 'keep-local' / 'keep-remote': vence sempre o mesmo lado
+        - função (linha_local, linha_remota) -> 'local' ou 'remote'
+
+        O delta remoto inclui o próprio segundo da marca para não perder
+        linhas novas gravadas nele; linhas desse segundo nunca sobrescrevem
+        uma versão local diferente. As marcas usam o relógio de cada
+        máquina: relógios muito adiantados podem atrasar a detecção de
+        alterações da outra memória.
+
+        Args:
+            db_path: Caminho da memória a mesclar (não é alterada, salvo migração de esquema)
+            conflict_policy: Nome da política ou função de resolução
+            progress_callback: Função (processadas, total) chamada após cada commit
+
+        Returns:
+            Dicionário com inserted, updated, unchanged, conflict_count e
+            conflicts (até MERGE_MAX_CONFLICT_DETAILS conflitos detalhados)
+        """
+        report = {'inserted': 0, 'updated': 0, 'unchanged': 0,
+                  'conflict_count': 0, 'conflicts': []}
+
+        if not self.is_connected():
+            return report
+
+        resolve = self._merge_resolver(conflict_policy)
+        if resolve is None:
+            print(f"Política de conflito desconhecida: {conflict_policy}")
+            return report
+
+        db_path = os.path.abspath(db_path)
+        if db_path == os.path.abspath(self.db_path):
+            print("Uma memória não pode ser mesclada com ela mesma")
+            return report
+
+        # Edições enfileiradas e usos pendentes entram na comparação
+        self.flush_writes()
+        self.flush_usage_counts()
+
+        try:
+            self._prepare_peer_schema(db_path)
+
+            with closing(sqlite3.connect(Path(db_path).as_uri() + '?mode=ro', uri=True)) as remote:
+                remote.row_factory = sqlite3.Row
+                row = remote.execute("SELECT value FROM metadata WHERE key = 'memory_id'").fetchone()
+                state_key = f"sync:{row[0] if row else ''}:{db_path}"
+
+                try:
+                    state = json.loads(self.get_metadata(state_key, '{}'))
+                except (TypeError, ValueError):
+                    state = {}
+                remote_mark = state.get('remote')
+                local_mark = state.get('local')
+                marks = (remote_mark, local_mark)
+
+                where = 'WHERE updated_at >= ?' if remote_mark else ''
+                params = (remote_mark,) if remote_mark else ()
+                total = remote.execute(f'SELECT COUNT(*) FROM translations {where}', params).fetchone()[0]
+                rows = remote.execute(f'''
+                    SELECT original_text, original_text_hash, translated_text,
+                           source_language, target_language, category, notes,
+                           created_at, updated_at, usage_count
+                    FROM translations {where}
+                    ORDER BY updated_at, id
+                ''', params)
+
+                processed = 0
+                exhausted = False
+
+                while not exhausted:
+                    written_keys = []
+
+                    with self._transaction() as cursor:
+                        fts_after_id = None
+                        fts_suspended = False
+                        in_transaction = 0
+
+                        while in_transaction < self.BULK_COMMIT_EVERY:
+                            chunk = rows.fetchmany(self.BULK_CHUNK_SIZE)
+                            if not chunk:
+                                exhausted = True
+                                break
+
+                            if (not fts_suspended and
+                                    max(total, processed + len(chunk)) >= self.FTS_SUSPEND_MIN_ROWS):
+                                fts_after_id = self._suspend_fts_sync(cursor)
+                                fts_suspended = True
+
+                            written_keys.extend(
+                                self._merge_chunk(cursor, chunk, marks, resolve, report)
+                            )
+                            if chunk[-1]['updated_at']:
+                                remote_mark = max(remote_mark or '', chunk[-1]['updated_at'])
+                            in_transaction += len(chunk)
+                            processed += len(chunk)
+
+                        self._resume_fts_sync(cursor, fts_after_id)
+
+                    self._lookup_cache.invalidate(written_keys)
+                    self._ensure_bloom_capacity()
+
+                    if progress_callback and in_transaction:
+                        progress_callback(processed, total)
+
+            with self._read_cursor() as cursor:
+                local_max = cursor.execute('SELECT MAX(updated_at) FROM translations').fetchone()[0]
+
+            self.set_metadata(state_key, json.dumps({
+                'remote': remote_mark,
+                'local': local_max,
+                'merged_at': datetime.now().isoformat(),
+            }))
+            return report
+        except Exception as e:
+            print(f"Erro ao mesclar memória: {e}")
+            return report
+
+    def _merge_resolver(self, conflict_policy) -> Optional[Callable[[Dict, Dict], str]]:
+        """Função de resolução de conflitos para um nome de política (ou a própria função)"""
+        if callable(conflict_policy):
+            return conflict_policy
+        if conflict_policy == 'last-writer-wins':
+            return lambda local, remote: (
+                'remote' if (remote['updated_at'] or '') > (local['updated_at'] or '') else 'local'
+            )
+        if conflict_policy == 'keep-local':
+            return lambda local, remote: 'local'
+        if conflict_policy == 'keep-remote':
+            return lambda local, remote: 'remote'
+        return None
+
+    def _merge_chunk(self, cursor: sqlite3.Cursor, chunk: List[sqlite3.Row],
+                     marks: Tuple[Optional[str], Optional[str]],
+                     resolve: Callable[[Dict, Dict], str],
+                     report: Dict) -> List[Tuple[str, str, str]]:
+        """
+        Aplica um bloco de linhas remotas (dentro da transação de merge_from).
+
+        Args:
+            marks: Marcas (remota, local) da mesclagem anterior
+
+        Returns:
+            Chaves do cache alteradas
+        """
+        remote_mark, local_mark = marks
+
+        # Uma consulta por par de idiomas: o índice único começa pelo par
+        hashes_by_pair = defaultdict(set)
+        for row in chunk:
+            hashes_by_pair[(row['source_language'], row['target_language'])].add(
+                row['original_text_hash'])
+
+        local_rows = {}
+        for (source_lang, target_lang), pair_hashes in hashes_by_pair.items():
+            placeholders = ','.join('?' * len(pair_hashes))
+            cursor.execute(f'''
+                SELECT id, original_text, translated_text, source_language, target_language,
+                       category, notes, created_at, updated_at, usage_count
+                FROM translations
+                WHERE source_language = ? AND target_language = ?
+                  AND original_text_hash IN ({placeholders})
+            ''', [source_lang, target_lang] + list(pair_hashes))
+            for row in cursor.fetchall():
+                local_rows[(source_lang, target_lang, row['original_text'])] = row
+
+        inserts = []
+        updates = []
+        usage_updates = []
+        changed_keys = []
+
+        for remote in chunk:
+            key = (remote['source_language'], remote['target_language'], remote['original_text'])
+            local = local_rows.get(key)
+
+            if local is None:
+                inserts.append(tuple(remote))
+                changed_keys.append(key)
+                continue
+
+            same = (local['translated_text'] == remote['translated_text']
+                    and local['category'] == remote['category']
+                    and local['notes'] == remote['notes'])
+            if same:
+                report['unchanged'] += 1
+                if (remote['usage_count'] or 0) > (local['usage_count'] or 0):
+                    usage_updates.append((remote['usage_count'], local['id']))
+                continue
+
+            # Linha do segundo da marca anterior: já vista, a versão local foi
+            # mantida de propósito (conflito resolvido ou edição posterior)
+            if remote_mark is not None and (remote['updated_at'] or '') <= remote_mark:
+                report['unchanged'] += 1
+                continue
+
+            # Sem edição local desde a última mesclagem: só avança para a versão remota
+            winner = 'remote'
+            if local_mark is None or (local['updated_at'] or '') > local_mark:
+                winner = resolve(dict(local), dict(remote))
+                report['conflict_count'] += 1
+                if len(report['conflicts']) < self.MERGE_MAX_CONFLICT_DETAILS:
+                    report['conflicts'].append({
+                        'original_text': remote['original_text'],
+                        'source_language': remote['source_language'],
+                        'target_language': remote['target_language'],
+                        'local_text': local['translated_text'],
+                        'remote_text': remote['translated_text'],
+                        'local_updated_at': local['updated_at'],
+                        'remote_updated_at': remote['updated_at'],
+                        'resolution': winner,
+                    })
+
+            if winner == 'remote':
+                updates.append((remote['translated_text'], remote['category'], remote['notes'],
+                                remote['updated_at'], remote['usage_count'] or 0,
+                                remote['created_at'], local['id']))
+                changed_keys.append(key)
+            else:
+                report['unchanged'] += 1
+
+        if inserts:
+            self._bloom_add(row[1] for row in inserts)
+            cursor.executemany('''
+                INSERT INTO translations
+                (original_text, original_text_hash, translated_text, source_language,
+                 target_language, category, notes, created_at, updated_at, usage_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(source_language, target_language, original_text_hash) DO NOTHING
+            ''', inserts)
+            # Colisão de hash com outro texto: a linha é ignorada (rowcount não a conta)
+            report['inserted'] += cursor.rowcount
+
+        if updates:
+            cursor.executemany('''
+                UPDATE translations SET
+                    translated_text = ?, category = ?, notes = ?, updated_at = ?,
+                    usage_count = MAX(usage_count, ?),
+                    created_at = MIN(created_at, COALESCE(?, created_at))
+                WHERE id = ?
+            ''', updates)
+            report['updated'] += len(updates)
+
+        if usage_updates:
+            cursor.executemany('UPDATE translations SET usage_count = ? WHERE id = ?',
+                               usage_updates)
+
+        return changed_keys
+
     def clear_all(self) -> bool:
         """
         Limpa toda a memória de tradução
@@ -641,9 +2774,23 @@ class TranslationMemory:
         if not self.is_connected():
             return False
 
+        # Edições enfileiradas antes da limpeza não podem reaparecer depois dela
+        self.flush_writes()
+
         try:
-            with self._get_cursor() as cursor:
-                cursor.execute('DELETE FROM translations')
+            # Troca do filtro no mesmo lock da exclusão: nenhuma escrita entre as duas
+            with self._lock:
+                with self._get_cursor() as cursor:
+                    cursor.execute('DELETE FROM translations')
+
+                if self._bloom is not None:
+                    self._bloom = BloomFilter(self.BLOOM_MIN_CAPACITY, self.BLOOM_FALSE_POSITIVE_RATE)
+                    self._bloom_dirty = True
+
+            self._lookup_cache.clear()
+
+            with self._usage_lock:
+                self._pending_usage.clear()
             return True
         except Exception as e:
             print(f"Erro ao limpar memória: {e}")
@@ -661,25 +2808,41 @@ class TranslationMemory:
                 'total_translations': 0,
                 'total_usage': 0,
                 'categories': 0,
-                'db_path': None
+                'language_pairs': 0,
+                'db_path': None,
+                'lookup_cache': self._lookup_cache.get_stats(),
+                'bloom_filter': self._get_bloom_stats(),
+                'attached_memories': self.get_attached_memories()
             }
 
         try:
-            with self._lock:
-                self.cursor.execute('SELECT COUNT(*) FROM translations')
-                total = self.cursor.fetchone()[0]
+            with self._read_cursor() as cursor:
+                cursor.execute('SELECT COUNT(*) FROM translations')
+                total = cursor.fetchone()[0]
+
+                cursor.execute('SELECT SUM(usage_count) FROM translations')
+                total_usage = cursor.fetchone()[0] or 0
+                total_usage += self.get_pending_usage_count()
 
-                self.cursor.execute('SELECT SUM(usage_count) FROM translations')
-                total_usage = self.cursor.fetchone()[0] or 0
+                cursor.execute('SELECT COUNT(DISTINCT category) FROM translations')
+                categories = cursor.fetchone()[0]
 
-                self.cursor.execute('SELECT COUNT(DISTINCT category) FROM translations')
-                categories = self.cursor.fetchone()[0]
+                cursor.execute('''
+                    SELECT COUNT(*) FROM (
+                        SELECT DISTINCT source_language, target_language FROM translations
+                    )
+                ''')
+                language_pairs = cursor.fetchone()[0]
 
             return {
                 'total_translations': total,
                 'total_usage': total_usage,
                 'categories': categories,
-                'db_path': self.db_path
+                'language_pairs': language_pairs,
+                'db_path': self.db_path,
+                'lookup_cache': self._lookup_cache.get_stats(),
+                'bloom_filter': self._get_bloom_stats(),
+                'attached_memories': self.get_attached_memories()
             }
         except Exception as e:
             print(f"Erro ao obter estatísticas: {e}")
@@ -687,9 +2850,129 @@ class TranslationMemory:
                 'total_translations': 0,
                 'total_usage': 0,
                 'categories': 0,
-                'db_path': self.db_path
+                'language_pairs': 0,
+                'db_path': self.db_path,
+                'lookup_cache': self._lookup_cache.get_stats(),
+                'bloom_filter': self._get_bloom_stats(),
+                'attached_memories': self.get_attached_memories()
             }
 
+    def _get_bloom_stats(self) -> Dict:
+        """Estatísticas do filtro de Bloom (vazias se desativado)"""
+        bloom = self._bloom
+        return {
+            'enabled': bloom is not None,
+            'capacity': bloom.capacity if bloom else 0,
+            'keys': bloom.count if bloom else 0,
+            'size_bytes': bloom.size_bytes if bloom else 0,
+            'skipped_lookups': self._bloom_skips,
+        }
+
+    def search_fulltext(self, term: str, limit: int = 50, offset: int = 0,
+                        category: str = None, source_lang: str = None,
+                        target_lang: str = None, highlight: Tuple[str, str] = ('[', ']'),
+                        snippet_tokens: int = 16) -> List[Dict]:
+        """
+        Busca ranqueada no índice FTS5, paginada e com trechos destacados.
+
+        Os resultados são ordenados por relevância (bm25). Cada dicionário
+        traz os campos de get_all_translations mais 'rank',
+        'original_snippet' e 'translated_snippet'. Sem índice disponível (ou
+        termo curto demais), cai para LIKE ordenado por uso, com os trechos
+        iguais aos textos completos.
+
+        Args:
+            term: Termo de busca
+            limit: Máximo de resultados da página
+            offset: Deslocamento da página
+            category: Filtrar por categoria
+            source_lang: Filtrar por idioma de origem (None = todos)
+            target_lang: Filtrar por idioma de destino (None = todos)
+            highlight: Marcadores (início, fim) em volta dos trechos encontrados
+            snippet_tokens: Tamanho máximo aproximado de cada trecho em tokens
+
+        Returns:
+            Lista de dicionários com os resultados
+        """
+        if not self.is_connected() or not term or not term.strip():
+            return []
+
+        fts_query = self._build_fts_query(term)
+        if fts_query is None:
+            results = self.get_all_translations(category=category, search_term=term,
+                                                limit=limit, offset=offset,
+                                                source_lang=source_lang,
+                                                target_lang=target_lang)
+            for rank, result in enumerate(results):
+                result['rank'] = float(offset + rank)
+                result['original_snippet'] = result['original_text']
+                result['translated_snippet'] = result['translated_text']
+            return results
+
+        try:
+            query = '''
+                SELECT t.id, t.original_text, t.translated_text, t.source_language,
+                       t.target_language, t.category, t.notes, t.created_at,
+                       t.updated_at, t.usage_count,
+                       bm25(translations_fts) AS rank,
+                       snippet(translations_fts, 0, ?, ?, '…', ?),
+                       snippet(translations_fts, 1, ?, ?, '…', ?)
+                FROM translations_fts
+                JOIN translations t ON t.id = translations_fts.rowid
+                WHERE translations_fts MATCH ?
+            '''
+            start, end = highlight
+            params = [start, end, snippet_tokens, start, end, snippet_tokens, fts_query]
+
+            if category:
+                query += ' AND t.category = ?'
+                params.append(category)
+
+            if source_lang:
+                query += ' AND t.source_language = ?'
+                params.append(source_lang)
+
+            if target_lang:
+                query += ' AND t.target_language = ?'
+                params.append(target_lang)
+
+            query += ' ORDER BY rank LIMIT ? OFFSET ?'
+            params.extend([limit, offset])
+
+            with self._read_cursor() as cursor:
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+
+            results = []
+            for row in rows:
+                result = self._row_to_dict(row)
+                result['rank'] = row[10]
+                result['original_snippet'] = row[11]
+                result['translated_snippet'] = row[12]
+                results.append(result)
+            return results
+        except Exception as e:
+            print(f"Erro na busca de texto completo: {e}")
+            return []
+
+    def search_translations(self, term: str, limit: int = 100) -> List[Tuple[str, str]]:
+        """
+        Busca pares (original, tradução) por termo, usada pelo motor de sugestões.
+
+        Args:
+            term: Termo de busca (vazio = traduções mais usadas)
+            limit: Máximo de resultados
+
+        Returns:
+            Lista de tuplas (texto_original, texto_traduzido)
+        """
+        if term and term.strip():
+            results = self.search_fulltext(term, limit=limit)
+        else:
+            results = self.get_all_translations(limit=limit)
+
+        return [(r['original_text'], r['translated_text']) for r in results]
+
     def search(self, term: str) -> List[Dict]:
         """
         Busca traduções por termo
@@ -702,11 +2985,18 @@ class TranslationMemory:
         """
         return self.get_all_translations(search_term=term)
 
-    def vacuum(self) -> bool:
+    def vacuum(self, full: bool = False) -> bool:
         """
-        Otimiza o banco de dados (recupera espaço e reorganiza índices).
+        Recupera o espaço livre do banco sem travar as leituras.
+
+        Com auto_vacuum incremental, as páginas livres são devolvidas em
+        fatias de VACUUM_SLICE_PAGES e o lock do escritor é solto entre
+        elas, então edições e buscas continuam durante a operação. Bancos
+        criados antes do modo incremental (ou full=True) passam por um
+        VACUUM completo, que faz a conversão uma única vez.
 
-        Recomendado após grandes exclusões.
+        Args:
+            full: Força a reconstrução completa do arquivo
 
         Returns:
             True se executou com sucesso
@@ -715,22 +3005,269 @@ class TranslationMemory:
             return False
 
         try:
-            with self._lock:
-                self.conn.execute('VACUUM')
+            if full or self._get_auto_vacuum_mode() != 'incremental':
+                with self._lock:
+                    self.conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+                    self.conn.execute('VACUUM')
+                return True
+
+            while self.incremental_vacuum() > 0:
+                pass
             return True
         except Exception as e:
             print(f"Erro ao otimizar banco: {e}")
             return False
 
+    def incremental_vacuum(self, pages: int = None) -> int:
+        """
+        Devolve ao sistema uma fatia das páginas livres do banco.
+
+        Só tem efeito com auto_vacuum incremental (bancos novos ou
+        convertidos por vacuum()).
+
+        Args:
+            pages: Máximo de páginas liberadas (None = VACUUM_SLICE_PAGES)
+
+        Returns:
+            Número de páginas liberadas
+        """
+        if not self.is_connected():
+            return 0
+
+        pages = max(1, int(pages or self.VACUUM_SLICE_PAGES))
+
+        try:
+            with self._lock:
+                before = self.conn.execute('PRAGMA freelist_count').fetchone()[0]
+                if not before:
+                    return 0
+                # execute() avança o PRAGMA um único passo (uma página);
+                # executescript() o executa até o fim
+                self.conn.executescript(f'PRAGMA incremental_vacuum({pages})')
+                after = self.conn.execute('PRAGMA freelist_count').fetchone()[0]
+            return before - after
+        except Exception as e:
+            print(f"Erro ao liberar páginas livres: {e}")
+            return 0
+
+    def checkpoint(self, mode: str = 'PASSIVE') -> Optional[Tuple[int, int, int]]:
+        """
+        Executa um checkpoint do WAL.
+
+        PASSIVE copia o que for possível sem esperar leitores; TRUNCATE
+        também zera o arquivo -wal (precisa que nenhum leitor esteja no meio
+        de uma consulta).
+
+        Args:
+            mode: 'PASSIVE', 'FULL', 'RESTART' ou 'TRUNCATE'
+
+        Returns:
+            Tupla (ocupado, páginas_no_wal, páginas_copiadas) ou None em erro
+        """
+        mode = mode.upper()
+        if mode not in self.CHECKPOINT_MODES:
+            print(f"Modo de checkpoint inválido: {mode}")
+            return None
+
+        if not self.is_connected():
+            return None
+
+        try:
+            with self._lock:
+                row = self.conn.execute(f'PRAGMA wal_checkpoint({mode})').fetchone()
+            return (row[0], row[1], row[2])
+        except Exception as e:
+            print(f"Erro no checkpoint do WAL: {e}")
+            return None
+
+    def optimize(self) -> bool:
+        """
+        Atualiza as estatísticas do planejador onde elas estão desatualizadas.
+
+        Usa PRAGMA optimize, que só analisa as tabelas que precisam (com o
+        custo limitado por ANALYSIS_LIMIT).
+
+        Returns:
+            True se executou com sucesso
+        """
+        if not self.is_connected():
+            return False
+
+        try:
+            with self._lock:
+                self.conn.execute('PRAGMA optimize')
+            self._last_optimize = time.monotonic()
+            return True
+        except Exception as e:
+            print(f"Erro ao otimizar estatísticas: {e}")
+            return False
+
+    def analyze(self) -> bool:
+        """
+        Recalcula as estatísticas de todos os índices (ANALYZE).
+
+        Returns:
+            True se executou com sucesso
+        """
+        if not self.is_connected():
+            return False
+
+        try:
+            with self._lock:
+                self.conn.execute('ANALYZE')
+                self.conn.commit()
+            self._last_optimize = time.monotonic()
+            return True
+        except Exception as e:
+            print(f"Erro ao analisar banco: {e}")
+            return False
+
+    def _get_auto_vacuum_mode(self) -> str:
+        """Modo de auto_vacuum do banco ('none', 'full' ou 'incremental')"""
+        with self._read_cursor() as cursor:
+            cursor.execute('PRAGMA auto_vacuum')
+            mode = cursor.fetchone()[0]
+        return {0: 'none', 1: 'full', 2: 'incremental'}.get(mode, 'none')
+
+    def get_maintenance_stats(self) -> Dict:
+        """
+        Retorna estatísticas de armazenamento do banco.
+
+        Returns:
+            Dicionário com páginas, páginas livres, fragmentação (% de
+            páginas livres), tamanho do arquivo e do WAL, modo de auto_vacuum
+            e perfil de desempenho
+        """
+        if not self.is_connected():
+            return {}
+
+        try:
+            with self._read_cursor() as cursor:
+                page_size = cursor.execute('PRAGMA page_size').fetchone()[0]
+                page_count = cursor.execute('PRAGMA page_count').fetchone()[0]
+                freelist = cursor.execute('PRAGMA freelist_count').fetchone()[0]
+
+            wal_path = self.db_path + '-wal'
+            return {
+                'page_size': page_size,
+                'page_count': page_count,
+                'freelist_count': freelist,
+                'fragmentation': (freelist / page_count * 100) if page_count else 0,
+                'reclaimable_bytes': freelist * page_size,
+                'file_bytes': os.path.getsize(self.db_path),
+                'wal_bytes': os.path.getsize(wal_path) if os.path.exists(wal_path) else 0,
+                'auto_vacuum': self._get_auto_vacuum_mode(),
+                'performance_profile': self._performance_profile,
+            }
+        except Exception as e:
+            print(f"Erro ao obter estatísticas de armazenamento: {e}")
+            return {}
+
+    def is_idle(self, seconds: float = None) -> bool:
+        """
+        Verifica se o banco está sem atividade há algum tempo.
+
+        Args:
+            seconds: Tempo mínimo sem consultas (None = MAINTENANCE_IDLE_SEC)
+
+        Returns:
+            True se não houve leitura, escrita nem edição pendente no período
+        """
+        if seconds is None:
+            seconds = self.MAINTENANCE_IDLE_SEC
+        if self.get_pending_write_count():
+            return False
+        return time.monotonic() - self._last_activity >= seconds
+
+    def run_maintenance(self) -> Dict:
+        """
+        Executa um passo de manutenção.
+
+        Cada etapa adquire o lock separadamente, então escritas e leituras
+        podem se intercalar entre elas:
+
+        - checkpoint PASSIVE do WAL (TRUNCATE se o -wal passou de
+          WAL_TRUNCATE_BYTES)
+        - uma fatia de incremental_vacuum se houver VACUUM_MIN_FREE_PAGES
+          páginas livres
+        - PRAGMA optimize a cada OPTIMIZE_INTERVAL_SEC
+
+        Returns:
+            Dicionário com o que foi feito em cada etapa
+        """
+        report = {'checkpoint': None, 'freed_pages': 0, 'optimized': False}
+        if not self.is_connected():
+            return report
+
+        stats = self.get_maintenance_stats()
+        if not stats:
+            return report
+
+        mode = 'TRUNCATE' if stats['wal_bytes'] > self.WAL_TRUNCATE_BYTES else 'PASSIVE'
+        report['checkpoint'] = self.checkpoint(mode)
+
+        if stats['auto_vacuum'] == 'incremental' and stats['freelist_count'] >= self.VACUUM_MIN_FREE_PAGES:
+            report['freed_pages'] = self.incremental_vacuum()
+
+        if time.monotonic() - self._last_optimize >= self.OPTIMIZE_INTERVAL_SEC:
+            report['optimized'] = self.optimize()
+
+        return report
+
+    def _schedule_maintenance(self):
+        """Agenda o próximo passo de manutenção em segundo plano"""
+        self._maintenance_timer = threading.Timer(self.MAINTENANCE_INTERVAL_SEC,
+                                                  self._on_maintenance_timer,
+                                                  args=(self._pool,))
+        self._maintenance_timer.daemon = True
+        self._maintenance_timer.start()
+
+    def _on_maintenance_timer(self, pool: ConnectionPool):
+        """Callback do timer: faz a manutenção se o banco estiver ocioso e reagenda"""
+        # Ignora timers de uma conexão anterior (banco fechado ou trocado)
+        if pool is None or pool is not self._pool:
+            return
+
+        if self.is_idle():
+            self.run_maintenance()
+        self._schedule_maintenance()
+
     def close(self):
         """Fecha a conexão com o banco de dados de forma segura"""
+        # Antes do lock: a thread da fila precisa dele para gravar as pendências
+        self._close_write_queue()
+
+        if self._usage_timer:
+            self._usage_timer.cancel()
+            self._usage_timer = None
+
+        if self._maintenance_timer:
+            self._maintenance_timer.cancel()
+            self._maintenance_timer = None
+
         with self._lock:
-            if self.conn:
+            if self._pool:
+                # Grava contadores de uso pendentes antes de fechar
+                self.flush_usage_counts()
+
+                try:
+                    self._save_bloom_filter()
+                except Exception as e:
+                    print(f"Erro ao salvar filtro de Bloom: {e}")
+
+                try:
+                    # Recomendado antes de fechar conexões de longa duração
+                    self.conn.execute('PRAGMA optimize')
+                except Exception:
+                    pass
+
                 try:
-                    self.conn.close()
+                    self._pool.close()
                 except Exception:
                     pass
                 finally:
+                    self._attached = []
+                    self._pool = None
                     self.conn = None
                     self.cursor = None
 
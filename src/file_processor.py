@@ -6,24 +6,62 @@ Melhorias implementadas:
 - Detecção automática de encoding
 - Suporte a múltiplos encodings (UTF-8, Latin-1, etc.)
 - Melhor tratamento de erros
+- Arquivo mapeado em memória (mmap) uma única vez e decodificado sobre o
+  mesmo buffer
+- Detecção incremental de encoding (BOM, validação UTF-8, chardet em blocos)
+  com cache por (caminho, tamanho, mtime)
 """
 
 import re
 import json
+import codecs
+import mmap
+import threading
 import xml.etree.ElementTree as ET
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, Iterable, Iterator
 from dataclasses import dataclass
 import shutil
 import os
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
+from contextlib import contextmanager
+
+from interval_index import IntervalIndex
+from json_extractor import PathTrie, iter_json_strings
+from regex_profiles import compile_profile
+from xml_extractor import XmlSelector, iter_xml_nodes
+
+
+# Amostra usada pela heurística quando o chardet não resolve
+ENCODING_SAMPLE_BYTES = 64 * 1024
+
+# Blocos da validação UTF-8 e do chardet (nenhum dos dois copia o arquivo inteiro)
+ENCODING_CHUNK_BYTES = 1024 * 1024
+
+# Resultados guardados por (caminho, tamanho, mtime)
+ENCODING_CACHE_SIZE = 256
+
+# Byte Order Marks, do mais longo para o mais curto (UTF-32 começa como UTF-16)
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+_encoding_cache: OrderedDict = OrderedDict()
+_encoding_cache_lock = threading.Lock()
 
 
 def detect_encoding(filepath: str) -> str:
     """
     Detecta o encoding de um arquivo automaticamente.
 
-    Tenta usar chardet se disponível, caso contrário usa heurística simples.
+    O arquivo é lido em blocos (nada fica mapeado ou carregado inteiro) e o
+    resultado fica em cache por (caminho, tamanho, mtime): abrir de novo um
+    arquivo que não mudou não repete a detecção.
 
     Args:
         filepath: Caminho do arquivo
@@ -32,47 +70,186 @@ def detect_encoding(filepath: str) -> str:
         Nome do encoding detectado (ex: 'utf-8', 'latin-1')
     """
     try:
-        # Tenta usar chardet para detecção precisa
-        import chardet
-
         with open(filepath, 'rb') as f:
-            raw_data = f.read()
-            result = chardet.detect(raw_data)
-            encoding = result.get('encoding', 'utf-8')
-            confidence = result.get('confidence', 0)
+            cache_key = _encoding_cache_key(filepath, f)
+            encoding = _get_cached_encoding(cache_key)
+            if encoding is None:
+                encoding = detect_buffer_encoding(_FileSlices(f))
+                _cache_encoding(cache_key, encoding)
+            return encoding
+    except Exception:
+        return 'utf-8'
+
+
+def detect_buffer_encoding(buffer, sample_size: Optional[int] = None) -> str:
+    """
+    Detecta o encoding de um buffer (bytes ou mmap) de forma incremental.
 
-            # Se confiança for baixa, usa fallback
-            if confidence < 0.7:
-                encoding = _detect_encoding_fallback(raw_data)
+    Ordem: BOM, validação UTF-8 estrita em blocos e, se o conteúdo não for
+    UTF-8, chardet (ou heurística simples se indisponível).
 
-            return encoding or 'utf-8'
+    Args:
+        buffer: Conteúdo do arquivo (qualquer objeto com fatiamento de bytes)
+        sample_size: Bytes analisados pela heurística (None = ENCODING_SAMPLE_BYTES)
 
+    Returns:
+        Nome do encoding detectado
+    """
+    encoding = _bom_encoding(buffer)
+    if encoding:
+        return encoding
+
+    if _is_utf8(buffer):
+        return 'utf-8'
+
+    return _detect_non_utf8_encoding(buffer, sample_size)
+
+
+def _bom_encoding(buffer) -> Optional[str]:
+    """Encoding indicado pelo BOM no início do buffer (None se não houver)"""
+    head = buffer[:4]
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    return None
+
+
+def _is_utf8(buffer) -> bool:
+    """Validação UTF-8 estrita, em blocos, sem montar o texto inteiro"""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        for offset in range(0, len(buffer), ENCODING_CHUNK_BYTES):
+            decoder.decode(buffer[offset:offset + ENCODING_CHUNK_BYTES])
+        decoder.decode(b'', final=True)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def _detect_non_utf8_encoding(buffer, sample_size: Optional[int] = None) -> str:
+    """
+    Detecta o encoding de um conteúdo que já se sabe não ser UTF-8.
+
+    O chardet recebe o buffer em blocos e para assim que atinge confiança;
+    sem ele (ou com confiança baixa) vale a heurística sobre uma amostra.
+    """
+    sample = buffer[:sample_size or ENCODING_SAMPLE_BYTES]
+
+    try:
+        # Tenta usar chardet para detecção precisa
+        from chardet.universaldetector import UniversalDetector
     except ImportError:
         # chardet não disponível, usa fallback
-        with open(filepath, 'rb') as f:
-            raw_data = f.read()
-            return _detect_encoding_fallback(raw_data)
+        return _detect_encoding_fallback(sample, try_utf8=False)
 
-    except Exception:
-        return 'utf-8'
+    detector = UniversalDetector()
+    for offset in range(0, len(buffer), ENCODING_SAMPLE_BYTES):
+        detector.feed(buffer[offset:offset + ENCODING_SAMPLE_BYTES])
+        if detector.done:
+            break
+    detector.close()
+
+    encoding = detector.result.get('encoding')
+    confidence = detector.result.get('confidence') or 0
 
+    # Se confiança for baixa, usa fallback
+    if not encoding or confidence < 0.7:
+        encoding = _detect_encoding_fallback(sample, try_utf8=False)
 
-def _detect_encoding_fallback(raw_data: bytes) -> str:
+    return encoding
+
+
+def _encoding_cache_key(filepath: str, f) -> tuple:
+    """Chave do cache de encodings: muda quando o arquivo é alterado"""
+    stat = os.fstat(f.fileno())
+    return (os.path.abspath(filepath), stat.st_size, stat.st_mtime_ns)
+
+
+def _get_cached_encoding(cache_key: tuple) -> Optional[str]:
+    """Encoding já detectado para a chave (None se ausente)"""
+    with _encoding_cache_lock:
+        encoding = _encoding_cache.get(cache_key)
+        if encoding is not None:
+            _encoding_cache.move_to_end(cache_key)
+        return encoding
+
+
+def _cache_encoding(cache_key: tuple, encoding: str):
+    """Guarda um encoding detectado, descartando o mais antigo no limite"""
+    with _encoding_cache_lock:
+        _encoding_cache[cache_key] = encoding
+        _encoding_cache.move_to_end(cache_key)
+        while len(_encoding_cache) > ENCODING_CACHE_SIZE:
+            _encoding_cache.popitem(last=False)
+
+
+class _FileSlices:
+    """Arquivo aberto em modo binário visto como sequência de bytes fatiável"""
+
+    def __init__(self, f):
+        self._file = f
+        self._size = os.fstat(f.fileno()).st_size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, item: slice) -> bytes:
+        start, stop, _ = item.indices(self._size)
+        self._file.seek(start)
+        return self._file.read(max(0, stop - start))
+
+
+@contextmanager
+def _map_file(f):
+    """
+    Mapeia um arquivo aberto em modo binário somente leitura.
+
+    Arquivos vazios não podem ser mapeados: nesse caso entrega b''.
+    """
+    if os.fstat(f.fileno()).st_size == 0:
+        yield b''
+        return
+
+    buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield buffer
+    finally:
+        buffer.close()
+
+
+def _decode_strict(buffer, encoding: str) -> Optional[str]:
+    """Decodifica o buffer sem cópia intermediária (None se for inválido no encoding)"""
+    view = memoryview(buffer)
+    try:
+        return str(view, encoding)
+    except UnicodeDecodeError:
+        return None
+    finally:
+        # O mmap não fecha enquanto houver views exportadas
+        view.release()
+
+
+def _detect_encoding_fallback(raw_data: bytes, partial: bool = False,
+                              try_utf8: bool = True) -> str:
     """
     Detecção de encoding por heurística quando chardet não está disponível.
 
     Args:
-        raw_data: Bytes do arquivo
+        raw_data: Bytes do arquivo (ou de uma amostra inicial)
+        partial: True se raw_data é uma amostra; um caractere multibyte
+            cortado no fim dela não invalida o UTF-8
+        try_utf8: False quando o UTF-8 já foi descartado
 
     Returns:
         Encoding detectado
     """
     # Tenta UTF-8 primeiro (mais comum)
-    try:
-        raw_data.decode('utf-8')
-        return 'utf-8'
-    except UnicodeDecodeError:
-        pass
+    if try_utf8:
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(raw_data, final=not partial)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
 
     # Verifica BOM (Byte Order Mark)
     if raw_data.startswith(b'\xef\xbb\xbf'):
@@ -96,6 +273,10 @@ def _detect_encoding_fallback(raw_data: bytes) -> str:
     return 'utf-8'
 
 
+# Valores que parecem IDs ou códigos internos
+_ID_LIKE = re.compile(r'^[a-z_0-9]+$')
+
+
 @dataclass
 class TranslationEntry:
     """Representa uma entrada de tradução"""
@@ -104,6 +285,7 @@ class TranslationEntry:
     translated_text: str = ""
     position: int = 0  # Posição no arquivo original
     context: str = ""  # Contexto (linha completa)
+    path: str = ""     # Caminho estrutural (JSON Pointer ou elementos XML), quando conhecido
 
 
 class FileProcessor:
@@ -117,6 +299,16 @@ class FileProcessor:
     # Encodings comuns em jogos
     COMMON_GAME_ENCODINGS = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252', 'shift_jis']
 
+    # Chaves técnicas do JSON: valores curtos nelas não são traduzidos
+    JSON_TECHNICAL_PATHS = PathTrie(['/**/id', '/**/key', '/**/type', '/**/name'],
+                                    ignore_case=True)
+
+    # Regiões ignoradas pela extração padrão (comentários)
+    DEFAULT_EXCLUDE_PATTERNS = {
+        'json': [re.compile(r'/\*.*?\*/', re.DOTALL)],
+        'xml': [re.compile(r'<!--.*?-->', re.DOTALL)],
+    }
+
     def __init__(self, regex_profile=None):
         """
         Inicializa o processador
@@ -145,33 +337,39 @@ class FileProcessor:
         try:
             self.filepath = filepath
 
-            # Detecta encoding se não especificado
-            if encoding is None:
-                self.detected_encoding = detect_encoding(filepath)
-            else:
+            # Mapeia o arquivo uma vez; a decodificação usa o mesmo buffer
+            # (sem cópia intermediária em bytes)
+            with open(filepath, 'rb') as f, _map_file(f) as buffer:
+                content = None
+                cache_key = None
+
+                # Detecta encoding se não especificado
+                if encoding is None:
+                    cache_key = _encoding_cache_key(filepath, f)
+                    encoding = _get_cached_encoding(cache_key)
+
+                if encoding is None:
+                    encoding = _bom_encoding(buffer)
+                    if encoding is None:
+                        # Sem BOM, a validação UTF-8 estrita é a própria
+                        # decodificação: um UTF-8 válido custa uma única passada
+                        content = _decode_strict(buffer, 'utf-8')
+                        if content is not None:
+                            encoding = 'utf-8'
+                        else:
+                            encoding = _detect_non_utf8_encoding(buffer)
+
                 self.detected_encoding = encoding
+                if content is None:
+                    content = self._decode_buffer(buffer)
 
-            # Tenta carregar com o encoding detectado
-            try:
-                with open(filepath, 'r', encoding=self.detected_encoding) as f:
-                    self.original_content = f.read()
-            except UnicodeDecodeError:
-                # Fallback para outros encodings
-                for fallback_encoding in self.COMMON_GAME_ENCODINGS:
-                    if fallback_encoding == self.detected_encoding:
-                        continue
-                    try:
-                        with open(filepath, 'r', encoding=fallback_encoding) as f:
-                            self.original_content = f.read()
-                        self.detected_encoding = fallback_encoding
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                else:
-                    # Último recurso: lê com errors='replace'
-                    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                        self.original_content = f.read()
-                    self.detected_encoding = 'utf-8'
+                if cache_key is not None:
+                    _cache_encoding(cache_key, self.detected_encoding)
+
+            if '\r' in content:
+                # Mesmas quebras de linha da leitura em modo texto
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            self.original_content = content
 
             # Detecta tipo de arquivo
             ext = os.path.splitext(filepath)[1].lower()
@@ -188,6 +386,40 @@ class FileProcessor:
             print(f"Erro ao carregar arquivo: {e}")
             return False
 
+    def _decode_buffer(self, buffer) -> str:
+        """
+        Decodifica o buffer mapeado com o encoding detectado.
+
+        Se a detecção errou (byte inválido no encoding escolhido), tenta os
+        encodings comuns no mesmo buffer.
+
+        Args:
+            buffer: Conteúdo do arquivo
+
+        Returns:
+            Conteúdo decodificado
+        """
+        content = _decode_strict(buffer, self.detected_encoding)
+        if content is not None:
+            return content
+
+        # Fallback para outros encodings
+        for fallback_encoding in self.COMMON_GAME_ENCODINGS:
+            if fallback_encoding == self.detected_encoding:
+                continue
+            content = _decode_strict(buffer, fallback_encoding)
+            if content is not None:
+                self.detected_encoding = fallback_encoding
+                return content
+
+        # Último recurso: decodifica com errors='replace'
+        self.detected_encoding = 'utf-8'
+        view = memoryview(buffer)
+        try:
+            return str(view, 'utf-8', 'replace')
+        finally:
+            view.release()
+
     def get_detected_encoding(self) -> str:
         """Retorna o encoding detectado do arquivo"""
         return self.detected_encoding
@@ -214,20 +446,57 @@ class FileProcessor:
         return self.entries
 
     def _extract_json_default(self):
-        """Extração padrão para JSON"""
+        """
+        Extração padrão para JSON
+
+        Usa o tokenizador estrutural (json_extractor): escapes e aspas dentro
+        de strings são respeitados, cada entrada leva seu caminho JSON Pointer
+        e as chaves técnicas são filtradas pela trie de caminhos. Se o
+        documento não for JSON válido, volta para a busca por regex.
+        """
+        try:
+            entries = []
+            for value in iter_json_strings(self.original_content, self.JSON_TECHNICAL_PATHS):
+                # Ignora valores curtos de chaves técnicas comuns
+                if value.filtered and len(value.raw) < 50:
+                    continue
+
+                # Ignora valores que parecem IDs ou códigos
+                if not value.raw or _ID_LIKE.match(value.raw):
+                    continue
+
+                entries.append(TranslationEntry(
+                    index=len(self.entries) + len(entries),
+                    original_text=value.raw,
+                    position=value.start,
+                    context=f'"{value.key}": "{value.raw}"',
+                    path=value.pointer
+                ))
+            self.entries.extend(entries)
+        except ValueError as e:
+            print(f"JSON inválido, usando extração por regex: {e}")
+            self._extract_json_regex()
+
+    def _extract_json_regex(self):
+        """Extração por regex para JSON (documentos que não são JSON válido)"""
         # Padrão: captura valores de strings
         pattern = r'"([^"]+)"\s*:\s*"([^"]+)"'
+        excluded = self._default_excluded_index()
 
         for match in re.finditer(pattern, self.original_content):
             key = match.group(1)
             value = match.group(2)
 
+            # Ignora valores dentro de comentários
+            if excluded and excluded.overlaps(match.start(2), match.end(2)):
+                continue
+
             # Ignora chaves técnicas comuns
             if key.lower() in ['id', 'key', 'type', 'name'] and len(value) < 50:
                 continue
 
             # Ignora valores que parecem IDs ou códigos
-            if re.match(r'^[a-z_0-9]+$', value):
+            if _ID_LIKE.match(value):
                 continue
 
             entry = TranslationEntry(
@@ -239,9 +508,15 @@ class FileProcessor:
             self.entries.append(entry)
 
     def _extract_xml_default(self):
-        """Extração padrão para XML"""
+        """
+        Extração padrão para XML
+
+        Busca por regex, mais rápida que o parser (xml_extractor) no CPython;
+        o parser fica para perfis que declaram seletores.
+        """
         # Padrão: captura conteúdo entre tags
         pattern = r'>([^<>]+)<'
+        excluded = self._default_excluded_index()
 
         for match in re.finditer(pattern, self.original_content):
             text = match.group(1).strip()
@@ -250,69 +525,124 @@ class FileProcessor:
             if len(text) < 2:
                 continue
 
+            # Ignora textos dentro de comentários
+            if excluded and excluded.overlaps(match.start(1), match.end(1)):
+                continue
+
             # Ignora números puros
             if text.isdigit():
                 continue
 
             # Ignora valores que parecem IDs
-            if re.match(r'^[a-z_0-9]+$', text):
+            if _ID_LIKE.match(text):
                 continue
 
+            # Posição do texto sem o espaço inicial removido pelo strip()
+            raw_text = match.group(1)
             entry = TranslationEntry(
                 index=len(self.entries),
                 original_text=text,
-                position=match.start(1),
+                position=match.start(1) + (len(raw_text) - len(raw_text.lstrip())),
                 context=match.group(0)
             )
             self.entries.append(entry)
 
+    def _default_excluded_index(self) -> IntervalIndex:
+        """Regiões ignoradas pela extração padrão do tipo de arquivo atual"""
+        return IntervalIndex.from_matches(self.DEFAULT_EXCLUDE_PATTERNS.get(self.file_type, ()),
+                                          self.original_content)
+
     def _extract_with_profile(self):
-        """Extração usando perfil de regex personalizado"""
-        # Primeiro, aplica padrões de exclusão
-        excluded_positions = set()
+        """
+        Extração usando perfil de regex personalizado
 
-        for exclude_pattern in self.regex_profile.exclude_patterns:
-            try:
-                for match in re.finditer(exclude_pattern, self.original_content):
-                    excluded_positions.add((match.start(), match.end()))
-            except re.error as e:
-                print(f"Erro no padrão de exclusão '{exclude_pattern}': {e}")
+        Usa o perfil compilado (compile_profile): as ocorrências de todos os
+        padrões de captura intercaladas por posição e consultas O(log n) no
+        IntervalIndex das regiões excluídas.
+        """
+        compiled = compile_profile(self.regex_profile)
+        content = self.original_content
+
+        # Primeiro, aplica padrões de exclusão (intervalos ordenados e unidos)
+        excluded = compiled.excluded_index(content)
+
+        # Perfis XML com seletores usam o parser; os padrões de captura ficam
+        # para documentos malformados
+        if self.regex_profile.selectors and self.regex_profile.file_type == 'xml':
+            if self._extract_xml_selectors(excluded):
+                self._remove_duplicate_entries()
+                return
 
         # Depois, aplica padrões de captura
-        for capture_pattern in self.regex_profile.capture_patterns:
-            try:
-                for match in re.finditer(capture_pattern, self.original_content):
-                    # Pega o último grupo capturado (geralmente o texto)
-                    groups = match.groups()
-                    if not groups:
-                        continue
-
-                    text = groups[-1].strip()
-
-                    # Ignora textos vazios
-                    if not text or len(text) < 2:
-                        continue
-
-                    # Verifica se está em região excluída
-                    position = match.start()
-                    is_excluded = any(start <= position <= end
-                                    for start, end in excluded_positions)
-
-                    if is_excluded:
-                        continue
-
-                    entry = TranslationEntry(
-                        index=len(self.entries),
-                        original_text=text,
-                        position=position,
-                        context=match.group(0)
-                    )
-                    self.entries.append(entry)
-
-            except re.error as e:
-                print(f"Erro no padrão de captura '{capture_pattern}': {e}")
-
-        # Remove duplicatas mantendo a primeira ocorrência
+        for match, text_group in compiled.iter_matches(content):
+            raw_text = match.group(text_group)
+            if raw_text is None:
+                continue
+
+            text = raw_text.strip()
+
+            # Ignora textos vazios
+            if not text or len(text) < 2:
+                continue
+
+            # Posição do próprio texto (não do início da ocorrência), que é
+            # onde apply_translations faz a substituição
+            position = match.start(text_group) + (len(raw_text) - len(raw_text.lstrip()))
+
+            # Verifica se o texto toca alguma região excluída
+            if excluded.overlaps(position, position + len(text)):
+                continue
+
+            entry = TranslationEntry(
+                index=len(self.entries),
+                original_text=text,
+                position=position,
+                context=match.group(0)
+            )
+            self.entries.append(entry)
+
+        self._remove_duplicate_entries()
+
+    def _extract_xml_selectors(self, excluded: IntervalIndex) -> bool:
+        """
+        Extração de XML pelos seletores do perfil
+
+        Args:
+            excluded: Regiões cobertas pelos padrões de exclusão do perfil
+
+        Returns:
+            True se extraiu, False se o documento não é XML bem formado
+        """
+        selector = XmlSelector(self.regex_profile.selectors)
+        try:
+            entries = []
+            for node in iter_xml_nodes(self.original_content, selector, char_offsets=True):
+                # Ignora textos vazios ou muito curtos
+                if len(node.raw) < 2:
+                    continue
+
+                # Verifica se o texto toca alguma região excluída
+                if excluded and excluded.overlaps(node.start, node.end):
+                    continue
+
+                context = (f'{node.name}="{node.raw}"' if node.attribute
+                           else f'<{node.name}>{node.raw}</{node.name}>')
+                entries.append(TranslationEntry(
+                    index=len(self.entries) + len(entries),
+                    original_text=node.raw,
+                    position=node.start,
+                    context=context,
+                    path=node.path
+                ))
+        except ValueError as e:
+            print(f"{e}; usando os padrões de captura do perfil")
+            return False
+
+        self.entries.extend(entries)
+        return True
+
+    def _remove_duplicate_entries(self):
+        """Remove duplicatas mantendo a primeira ocorrência"""
         seen = set()
         unique_entries = []
         for entry in self.entries:
@@ -333,21 +663,36 @@ class FileProcessor:
         Returns:
             Conteúdo traduzido
         """
-        result = self.original_content
+        return ''.join(self._iter_translated_pieces(translations))
+
+    def _iter_translated_pieces(self, translations: Dict[str, str]) -> Iterator[str]:
+        """
+        Gera o conteúdo traduzido em pedaços, numa única passada.
 
-        # Ordena entradas por posição (de trás para frente para não afetar posições)
-        sorted_entries = sorted(self.entries, key=lambda e: e.position, reverse=True)
+        Percorre as entradas em ordem crescente de posição, alternando o
+        trecho original até a entrada e a tradução dela: nenhuma cópia do
+        conteúdo inteiro é feita por entrada. Entradas que se sobrepõem a
+        uma substituição anterior são ignoradas.
 
-        for entry in sorted_entries:
-            if entry.original_text in translations:
-                translated = translations[entry.original_text]
+        Args:
+            translations: Dicionário {texto_original: texto_traduzido}
+
+        Yields:
+            Pedaços do conteúdo traduzido, na ordem do arquivo
+        """
+        content = self.original_content
+        cursor = 0
+
+        for entry in sorted(self.entries, key=lambda e: e.position):
+            if entry.original_text not in translations or entry.position < cursor:
+                continue
 
-                # Substitui apenas na posição exata
-                before = result[:entry.position]
-                after = result[entry.position + len(entry.original_text):]
-                result = before + translated + after
+            # Substitui apenas na posição exata
+            yield content[cursor:entry.position]
+            yield translations[entry.original_text]
+            cursor = entry.position + len(entry.original_text)
 
-        return result
+        yield content[cursor:]
 
     def save_file(self, filepath: str, content: str, create_backup: bool = True,
                   encoding: str = None) -> bool:
@@ -360,6 +705,43 @@ class FileProcessor:
             create_backup: Se deve criar backup do original
             encoding: Encoding para salvar (None = usa o detectado)
 
+        Returns:
+            True se salvou com sucesso
+        """
+        return self._write_file(filepath, [content], create_backup, encoding)
+
+    def save_translations(self, filepath: str, translations: Dict[str, str],
+                          create_backup: bool = True, encoding: str = None) -> bool:
+        """
+        Aplica as traduções e grava o resultado direto no arquivo.
+
+        Equivale a save_file(filepath, apply_translations(translations)), mas
+        os pedaços vão para o disco à medida que são gerados, sem montar o
+        conteúdo traduzido inteiro em memória.
+
+        Args:
+            filepath: Caminho do arquivo
+            translations: Dicionário {texto_original: texto_traduzido}
+            create_backup: Se deve criar backup do original
+            encoding: Encoding para salvar (None = usa o detectado)
+
+        Returns:
+            True se salvou com sucesso
+        """
+        return self._write_file(filepath, self._iter_translated_pieces(translations),
+                                create_backup, encoding)
+
+    def _write_file(self, filepath: str, pieces: Iterable[str], create_backup: bool,
+                    encoding: Optional[str]) -> bool:
+        """
+        Grava pedaços de conteúdo no arquivo, com backup opcional do original.
+
+        Args:
+            filepath: Caminho do arquivo
+            pieces: Pedaços do conteúdo, na ordem
+            create_backup: Se deve criar backup do original
+            encoding: Encoding para salvar (None = usa o detectado)
+
         Returns:
             True se salvou com sucesso
         """
@@ -388,7 +770,7 @@ class FileProcessor:
 
             # Salva arquivo traduzido com encoding original
             with open(filepath, 'w', encoding=save_encoding) as f:
-                f.write(content)
+                f.writelines(pieces)
 
             return True
 
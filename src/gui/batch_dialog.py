@@ -444,6 +444,10 @@ class BatchProcessorDialog(QDialog):
         self.btn_save.setEnabled(True)
         
         if result:
+            # Grava contadores de uso acumulados ao aplicar a memória
+            if self.translation_memory and self.translation_memory.is_connected():
+                self.translation_memory.flush_usage_counts()
+            
             QMessageBox.information(
                 self,
                 "Salvamento Concluído",
@@ -24,8 +24,10 @@ from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                               QFileDialog, QComboBox, QProgressBar, QMessageBox,
                               QHeaderView, QLineEdit, QDialog, QTextEdit, QGroupBox,
                               QTabWidget, QSpinBox, QCheckBox, QSplitter, QFrame,
-                              QStatusBar, QToolBar, QMenu, QMenuBar, QApplication)
-from PySide6.QtCore import Qt, QThread, Signal, QTimer, QSettings
+                              QStatusBar, QToolBar, QMenu, QMenuBar, QApplication,
+                              QProgressDialog, QTableView, QListWidget)
+from PySide6.QtCore import (Qt, QThread, Signal, QTimer, QSettings,
+                            QAbstractTableModel, QModelIndex)
 from PySide6.QtGui import QPalette, QColor, QFont, QAction, QIcon, QKeySequence, QShortcut
 
 # Imports com tratamento de erro para funcionar tanto como script quanto executável
@@ -144,6 +146,26 @@ DEFAULT_WINDOW_HEIGHT = 800
 SETTINGS_ORG_NAME = "ManusAI"  # Nome da organização/desenvolvedor
 SETTINGS_APP_NAME = "GameTranslator"  # Nome da aplicação
 
+# Formatos oferecidos ao exportar a memória (formato/compressão deduzidos pela extensão)
+MEMORY_EXPORT_FILTER = (
+    "CSV Files (*.csv);;"
+    "TSV Files (*.tsv);;"
+    "JSON Lines (*.jsonl);;"
+    "TMX Files (*.tmx);;"
+    "Compactado gzip (*.csv.gz *.tsv.gz *.jsonl.gz);;"
+    "Compactado zstd (*.csv.zst *.tsv.zst *.jsonl.zst)"
+)
+
+# Formatos aceitos ao importar para a memória
+MEMORY_IMPORT_FILTER = (
+    "Memória de Tradução (*.csv *.tsv *.jsonl *.tmx *.gz *.zst);;"
+    "CSV Files (*.csv);;"
+    "TSV Files (*.tsv);;"
+    "JSON Lines (*.jsonl);;"
+    "TMX Files (*.tmx);;"
+    "Compactado gzip/zstd (*.gz *.zst)"
+)
+
 # Cores para linhas da tabela (tema escuro)
 class TableColors:
     """Cores usadas nas tabelas para manter consistência visual"""
@@ -267,6 +289,101 @@ class FileLoadWorker(QThread):
         except Exception as e:
             self.error.emit(str(e))
 
+class MemoryImportWorker(QThread):
+    """Thread para importar CSV grande na memória de tradução"""
+    
+    progress = Signal(int)
+    finished = Signal(int, int)
+    
+    def __init__(self, translation_memory, filepath):
+        super().__init__()
+        self.translation_memory = translation_memory
+        self.filepath = filepath
+    
+    def run(self):
+        """Importa em streaming, emitindo progresso em % do arquivo lido"""
+        def on_progress(bytes_read, total_bytes):
+            if total_bytes > 0:
+                self.progress.emit(min(100, int(bytes_read / total_bytes * 100)))
+        
+        imported, errors = self.translation_memory.import_from_file(
+            self.filepath, progress_callback=on_progress
+        )
+        self.finished.emit(imported, errors)
+
+
+class MemoryMergeWorker(QThread):
+    """Thread para mesclar outra memória de tradução na atual"""
+    
+    progress = Signal(int)
+    finished = Signal(dict)
+    
+    def __init__(self, translation_memory, filepath):
+        super().__init__()
+        self.translation_memory = translation_memory
+        self.filepath = filepath
+    
+    def run(self):
+        """Mescla o delta, emitindo progresso em % das linhas lidas"""
+        def on_progress(processed, total):
+            if total > 0:
+                self.progress.emit(min(100, int(processed / total * 100)))
+        
+        report = self.translation_memory.merge_from(
+            self.filepath, progress_callback=on_progress
+        )
+        self.finished.emit(report)
+
+
+class MemoryExportWorker(QThread):
+    """Thread para exportar a memória de tradução em streaming"""
+    
+    progress = Signal(int)
+    finished = Signal(bool)
+    
+    def __init__(self, translation_memory, filepath):
+        super().__init__()
+        self.translation_memory = translation_memory
+        self.filepath = filepath
+    
+    def run(self):
+        """Exporta emitindo progresso em % das traduções gravadas"""
+        def on_progress(exported, total):
+            if total > 0:
+                self.progress.emit(min(100, int(exported / total * 100)))
+        
+        success = self.translation_memory.export_to_file(
+            self.filepath, progress_callback=on_progress
+        )
+        self.finished.emit(success)
+
+
+def start_memory_export(parent, translation_memory, filepath: str):
+    """
+    Exporta a memória em segundo plano com diálogo de progresso.
+    
+    Args:
+        parent: Janela dona do diálogo (mantém a referência da thread)
+        translation_memory: Memória de tradução a exportar
+        filepath: Arquivo de destino
+    """
+    progress = QProgressDialog("Exportando traduções...", None, 0, 100, parent)
+    progress.setWindowTitle("Exportar Memória")
+    progress.setWindowModality(Qt.WindowModal)
+    progress.setMinimumDuration(0)
+    
+    def on_finished(success: bool):
+        progress.close()
+        if success:
+            QMessageBox.information(parent, "Sucesso", f"Exportado para:\n{filepath}")
+        else:
+            QMessageBox.critical(parent, "Erro", "Falha ao exportar")
+    
+    parent.export_worker = MemoryExportWorker(translation_memory, filepath)
+    parent.export_worker.progress.connect(progress.setValue)
+    parent.export_worker.finished.connect(on_finished)
+    parent.export_worker.start()
+
 # ============================================================================
 # DIÁLOGOS
 # ============================================================================
@@ -372,9 +489,218 @@ class DatabaseSelectorDialog(QDialog):
         self.selected_db_path = filepath
         self.accept()
 
+class AttachedMemoriesDialog(QDialog):
+    """Diálogo para anexar memórias compartilhadas ao banco do projeto"""
+    
+    def __init__(self, parent, translation_memory: TranslationMemory):
+        super().__init__(parent)
+        
+        self.translation_memory = translation_memory
+        
+        self.setWindowTitle("Memórias Compartilhadas")
+        self.setGeometry(300, 300, 600, 300)
+        self.setModal(True)
+        
+        self._create_ui()
+        self._refresh()
+    
+    def _create_ui(self):
+        """Cria interface do diálogo"""
+        layout = QVBoxLayout(self)
+        
+        info_label = QLabel(
+            "As buscas consultam primeiro o banco do projeto e depois estas "
+            "memórias, de cima para baixo.\nAs novas traduções continuam "
+            "sendo gravadas só no banco do projeto."
+        )
+        info_label.setWordWrap(True)
+        layout.addWidget(info_label)
+        
+        self.memory_list = QListWidget()
+        layout.addWidget(self.memory_list)
+        
+        buttons_layout = QHBoxLayout()
+        
+        btn_attach = QPushButton("Anexar...")
+        btn_attach.clicked.connect(self._attach)
+        buttons_layout.addWidget(btn_attach)
+        
+        btn_detach = QPushButton("Remover")
+        btn_detach.clicked.connect(self._detach)
+        buttons_layout.addWidget(btn_detach)
+        
+        btn_up = QPushButton("Subir")
+        btn_up.clicked.connect(lambda: self._move(-1))
+        buttons_layout.addWidget(btn_up)
+        
+        btn_down = QPushButton("Descer")
+        btn_down.clicked.connect(lambda: self._move(1))
+        buttons_layout.addWidget(btn_down)
+        
+        buttons_layout.addStretch()
+        
+        btn_close = QPushButton("Fechar")
+        btn_close.clicked.connect(self.accept)
+        buttons_layout.addWidget(btn_close)
+        
+        layout.addLayout(buttons_layout)
+    
+    def _refresh(self, selected_row: int = -1):
+        """Recarrega a lista na ordem de prioridade"""
+        self.memory_list.clear()
+        self.memory_list.addItems(self.translation_memory.get_attached_memories())
+        self.memory_list.setCurrentRow(selected_row)
+    
+    def _attach(self):
+        """Anexa uma memória escolhida pelo usuário"""
+        filepath, _ = QFileDialog.getOpenFileName(
+            self,
+            "Anexar Memória",
+            "",
+            "Banco de Dados (*.db)"
+        )
+        
+        if not filepath:
+            return
+        
+        if not self.translation_memory.attach_memory(filepath):
+            QMessageBox.critical(self, "Erro", "Falha ao anexar a memória")
+            return
+        
+        app_logger.info(f"Memória anexada: {filepath}")
+        self._refresh(self.memory_list.count())
+    
+    def _detach(self):
+        """Remove a memória selecionada"""
+        item = self.memory_list.currentItem()
+        if item is None:
+            return
+        
+        self.translation_memory.detach_memory(item.text())
+        self._refresh()
+    
+    def _move(self, offset: int):
+        """Muda a prioridade da memória selecionada"""
+        row = self.memory_list.currentRow()
+        new_row = row + offset
+        if row < 0 or not 0 <= new_row < self.memory_list.count():
+            return
+        
+        path = self.memory_list.item(row).text()
+        self.translation_memory.detach_memory(path)
+        self.translation_memory.attach_memory(path, position=new_row)
+        self._refresh(new_row)
+
+class MemoryTableModel(QAbstractTableModel):
+    """
+    Modelo da tabela do visualizador de banco de dados, carregado sob demanda.
+    
+    Busca as traduções em páginas conforme o usuário rola a tabela
+    (canFetchMore/fetchMore). Sem busca, usa paginação por chave
+    (usage_count, id), então abrir o visualizador custa o mesmo em qualquer
+    tamanho de banco; com busca, pagina os resultados ranqueados do índice
+    de texto completo.
+    """
+    
+    HEADERS = ["ID", "Texto Original", "Tradução", "Categoria", "Usos", "Atualizado"]
+    PAGE_SIZE = 200
+    
+    def __init__(self, translation_memory: TranslationMemory, parent=None):
+        super().__init__(parent)
+        self.translation_memory = translation_memory
+        self._rows = []
+        self._has_more = False
+        self._search_term = None
+        self._category = None
+    
+    def load(self, search_term: str = None, category: str = None):
+        """Reinicia o modelo com novos filtros e carrega a primeira página"""
+        self.beginResetModel()
+        self._search_term = search_term
+        self._category = category
+        self._rows = []
+        self._rows = self._fetch_page()
+        self._has_more = len(self._rows) == self.PAGE_SIZE
+        self.endResetModel()
+    
+    def _fetch_page(self) -> list:
+        """Busca a próxima página a partir da última linha carregada"""
+        if self._search_term:
+            return self.translation_memory.search_fulltext(
+                self._search_term,
+                limit=self.PAGE_SIZE,
+                offset=len(self._rows),
+                category=self._category
+            )
+        
+        after = None
+        if self._rows:
+            last = self._rows[-1]
+            after = (last['usage_count'], last['id'])
+        
+        return self.translation_memory.get_translations_page(
+            after=after,
+            limit=self.PAGE_SIZE,
+            category=self._category
+        )
+    
+    def translation_id(self, row: int) -> int:
+        """Retorna o ID da tradução exibida na linha"""
+        return self._rows[row]['id']
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        
+        t = self._rows[index.row()]
+        column = index.column()
+        
+        if column == 0:
+            return str(t['id'])
+        if column == 1:
+            return t['original_text'][:100]
+        if column == 2:
+            return t['translated_text'][:100]
+        if column == 3:
+            return t['category']
+        if column == 4:
+            return str(t['usage_count'])
+        return t['updated_at'][:10] if t['updated_at'] else ''
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        
+        page = self._fetch_page()
+        self._has_more = len(page) == self.PAGE_SIZE
+        if not page:
+            return
+        
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._rows.extend(page)
+        self.endInsertRows()
+
+
 class DatabaseViewerDialog(QDialog):
     """Diálogo para visualizar e gerenciar o banco de dados"""
     
+    SEARCH_DEBOUNCE_MS = 250
+    
     def __init__(self, parent, translation_memory: TranslationMemory):
         super().__init__(parent)
         
@@ -414,6 +740,12 @@ class DatabaseViewerDialog(QDialog):
         self.search_input.textChanged.connect(self._on_search)
         search_layout.addWidget(self.search_input)
         
+        # Debounce: só consulta o banco quando o usuário para de digitar
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._run_search)
+        
         search_layout.addWidget(QLabel("Categoria:"))
         self.category_combo = QComboBox()
         self.category_combo.addItem("Todas")
@@ -427,12 +759,11 @@ class DatabaseViewerDialog(QDialog):
         
         layout.addLayout(search_layout)
         
-        # Tabela de traduções
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Texto Original", "Tradução", "Categoria", "Usos", "Atualizado"
-        ])
+        # Tabela de traduções (carregada sob demanda conforme a rolagem)
+        self.table = QTableView()
+        self.table_model = MemoryTableModel(self.translation_memory, self)
+        self.table.setModel(self.table_model)
+        self.table_model.rowsInserted.connect(self._on_rows_fetched)
         
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
@@ -451,8 +782,8 @@ class DatabaseViewerDialog(QDialog):
         header.sectionResized.connect(self._on_db_table_column_resized)
         
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.doubleClicked.connect(self._on_item_double_clicked)
         
         # Adiciona atalho da tecla Delete para excluir
         delete_shortcut = QShortcut(QKeySequence.Delete, self.table)
@@ -492,29 +823,23 @@ class DatabaseViewerDialog(QDialog):
         if category == "Todas":
             category = None
         
-        translations = self.translation_memory.get_all_translations(
-            category=category,
-            search_term=search_term
-        )
-        
-        self.table.setRowCount(len(translations))
-        
-        for i, t in enumerate(translations):
-            self.table.setItem(i, 0, QTableWidgetItem(str(t['id'])))
-            self.table.setItem(i, 1, QTableWidgetItem(t['original_text'][:100]))
-            self.table.setItem(i, 2, QTableWidgetItem(t['translated_text'][:100]))
-            self.table.setItem(i, 3, QTableWidgetItem(t['category']))
-            self.table.setItem(i, 4, QTableWidgetItem(str(t['usage_count'])))
-            self.table.setItem(i, 5, QTableWidgetItem(t['updated_at'][:10] if t['updated_at'] else ''))
-            
-            # Torna ID não editável
-            self.table.item(i, 0).setFlags(self.table.item(i, 0).flags() & ~Qt.ItemIsEditable)
+        # Com busca, os resultados vêm ranqueados do índice de texto completo
+        self.table_model.load(search_term=search_term or None, category=category)
         
         # Auto-ajusta altura das linhas após carregar dados
         self._auto_adjust_row_heights()
     
+    def _on_rows_fetched(self, parent, first, last):
+        """Ajusta a altura apenas das linhas recém-carregadas pela rolagem"""
+        self._adjust_row_heights(first, last)
+    
     def _on_search(self, text):
-        """Callback de busca"""
+        """Callback de busca (reinicia o debounce a cada tecla)"""
+        self._search_timer.start()
+    
+    def _run_search(self):
+        """Executa a busca após o intervalo de debounce"""
+        text = self.search_input.text()
         category = self.category_combo.currentText()
         self._load_data(search_term=text if text else None, 
                        category=category if category != "Todas" else None)
@@ -525,7 +850,7 @@ class DatabaseViewerDialog(QDialog):
         self._load_data(search_term=search if search else None,
                        category=category if category != "Todas" else None)
     
-    def _on_item_double_clicked(self, item):
+    def _on_item_double_clicked(self, index):
         """Callback de duplo clique - auto-ajusta altura e inicia edição"""
         # Auto-ajusta altura das linhas quando começar a editar
         self._auto_adjust_row_heights()
@@ -543,19 +868,21 @@ class DatabaseViewerDialog(QDialog):
         
         Aplica altura mínima padrão e aumenta conforme necessário.
         """
+        self._adjust_row_heights(0, self.table_model.rowCount() - 1)
+    
+    def _adjust_row_heights(self, first: int, last: int):
+        """Ajusta a altura das linhas carregadas no intervalo [first, last]"""
         # Altura mínima padrão
         min_height = 30
         
         # Calcula a altura de cada linha baseado no conteúdo
-        for row in range(self.table.rowCount()):
+        for row in range(first, last + 1):
             max_height = min_height
             
             # Verifica colunas de texto (Original e Tradução)
             for col in [1, 2]:  # Apenas colunas de texto original e tradução
-                item = self.table.item(row, col)
-                if item:
-                    text = item.text()
-                    
+                text = self.table_model.data(self.table_model.index(row, col))
+                if text:
                     # Calcula altura baseado no comprimento do texto
                     # Usa a largura da coluna para estimar quebras de linha
                     col_width = self.table.columnWidth(col)
@@ -641,13 +968,13 @@ class DatabaseViewerDialog(QDialog):
     
     def _edit_selected(self):
         """Edita tradução selecionada"""
-        selected = self.table.selectedItems()
+        selected = self.table.selectionModel().selectedRows()
         if not selected:
             QMessageBox.warning(self, "Aviso", "Selecione uma tradução para editar")
             return
         
         row = selected[0].row()
-        translation_id = int(self.table.item(row, 0).text())
+        translation_id = self.table_model.translation_id(row)
         
         # Busca dados completos
         data = self.translation_memory.get_translation_by_id(translation_id)
@@ -674,12 +1001,7 @@ class DatabaseViewerDialog(QDialog):
             return
         
         # Obtém os IDs das linhas selecionadas
-        selected_ids = []
-        for index in selected_rows:
-            # O ID está na primeira coluna (índice 0)
-            item = self.table.item(index.row(), 0)
-            if item:
-                selected_ids.append(int(item.text()))
+        selected_ids = [self.table_model.translation_id(index.row()) for index in selected_rows]
         
         if not selected_ids:
             QMessageBox.warning(self, "Aviso", "Nenhum ID de tradução válido encontrado nas linhas selecionadas.")
@@ -704,37 +1026,48 @@ class DatabaseViewerDialog(QDialog):
                 QMessageBox.critical(self, "Erro", "Falha ao excluir as traduções.")
     
     def _export_csv(self):
-        """Exporta para CSV"""
+        """Exporta para CSV, TSV ou JSON Lines"""
         filepath, _ = QFileDialog.getSaveFileName(
             self,
-            "Exportar para CSV",
+            "Exportar Memória",
             "translations.csv",
-            "CSV Files (*.csv)"
+            MEMORY_EXPORT_FILTER
         )
         
         if filepath:
-            if self.translation_memory.export_to_file(filepath):
-                QMessageBox.information(self, "Sucesso", f"Exportado para:\n{filepath}")
-            else:
-                QMessageBox.critical(self, "Erro", "Falha ao exportar")
+            start_memory_export(self, self.translation_memory, filepath)
     
     def _import_csv(self):
-        """Importa de CSV"""
+        """Importa de CSV, TSV, JSON Lines ou TMX"""
         filepath, _ = QFileDialog.getOpenFileName(
             self,
-            "Importar de CSV",
+            "Importar Memória de Tradução",
             "",
-            "CSV Files (*.csv)"
+            MEMORY_IMPORT_FILTER
         )
         
         if filepath:
-            imported, errors = self.translation_memory.import_from_file(filepath)
-            QMessageBox.information(
-                self, 
-                "Importação Concluída",
-                f"Importados: {imported}\nErros: {errors}"
+            progress = QProgressDialog("Importando traduções...", None, 0, 100, self)
+            progress.setWindowTitle("Importar CSV")
+            progress.setWindowModality(Qt.WindowModal)
+            progress.setMinimumDuration(0)
+            
+            self.import_worker = MemoryImportWorker(self.translation_memory, filepath)
+            self.import_worker.progress.connect(progress.setValue)
+            self.import_worker.finished.connect(
+                lambda imported, errors: self._on_import_finished(progress, imported, errors)
             )
-            self._load_data()
+            self.import_worker.start()
+    
+    def _on_import_finished(self, progress, imported: int, errors: int):
+        """Callback de conclusão da importação de CSV"""
+        progress.close()
+        QMessageBox.information(
+            self, 
+            "Importação Concluída",
+            f"Importados: {imported}\nErros: {errors}"
+        )
+        self._load_data()
     
     def closeEvent(self, event):
         """Evento de fechamento da janela - salva configurações"""
@@ -1508,7 +1841,7 @@ class MainWindow(QMainWindow):
 
         # Handler de drag and drop
         self.drag_drop = DragDropHandler(self)
-        self.drag_drop.set_accepted_extensions(['.json', '.xml', '.db', '.csv'])
+        self.drag_drop.set_accepted_extensions(['.json', '.xml', '.db', '.csv', '.tmx'])
         self.drag_drop.set_callback(self._handle_dropped_file)
         self.drag_drop.enable()
 
@@ -1573,7 +1906,7 @@ class MainWindow(QMainWindow):
 </table>
 
 <h3>Arrastar e Soltar</h3>
-<p>Arraste arquivos .json, .xml, .db ou .csv diretamente para a janela.</p>
+<p>Arraste arquivos .json, .xml, .db, .csv ou .tmx diretamente para a janela.</p>
         """
         QMessageBox.information(self, "Atalhos de Teclado", shortcuts_text)
 
@@ -1589,13 +1922,9 @@ class MainWindow(QMainWindow):
             else:
                 self.toast.error("Erro ao conectar ao banco de dados")
 
-        elif ext == 'csv':
-            # Arquivo CSV para importação
-            imported, errors = self.translation_memory.import_from_file(filepath)
-            if imported > 0:
-                self.toast.success(f"Importadas {imported} traduções ({errors} erros)")
-            else:
-                self.toast.error("Erro ao importar CSV")
+        elif ext in ['csv', 'tmx']:
+            # Arquivo CSV/TMX para importação (em background)
+            self._start_memory_import(filepath, show_toast=True)
 
         elif ext in ['json', 'xml']:
             # Arquivo de tradução
@@ -1666,6 +1995,14 @@ class MainWindow(QMainWindow):
         action_import_db.triggered.connect(self._import_database)
         db_menu.addAction(action_import_db)
         
+        action_attached_db = QAction("Memórias Compartilhadas...", self)
+        action_attached_db.triggered.connect(self._manage_attached_memories)
+        db_menu.addAction(action_attached_db)
+        
+        action_merge_db = QAction("Mesclar Outra Memória...", self)
+        action_merge_db.triggered.connect(self._merge_database)
+        db_menu.addAction(action_merge_db)
+        
         # Menu Ferramentas
         tools_menu = menubar.addMenu("Ferramentas")
         
@@ -2031,55 +2368,149 @@ class MainWindow(QMainWindow):
         if filepath:
             self._connect_database(filepath)
     
+    def _manage_attached_memories(self):
+        """Abre o gerenciador de memórias compartilhadas anexadas"""
+        if not self.translation_memory.is_connected():
+            QMessageBox.warning(self, "Aviso", "Conecte a um banco de dados primeiro")
+            return
+        
+        dialog = AttachedMemoriesDialog(self, self.translation_memory)
+        dialog.exec()
+    
     def _view_database(self):
         """Abre visualizador do banco de dados"""
         if not self.translation_memory.is_connected():
             QMessageBox.warning(self, "Aviso", "Conecte a um banco de dados primeiro")
             return
         
+        # O visualizador lê do banco: grava antes as edições enfileiradas
+        self.translation_memory.flush_writes()
+        
         dialog = DatabaseViewerDialog(self, self.translation_memory)
         dialog.exec()
     
     def _export_database(self):
-        """Exporta banco de dados para CSV"""
+        """Exporta banco de dados para CSV, TSV ou JSON Lines"""
         if not self.translation_memory.is_connected():
             QMessageBox.warning(self, "Aviso", "Conecte a um banco de dados primeiro")
             return
         
         filepath, _ = QFileDialog.getSaveFileName(
             self,
-            "Exportar para CSV",
+            "Exportar Memória",
             "translations.csv",
-            "CSV Files (*.csv)"
+            MEMORY_EXPORT_FILTER
         )
         
         if filepath:
-            if self.translation_memory.export_to_file(filepath):
-                QMessageBox.information(self, "Sucesso", f"Exportado para:\n{filepath}")
-            else:
-                QMessageBox.critical(self, "Erro", "Falha ao exportar")
+            start_memory_export(self, self.translation_memory, filepath)
     
     def _import_database(self):
-        """Importa traduções de CSV"""
+        """Importa traduções de CSV, TSV, JSON Lines ou TMX"""
         if not self.translation_memory.is_connected():
             QMessageBox.warning(self, "Aviso", "Conecte a um banco de dados primeiro")
             return
         
         filepath, _ = QFileDialog.getOpenFileName(
             self,
-            "Importar de CSV",
+            "Importar Memória de Tradução",
             "",
-            "CSV Files (*.csv)"
+            MEMORY_IMPORT_FILTER
         )
         
         if filepath:
-            imported, errors = self.translation_memory.import_from_file(filepath)
+            self._start_memory_import(filepath)
+    
+    def _start_memory_import(self, filepath: str, show_toast: bool = False):
+        """
+        Importa um CSV para a memória em background com barra de progresso.
+        
+        Args:
+            filepath: Caminho do CSV
+            show_toast: Se True, mostra o resultado como toast (drag-and-drop)
+        """
+        self.status_label.setText(f"Importando {os.path.basename(filepath)}...")
+        self.progress_bar.setValue(0)
+        
+        self.import_worker = MemoryImportWorker(self.translation_memory, filepath)
+        self.import_worker.progress.connect(self.progress_bar.setValue)
+        self.import_worker.finished.connect(
+            lambda imported, errors: self._on_memory_import_finished(imported, errors, show_toast)
+        )
+        self.import_worker.start()
+    
+    def _on_memory_import_finished(self, imported: int, errors: int, show_toast: bool):
+        """Callback de conclusão da importação de CSV"""
+        self.progress_bar.setValue(0)
+        self.status_label.setText(f"Importação concluída: {imported} traduções")
+        app_logger.info(f"Importação de CSV concluída: {imported} importados, {errors} erros")
+        
+        if show_toast:
+            if imported > 0:
+                self.toast.success(f"Importadas {imported} traduções ({errors} erros)")
+            else:
+                self.toast.error("Erro ao importar CSV")
+        else:
             QMessageBox.information(
                 self,
                 "Importação Concluída",
                 f"Importados: {imported}\nErros: {errors}"
             )
     
+    def _merge_database(self):
+        """Mescla outra memória (.db) na atual, aplicando só o que mudou"""
+        if not self.translation_memory.is_connected():
+            QMessageBox.warning(self, "Aviso", "Conecte a um banco de dados primeiro")
+            return
+        
+        filepath, _ = QFileDialog.getOpenFileName(
+            self,
+            "Mesclar Memória",
+            "",
+            "Banco de Dados (*.db)"
+        )
+        
+        if not filepath:
+            return
+        
+        self.status_label.setText(f"Mesclando {os.path.basename(filepath)}...")
+        self.progress_bar.setValue(0)
+        
+        self.merge_worker = MemoryMergeWorker(self.translation_memory, filepath)
+        self.merge_worker.progress.connect(self.progress_bar.setValue)
+        self.merge_worker.finished.connect(self._on_memory_merge_finished)
+        self.merge_worker.start()
+    
+    def _on_memory_merge_finished(self, report: dict):
+        """Callback de conclusão da mesclagem"""
+        self.progress_bar.setValue(0)
+        self.status_label.setText(
+            f"Mesclagem concluída: {report['inserted']} novas, {report['updated']} atualizadas"
+        )
+        app_logger.info(
+            f"Mesclagem concluída: {report['inserted']} inseridas, {report['updated']} "
+            f"atualizadas, {report['conflict_count']} conflitos"
+        )
+        
+        message = (
+            f"Novas: {report['inserted']}\n"
+            f"Atualizadas: {report['updated']}\n"
+            f"Sem alteração: {report['unchanged']}\n"
+            f"Conflitos: {report['conflict_count']}"
+        )
+        
+        # Mostra os primeiros conflitos e como foram resolvidos
+        conflicts = report['conflicts'][:10]
+        if conflicts:
+            message += "\n\nConflitos (vence a edição mais recente):\n"
+            for conflict in conflicts:
+                kept = conflict['local_text'] if conflict['resolution'] == 'local' else conflict['remote_text']
+                message += f"• {conflict['original_text'][:40]} → {kept[:40]}\n"
+            if report['conflict_count'] > len(conflicts):
+                message += f"... e mais {report['conflict_count'] - len(conflicts)}"
+        
+        QMessageBox.information(self, "Mesclagem Concluída", message)
+    
     def import_file(self):
         """Importa arquivo para tradução"""
         # Verifica banco de dados
@@ -2429,10 +2860,11 @@ class MainWindow(QMainWindow):
                         return
             
             if translated and self.translation_memory.is_connected():
-                self.translation_memory.add_translation(original, translated)
+                # Gravação em segundo plano: não bloqueia a interface
+                self.translation_memory.queue_translation(original, translated)
                 
                 if self.smart_translator:
-                    self.smart_translator.learn_pattern(original, translated)
+                    self.smart_translator.learn_pattern(original, translated, store=False)
                 
                 app_logger.log_translation(original, translated, "manual")
                 
@@ -2681,10 +3113,11 @@ class MainWindow(QMainWindow):
             
             # Adiciona à memória
             if self.translation_memory.is_connected():
-                self.translation_memory.add_translation(original, translation)
+                # Gravação em segundo plano: não bloqueia a interface
+                self.translation_memory.queue_translation(original, translation)
                 
                 if self.smart_translator:
-                    self.smart_translator.learn_pattern(original, translation)
+                    self.smart_translator.learn_pattern(original, translation, store=False)
                 
                 app_logger.log_translation(original, translation, "paste")
             
@@ -2895,6 +3328,11 @@ class MainWindow(QMainWindow):
         try:
             self.status_label.setText("Salvando arquivo...")
 
+            # Garante que as edições enfileiradas estejam gravadas na memória
+            memory_saved = True
+            if self.translation_memory.is_connected():
+                memory_saved = self.translation_memory.flush_writes()
+
             # Atualiza status do Discord para "salvando"
             if self.discord_rpc and self.discord_rpc.is_connected:
                 self.discord_rpc.set_saving(os.path.basename(self.current_file))
@@ -2906,23 +3344,37 @@ class MainWindow(QMainWindow):
                 if entry.translated_text
             }
 
-            # Aplica traduções
-            translated_content = self.file_processor.apply_translations(translations)
-
-            # Salva arquivo (com backup automático)
-            if self.file_processor.save_file(self.current_file, translated_content, create_backup=True):
+            # Aplica traduções e salva arquivo (com backup automático)
+            if self.file_processor.save_translations(self.current_file, translations, create_backup=True):
                 self.status_label.setText("Arquivo salvo com sucesso!")
 
+                # Grava contadores de uso acumulados durante as buscas na memória
+                if self.translation_memory.is_connected():
+                    self.translation_memory.flush_usage_counts()
+
                 # Obtém o caminho da pasta de backups
                 file_dir = os.path.dirname(os.path.abspath(self.current_file))
                 backup_dir = os.path.join(file_dir, "backups")
 
-                QMessageBox.information(
-                    self,
-                    "Sucesso",
-                    f"Arquivo traduzido salvo com sucesso!\n\n"
-                    f"Um backup do original foi criado em:\n{backup_dir}"
-                )
+                if memory_saved:
+                    QMessageBox.information(
+                        self,
+                        "Sucesso",
+                        f"Arquivo traduzido salvo com sucesso!\n\n"
+                        f"Um backup do original foi criado em:\n{backup_dir}"
+                    )
+                else:
+                    # O arquivo foi salvo, mas as edições continuam só na fila
+                    self.status_label.setText("Arquivo salvo; memória de tradução não gravada")
+                    QMessageBox.warning(
+                        self,
+                        "Aviso",
+                        f"Arquivo traduzido salvo, mas as edições não puderam ser gravadas "
+                        f"na memória de tradução. Elas continuam pendentes e serão gravadas "
+                        f"na próxima tentativa.\n\n"
+                        f"Um backup do original foi criado em:\n{backup_dir}"
+                    )
+                    app_logger.warning("Falha ao gravar as edições enfileiradas na memória de tradução")
                 app_logger.log_file_operation("save", self.current_file, True)
 
                 # Restaura status do Discord para "traduzindo"
@@ -3283,8 +3735,10 @@ class MainWindow(QMainWindow):
         if self.discord_rpc:
             self.discord_rpc.disconnect()
 
-        # Fecha conexão com banco de dados
+        # Grava as edições enfileiradas e fecha a conexão com o banco de dados
         if self.translation_memory:
+            if not self.translation_memory.flush_writes():
+                app_logger.warning("Edições enfileiradas não gravadas na memória de tradução")
             self.translation_memory.close()
 
         # Para timer de recursos
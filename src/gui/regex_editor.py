@@ -381,6 +381,11 @@ class ProfileEditorDialog(QDialog):
             exclude_patterns=self.exclude_editor.get_patterns(),
             file_type=self.type_combo.currentText()
         )
+
+        # Campos sem editor no formulário são mantidos do perfil original
+        if self.profile:
+            self.result_profile.max_match_span = self.profile.max_match_span
+            self.result_profile.selectors = list(self.profile.selectors)
         
         self.accept()
 
@@ -536,7 +541,10 @@ class RegexProfileManagerDialog(QDialog):
         
         self.detail_name.setText(f"Nome: {profile.name}")
         self.detail_desc.setText(f"Descrição: {profile.description or 'Sem descrição'}")
-        self.detail_type.setText(f"Tipo de Arquivo: {profile.file_type.upper()}")
+        file_type = f"Tipo de Arquivo: {profile.file_type.upper()}"
+        if profile.selectors:
+            file_type += f" | Seletores: {', '.join(profile.selectors)}"
+        self.detail_type.setText(file_type)
         
         self.detail_capture.setPlainText("\n".join(profile.capture_patterns))
         self.detail_exclude.setPlainText("\n".join(profile.exclude_patterns))
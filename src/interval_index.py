@@ -0,0 +1,76 @@
+"""
+Módulo de Índice de Intervalos
+Responde "este trecho do arquivo cai em uma região excluída?" em O(log n)
+
+- Intervalos semiabertos [início, fim), como os de match.span()
+- Sobreposições e intervalos adjacentes são unidos na construção, então o
+  índice guarda no máximo um intervalo por região contínua
+- Consultas por busca binária sobre os inícios ordenados
+"""
+
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Tuple
+
+
+class IntervalIndex:
+    """
+    Conjunto imutável de intervalos [início, fim) ordenados e sem sobreposição.
+
+    Construir custa O(n log n) (ordenação); cada consulta custa O(log n).
+    """
+
+    def __init__(self, spans: Iterable[Tuple[int, int]] = ()):
+        """
+        Cria o índice unindo os intervalos informados.
+
+        Args:
+            spans: Pares (início, fim) em qualquer ordem; intervalos vazios
+                (fim <= início) são ignorados
+        """
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+
+        for start, end in sorted(span for span in spans if span[1] > span[0]):
+            if self._ends and start <= self._ends[-1]:
+                if end > self._ends[-1]:
+                    self._ends[-1] = end
+            else:
+                self._starts.append(start)
+                self._ends.append(end)
+
+    @classmethod
+    def from_matches(cls, regexes: Iterable, content: str) -> 'IntervalIndex':
+        """
+        Cria o índice com as ocorrências de padrões compilados no conteúdo.
+
+        Args:
+            regexes: Padrões compilados (re.Pattern)
+            content: Texto onde os padrões são procurados
+        """
+        return cls(match.span() for regex in regexes for match in regex.finditer(content))
+
+    def contains(self, position: int) -> bool:
+        """Indica se a posição está dentro de algum intervalo"""
+        i = bisect_right(self._starts, position) - 1
+        return i >= 0 and position < self._ends[i]
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """
+        Indica se o trecho [início, fim) tem algum caractere em um intervalo.
+
+        Trechos vazios equivalem a contains(início).
+        """
+        if end <= start:
+            return self.contains(start)
+
+        # Último intervalo que começa até `start`, ou o primeiro depois dele
+        i = bisect_right(self._starts, start) - 1
+        if i >= 0 and start < self._ends[i]:
+            return True
+        return i + 1 < len(self._starts) and self._starts[i + 1] < end
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(zip(self._starts, self._ends))
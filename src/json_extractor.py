@@ -0,0 +1,249 @@
+"""
+Módulo de Extração Estrutural de JSON
+Extrai os valores string de um documento JSON com o caminho de cada um
+
+- Tokenizador com posição: cada valor sai com o trecho exato do arquivo
+  (entre as aspas, escapes preservados), então a reinserção é byte a byte
+- Cada valor leva seu caminho como JSON Pointer (RFC 6901), ex.: /items/0/label
+- Filtros por caminho compilados em uma trie: o estado da trie acompanha a
+  pilha do documento, então marcar um valor como filtrado custa um passo da
+  trie por nível (O(profundidade) por valor no pior caso)
+- Aceita comentários /* */ e // fora de strings (JSON de jogos costuma ter)
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional
+
+# Um token por ocorrência. Chave e ':' saem juntos (caso mais comum); strings
+# usam a forma "desenrolada", bem mais rápida que (?:[^"\\]|\\.)*
+_STRING = r'[^"\\]*(?:\\.[^"\\]*)*'
+_TOKEN = re.compile(rf'''
+    \s*(?:
+        "(?P<key>{_STRING})"\s*:
+      | "(?P<string>{_STRING})"
+      | (?P<open>[{{\[])
+      | (?P<close>[}}\]])
+      | (?P<comma>,)
+      | (?P<colon>:)
+      | (?P<comment>/\*.*?\*/|//[^\n]*)
+      | (?P<literal>[^\s{{}}\[\]:,"/]+)
+    )
+''', re.VERBOSE | re.DOTALL)
+
+
+@dataclass
+class JsonString:
+    """Valor string encontrado no documento"""
+    pointer: str      # Caminho JSON Pointer do valor
+    key: str          # Último segmento do caminho (chave ou índice)
+    raw: str          # Conteúdo entre as aspas, como está no arquivo
+    start: int        # Posição do primeiro caractere depois da aspa de abertura
+    end: int          # Posição da aspa de fechamento
+    filtered: bool    # Caminho casa algum padrão da trie de filtros
+
+
+def escape_pointer_segment(segment: str) -> str:
+    """Escapa um segmento de JSON Pointer ('~' vira '~0' e '/' vira '~1')"""
+    if '~' not in segment and '/' not in segment:
+        return segment
+    return segment.replace('~', '~0').replace('/', '~1')
+
+
+class PathTrie:
+    """
+    Trie de padrões de caminho JSON Pointer.
+
+    Segmentos literais casam exatamente; '*' casa um segmento qualquer e
+    '**' casa zero ou mais segmentos. Ex.: '/**/id' casa qualquer chave "id",
+    '/meta/*' casa os filhos diretos de /meta. Quando um caminho casa, todos
+    os descendentes dele também casam.
+
+    Um estado é o conjunto de nós ativos; step() avança um segmento.
+    """
+
+    def __init__(self, patterns: Iterable[str] = (), ignore_case: bool = False):
+        """
+        Compila os padrões.
+
+        Args:
+            patterns: Caminhos no formato JSON Pointer, com '*' e '**'
+            ignore_case: Compara segmentos sem diferenciar maiúsculas
+        """
+        self.ignore_case = ignore_case
+        self._children: List[Dict[str, int]] = [{}]
+        self._terminal: List[bool] = [False]
+        self._globstar = set()  # nós de '**', que consomem qualquer número de segmentos
+        # Transições já calculadas: estado -> (segmentos literais, {segmento: estado});
+        # segmentos sem literal correspondente dividem a chave None
+        self._transitions: Dict[FrozenSet[int], tuple] = {}
+        self._accepting: Dict[FrozenSet[int], bool] = {}
+
+        for pattern in patterns:
+            node = 0
+            for segment in pattern.strip('/').split('/') if pattern.strip('/') else []:
+                segment = segment.replace('~1', '/').replace('~0', '~')
+                if ignore_case and segment not in ('*', '**'):
+                    segment = segment.lower()
+                node = self._child(node, segment)
+            self._terminal[node] = True
+
+        self.initial = self._closure({0})
+
+    def _child(self, node: int, segment: str) -> int:
+        children = self._children[node]
+        if segment not in children:
+            children[segment] = len(self._children)
+            if segment == '**':
+                self._globstar.add(children[segment])
+            self._children.append({})
+            self._terminal.append(False)
+        return children[segment]
+
+    def _closure(self, nodes) -> FrozenSet[int]:
+        """Inclui os nós alcançáveis por '**' casando zero segmentos"""
+        result = set(nodes)
+        pending = list(nodes)
+        while pending:
+            child = self._children[pending.pop()].get('**')
+            if child is not None and child not in result:
+                result.add(child)
+                pending.append(child)
+        return frozenset(result)
+
+    def step(self, state: FrozenSet[int], segment: str) -> FrozenSet[int]:
+        """Estado depois de consumir um segmento do caminho"""
+        if not state:
+            return state
+
+        if self.ignore_case:
+            segment = segment.lower()
+
+        cached = self._transitions.get(state)
+        if cached is None:
+            literals = frozenset(key for node in state for key in self._children[node]
+                                 if key not in ('*', '**'))
+            cached = self._transitions[state] = (literals, {})
+        literals, transitions = cached
+
+        key = segment if segment in literals else None
+        following = transitions.get(key)
+        if following is None:
+            following = transitions[key] = self._step(state, segment)
+        return following
+
+    def _step(self, state: FrozenSet[int], segment: str) -> FrozenSet[int]:
+        if self.accepts(state):
+            # Depois de casar, todos os descendentes casam
+            return state
+
+        following = set()
+        for node in state:
+            children = self._children[node]
+            for key in (segment, '*'):
+                child = children.get(key)
+                if child is not None:
+                    following.add(child)
+            if node in self._globstar:
+                # '**' continua ativo consumindo este segmento
+                following.add(node)
+        return self._closure(following)
+
+    def accepts(self, state: FrozenSet[int]) -> bool:
+        """Indica se algum padrão termina no estado"""
+        accepted = self._accepting.get(state)
+        if accepted is None:
+            accepted = self._accepting[state] = any(self._terminal[node] for node in state)
+        return accepted
+
+
+def iter_json_strings(content: str, filters: Optional[PathTrie] = None) -> Iterator[JsonString]:
+    """
+    Percorre os valores string do documento (chaves não são valores).
+
+    Args:
+        content: Documento JSON
+        filters: Trie de caminhos; valores que casam saem com filtered=True
+
+    Yields:
+        Valores na ordem do documento
+
+    Raises:
+        ValueError: Se o documento não é JSON bem formado
+    """
+    trie = filters or PathTrie()
+    step = trie.step
+    accepts = trie.accepts
+    next_token = _TOKEN.match
+
+    # Pilha de contêineres: [é objeto, chave/índice atual, esperando chave,
+    # JSON Pointer do contêiner, estado da trie no contêiner]
+    stack: List[list] = []
+    position = 0
+    length = len(content)
+
+    while position < length:
+        match = next_token(content, position)
+        if match is None:
+            if content[position:].strip():
+                raise ValueError(f"JSON inválido na posição {position}")
+            break
+        position = match.end()
+        kind = match.lastgroup
+
+        if kind == 'string':
+            raw = match.group('string')
+            if not stack:
+                yield JsonString(pointer='', key='', raw=raw, start=match.start('string'),
+                                 end=match.end('string'), filtered=accepts(trie.initial))
+                continue
+
+            frame = stack[-1]
+            if frame[0]:
+                if frame[2]:
+                    # Chave separada do ':' (por comentário, por exemplo)
+                    frame[1] = json.loads(f'"{raw}"') if '\\' in raw else raw
+                    frame[2] = False
+                    continue
+                segment = frame[1]
+            else:
+                segment = str(frame[1])
+
+            yield JsonString(pointer=frame[3] + '/' + escape_pointer_segment(segment),
+                             key=segment, raw=raw, start=match.start('string'),
+                             end=match.end('string'), filtered=accepts(step(frame[4], segment)))
+
+        elif kind == 'key':
+            if not stack or not stack[-1][0]:
+                raise ValueError(f"JSON inválido na posição {match.start('key')}")
+            raw = match.group('key')
+            # Decodifica escapes só quando há algum
+            stack[-1][1] = json.loads(f'"{raw}"') if '\\' in raw else raw
+            stack[-1][2] = False
+
+        elif kind == 'comma':
+            if stack:
+                frame = stack[-1]
+                if frame[0]:
+                    frame[2] = True
+                else:
+                    frame[1] += 1
+
+        elif kind == 'open':
+            is_object = match.group('open') == '{'
+            if stack:
+                parent = stack[-1]
+                segment = parent[1] if parent[0] else str(parent[1])
+                pointer = parent[3] + '/' + escape_pointer_segment(segment)
+                state = step(parent[4], segment)
+            else:
+                pointer, state = '', trie.initial
+            stack.append([is_object, None if is_object else 0, is_object, pointer, state])
+
+        elif kind == 'close':
+            if not stack:
+                raise ValueError(f"JSON inválido na posição {match.start('close')}")
+            stack.pop()
+
+        # Comentários, ':' e literais (números, true, false, null) não mudam o estado
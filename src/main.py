@@ -7,6 +7,7 @@ Descrição: Ferramenta completa para tradução de arquivos JSON/XML preservand
 
 import sys
 import os
+import multiprocessing
 
 # Adiciona o diretório src ao path para imports funcionarem no executável
 if getattr(sys, 'frozen', False):
@@ -40,4 +41,6 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # Necessário no executável: os processos da extração em lote reexecutam o programa
+    multiprocessing.freeze_support()
     main()
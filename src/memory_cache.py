@@ -0,0 +1,175 @@
+"""
+Módulo de Cache de Buscas da Memória de Tradução
+Cache LRU limitado por tamanho para buscas exatas, incluindo misses
+
+- Entradas negativas: textos sem tradução também ficam em cache
+- Limite por número de entradas e por bytes estimados
+- Invalidação exata por chave ou por ID da tradução
+- Versão incrementada a cada invalidação: consultas iniciadas antes de
+  uma escrita não repovoam o cache com dados antigos
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+
+class LookupCache:
+    """
+    Cache LRU thread-safe de buscas exatas.
+
+    Cada valor é uma tupla (id, texto_traduzido) ou None para um miss.
+    O custo de uma entrada é estimado pelo tamanho dos textos mais um
+    overhead fixo por entrada (tupla, nó do OrderedDict e chave).
+    """
+
+    # Sentinela retornada por get() quando a chave não está em cache
+    MISSING = object()
+
+    # Overhead estimado por entrada além dos textos (bytes)
+    ENTRY_OVERHEAD = 200
+
+    def __init__(self, max_entries: int = 50000, max_bytes: int = 32 * 1024 * 1024):
+        """
+        Inicializa o cache.
+
+        Args:
+            max_entries: Número máximo de entradas
+            max_bytes: Tamanho máximo estimado em bytes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: OrderedDict = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._keys_by_id: Dict[int, Hashable] = {}
+        self._size_bytes = 0
+        self._version = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def version(self) -> int:
+        """Versão atual; muda a cada invalidação"""
+        return self._version
+
+    def get(self, key: Hashable):
+        """
+        Busca uma chave e a marca como usada recentemente.
+
+        Args:
+            key: Chave da busca
+
+        Returns:
+            Valor em cache (tupla ou None) ou LookupCache.MISSING
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return self.MISSING
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Optional[Tuple[int, str]], version: int):
+        """
+        Armazena o resultado de uma consulta.
+
+        Ignorado se houve invalidação desde que a consulta começou (a versão
+        mudou): o resultado pode ser anterior à escrita.
+
+        Args:
+            key: Chave da busca
+            value: Tupla (id, texto_traduzido) ou None para miss; o id é None
+                em acertos de memórias anexadas (fora do índice por id)
+            version: Valor de `version` lido antes da consulta
+        """
+        size = self._estimate_size(key, value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if version != self._version:
+                return
+
+            self._remove(key)
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._size_bytes += size
+            if value is not None and value[0] is not None:
+                self._keys_by_id[value[0]] = key
+
+            while self._entries and (len(self._entries) > self.max_entries
+                                     or self._size_bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, keys: Iterable[Hashable]):
+        """Remove chaves do cache (entradas positivas ou negativas)"""
+        with self._lock:
+            self._version += 1
+            for key in keys:
+                self._remove(key)
+
+    def invalidate_ids(self, ids: Iterable[int]):
+        """Remove as entradas positivas das traduções com os IDs informados"""
+        with self._lock:
+            self._version += 1
+            for translation_id in ids:
+                key = self._keys_by_id.get(translation_id)
+                if key is not None:
+                    self._remove(key)
+
+    def clear(self):
+        """Esvazia o cache (os contadores são mantidos)"""
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+            self._sizes.clear()
+            self._keys_by_id.clear()
+            self._size_bytes = 0
+
+    def get_stats(self) -> Dict:
+        """
+        Retorna estatísticas do cache.
+
+        Returns:
+            Dicionário com acertos, falhas, despejos, entradas e tamanho
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits / lookups * 100) if lookups else 0,
+                'entries': len(self._entries),
+                'size_bytes': self._size_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
+
+    def _remove(self, key: Hashable):
+        """Remove uma chave (chamado com o lock adquirido)"""
+        if key not in self._entries:
+            return
+
+        value = self._entries.pop(key)
+        self._size_bytes -= self._sizes.pop(key)
+        if value is not None and self._keys_by_id.get(value[0]) == key:
+            del self._keys_by_id[value[0]]
+
+    def _estimate_size(self, key: Hashable, value: Optional[Tuple[int, str]]) -> int:
+        """Estima os bytes ocupados por uma entrada"""
+        size = self.ENTRY_OVERHEAD + sum(sys.getsizeof(part) for part in key)
+        if value is not None:
+            size += sys.getsizeof(value[1])
+        return size
@@ -9,12 +9,17 @@ PERSISTÊNCIA DE PERFIS:
 - Suporta importação e exportação de perfis para compartilhamento
 """
 
+import heapq
 import json
 import os
 import re
 import shutil
 import unicodedata
-from typing import List, Dict, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple
+
+from interval_index import IntervalIndex
 
 
 def slugify(text: str) -> str:
@@ -60,11 +65,16 @@ def slugify(text: str) -> str:
 
 class RegexProfile:
     """Representa um perfil de regex para extração de texto"""
+
+    # Maior ocorrência (em caracteres) que a extração em janelas garante encontrar
+    DEFAULT_MAX_MATCH_SPAN = 16384
     
     def __init__(self, name: str, description: str = "", 
                  capture_patterns: List[str] = None,
                  exclude_patterns: List[str] = None,
-                 file_type: str = "json"):
+                 file_type: str = "json",
+                 max_match_span: int = DEFAULT_MAX_MATCH_SPAN,
+                 selectors: List[str] = None):
         """
         Inicializa um perfil de regex
         
@@ -74,12 +84,19 @@ class RegexProfile:
             capture_patterns: Lista de padrões regex para capturar texto
             exclude_patterns: Lista de padrões regex para excluir texto
             file_type: Tipo de arquivo (json ou xml)
+            max_match_span: Tamanho máximo de uma ocorrência (captura ou
+                exclusão), usado como sobreposição na extração em janelas
+            selectors: Seletores XML no estilo XPath (ex.: //label,
+                //string/@text); se houver, a extração de XML usa o parser
+                e os padrões de captura ficam para documentos malformados
         """
         self.name = name
         self.description = description
         self.capture_patterns = capture_patterns or []
         self.exclude_patterns = exclude_patterns or []
         self.file_type = file_type
+        self.max_match_span = max_match_span
+        self.selectors = selectors or []
     
     def to_dict(self) -> dict:
         """Converte o perfil para dicionário"""
@@ -88,7 +105,9 @@ class RegexProfile:
             'description': self.description,
             'capture_patterns': self.capture_patterns,
             'exclude_patterns': self.exclude_patterns,
-            'file_type': self.file_type
+            'file_type': self.file_type,
+            'max_match_span': self.max_match_span,
+            'selectors': self.selectors
         }
     
     @classmethod
@@ -99,9 +118,122 @@ class RegexProfile:
             description=data.get('description', ''),
             capture_patterns=data.get('capture_patterns', []),
             exclude_patterns=data.get('exclude_patterns', []),
-            file_type=data.get('file_type', 'json')
+            file_type=data.get('file_type', 'json'),
+            max_match_span=data.get('max_match_span', cls.DEFAULT_MAX_MATCH_SPAN),
+            selectors=data.get('selectors', [])
         )
 
+
+class CompiledProfile:
+    """
+    Perfil de regex pré-compilado para extração.
+
+    Cada padrão de captura é pesquisado em uma passada própria, como na
+    extração original, e as ocorrências são intercaladas por posição (empate:
+    ordem no perfil). Assim um padrão não esconde outro: em
+    <string text="A">B</string>, text="..." e <string>...</string> entregam
+    os dois textos. Isso foge da alternação única em uma passada: a
+    alternação não devolve ocorrências sobrepostas, e pesquisar de novo o
+    trecho de cada ocorrência com os outros padrões ficou mais lento que as
+    passadas separadas (uma busca por trecho e padrão em Python contra um
+    finditer em C por padrão).
+
+    Só é descartada a ocorrência cujo texto sobrepõe o texto de uma já
+    aceita (a reinserção das traduções não conseguiria aplicar as duas). Os
+    padrões de exclusão são pré-compilados e consultados por um IntervalIndex.
+    """
+
+    def __init__(self, capture_patterns: List[str], exclude_patterns: List[str],
+                 encoding: Optional[str] = None):
+        """
+        Compila os padrões do perfil.
+
+        Args:
+            capture_patterns: Padrões de captura (o último grupo é o texto)
+            exclude_patterns: Padrões cujas ocorrências não são extraídas
+            encoding: Se informado, os padrões são compilados como bytes nesse
+                encoding (para buscar direto no arquivo, sem decodificar)
+        """
+        def compile_pattern(pattern):
+            return re.compile(pattern.encode(encoding) if encoding else pattern)
+
+        self.exclude_regexes: List[re.Pattern] = []
+        for pattern in exclude_patterns:
+            try:
+                self.exclude_regexes.append(compile_pattern(pattern))
+            except (re.error, UnicodeEncodeError) as e:
+                print(f"Erro no padrão de exclusão '{pattern}': {e}")
+
+        # Padrões com grupos, na ordem do perfil (repetidos só uma vez)
+        self.capture_regexes: List[re.Pattern] = []
+        for pattern in capture_patterns:
+            try:
+                regex = compile_pattern(pattern)
+            except (re.error, UnicodeEncodeError) as e:
+                print(f"Erro no padrão de captura '{pattern}': {e}")
+                continue
+
+            if regex.groups and regex not in self.capture_regexes:
+                self.capture_regexes.append(regex)
+
+    def iter_matches(self, content, pos=0,
+                     accepted: Iterable[Tuple[int, int]] = ()) -> Iterator[Tuple[re.Match, int]]:
+        """
+        Percorre as ocorrências de captura no conteúdo, na ordem do arquivo.
+
+        Args:
+            content: Texto (ou bytes, se o perfil foi compilado com encoding)
+            pos: Posição onde a busca começa (lookbehinds ainda enxergam antes
+                dela) ou uma posição por padrão, na ordem de capture_regexes
+            accepted: Trechos de texto (início, fim) já aceitos antes desta
+                busca; ocorrências cujo texto os sobrepõe são descartadas
+
+        Yields:
+            Pares (match, índice do grupo com o texto)
+        """
+        positions = [pos] * len(self.capture_regexes) if isinstance(pos, int) else pos
+        scans = [((match.start(), order, match) for match in regex.finditer(content, start))
+                 for order, (regex, start) in enumerate(zip(self.capture_regexes, positions))]
+
+        active = list(accepted)
+        for start, _, match in heapq.merge(*scans, key=itemgetter(0, 1)):
+            text_group = match.re.groups
+            text_start, text_end = match.span(text_group)
+            if text_start >= 0:
+                # Textos já aceitos que terminam antes desta ocorrência não a alcançam
+                active = [span for span in active if span[1] > start]
+                if any(span_start < text_end and text_start < span_end
+                       for span_start, span_end in active):
+                    continue
+                active.append((text_start, text_end))
+            yield match, text_group
+
+    def excluded_index(self, content) -> IntervalIndex:
+        """Índice das regiões do conteúdo cobertas pelos padrões de exclusão"""
+        return IntervalIndex.from_matches(self.exclude_regexes, content)
+
+
+@lru_cache(maxsize=32)
+def _compile_patterns(capture_patterns: Tuple[str, ...], exclude_patterns: Tuple[str, ...],
+                      encoding: Optional[str]) -> CompiledProfile:
+    return CompiledProfile(list(capture_patterns), list(exclude_patterns), encoding)
+
+
+def compile_profile(profile: 'RegexProfile', encoding: Optional[str] = None) -> CompiledProfile:
+    """
+    Compila um perfil, reaproveitando a compilação de padrões idênticos.
+
+    O cache é pelos padrões (não pelo objeto), então editar o perfil gera
+    uma nova compilação automaticamente.
+
+    Args:
+        profile: Perfil a compilar
+        encoding: Compila os padrões como bytes nesse encoding (None = texto)
+    """
+    return _compile_patterns(tuple(profile.capture_patterns), tuple(profile.exclude_patterns),
+                             encoding)
+
+
 class RegexProfileManager:
     """Gerencia perfis de regex com persistência em arquivos JSON"""
     
@@ -119,6 +251,8 @@ class RegexProfileManager:
         """
         self.profiles_dir = profiles_dir
         self.profiles: Dict[str, RegexProfile] = {}
+        # Perfis lidos de arquivos anteriores aos seletores (sem o campo)
+        self._profiles_without_selectors = set()
         
         # MUDANÇA: Cria diretório se não existir (garante persistência)
         os.makedirs(profiles_dir, exist_ok=True)
@@ -204,7 +338,8 @@ class RegexProfileManager:
                 r'key="[^"]+"',
                 r'<!--.*?-->',
             ],
-            file_type="xml"
+            file_type="xml",
+            selectors=['//@text', '//string']
         )
         default_profiles.append(bannerlord_profile)
         
@@ -221,15 +356,25 @@ class RegexProfileManager:
                 r'<defName>.*?</defName>',
                 r'<!--.*?-->',
             ],
-            file_type="xml"
+            file_type="xml",
+            # Rótulos e descrições das Defs e as chaves dos arquivos de idioma
+            selectors=['//label', '//description', '/LanguageData/*']
         )
         default_profiles.append(rimworld_profile)
         
         # MUDANÇA: Salva apenas perfis que ainda não existem
         # Isso preserva customizações do usuário em perfis padrão
         for profile in default_profiles:
-            if profile.name not in self.profiles:
+            existing = self.profiles.get(profile.name)
+            if existing is None:
                 self.save_profile(profile)
+            elif (profile.selectors and profile.name in self._profiles_without_selectors
+                  and existing.capture_patterns == profile.capture_patterns):
+                # Arquivo salvo antes dos seletores, com os padrões originais:
+                # ganha os seletores padrão (perfis personalizados ficam como estão)
+                existing.selectors = list(profile.selectors)
+                self.save_profile(existing)
+                self._profiles_without_selectors.discard(profile.name)
     
     def save_profile(self, profile: RegexProfile) -> bool:
         """
@@ -276,6 +421,8 @@ class RegexProfileManager:
                 data = json.load(f)
             
             profile = RegexProfile.from_dict(data)
+            if 'selectors' not in data:
+                self._profiles_without_selectors.add(profile.name)
             # Armazena usando o nome original do perfil como chave
             self.profiles[profile.name] = profile
             return profile
@@ -379,16 +379,18 @@ class SmartTranslator:
         
         return results
     
-    def learn_pattern(self, original: str, translated: str):
+    def learn_pattern(self, original: str, translated: str, store: bool = True):
         """
         Aprende um novo padrão de tradução
         
         Args:
             original: Texto original
             translated: Texto traduzido
+            store: Se False, não grava na memória (quem chama já enfileirou)
         """
         # Adiciona à memória
-        self.memory.add_translation(original, translated)
+        if store:
+            self.memory.add_translation(original, translated)
         
         # Detecta e armazena padrão numérico
         match_orig = re.match(r'^(.+?)\s*(\d+)$', original)
@@ -0,0 +1,312 @@
+"""
+Módulo de Extração em Fluxo (streaming)
+Extrai e reinsere traduções em arquivos maiores que a memória
+
+- O arquivo é lido em janelas de bytes e cada janela é pesquisada com o
+  perfil compilado como bytes, sem decodificar o arquivo inteiro
+- Entre janelas fica uma sobreposição do tamanho máximo de uma ocorrência
+  (max_match_span do perfil), então nada é cortado na fronteira
+- As entradas saem de um gerador, com posições absolutas em bytes
+- O escritor copia o arquivo para a saída trocando só os trechos traduzidos
+
+Diferente do FileProcessor, todas as ocorrências são entregues (não há
+remoção de duplicatas, que exigiria guardar todos os textos).
+
+Perfis XML com seletores usam o parser expat em blocos (xml_extractor) em
+vez das janelas de regex; nesse caso os padrões de exclusão do perfil não
+se aplicam (os seletores já escolhem o que extrair); XML malformado gera
+ValueError (não há como voltar para a regex no meio do fluxo).
+"""
+
+import codecs
+import os
+import re
+import shutil
+import tempfile
+from typing import Dict, Iterator, Optional, Tuple
+
+from file_processor import TranslationEntry, detect_encoding
+from interval_index import IntervalIndex
+from regex_profiles import RegexProfile, compile_profile
+from xml_extractor import XmlSelector, iter_xml_nodes
+
+# Bytes lidos do disco por janela
+STREAMING_WINDOW_BYTES = 4 * 1024 * 1024
+
+# Bytes copiados por vez entre trechos traduzidos
+COPY_CHUNK_BYTES = 1024 * 1024
+
+# Perfis usados quando nenhum é informado, com os filtros da extração padrão.
+# XML: a mesma regex da extração padrão do FileProcessor.
+# JSON: o tokenizador estrutural precisa do documento inteiro, então o fluxo
+# usa a regex da extração de JSON inválido: só pares "chave": "valor" sem
+# aspas escapadas (valores de listas e strings com \" não são extraídos) e
+# sem caminho JSON Pointer nas entradas
+DEFAULT_STREAMING_PROFILES = {
+    'json': RegexProfile(
+        name="JSON (fluxo)",
+        capture_patterns=[r'"([^"]+)"\s*:\s*"([^"]+)"'],
+        exclude_patterns=[r'(?s:/\*.*?\*/)'],
+        file_type="json"
+    ),
+    'xml': RegexProfile(
+        name="XML (fluxo)",
+        capture_patterns=[r'>([^<>]+)<'],
+        exclude_patterns=[r'(?s:<!--.*?-->)'],
+        file_type="xml"
+    ),
+}
+
+# Encodings em que bytes ASCII sempre são caracteres ASCII (os padrões podem
+# ser buscados direto nos bytes); os multibyte ficam só com o UTF-8
+_SINGLE_BYTE_PREFIXES = ('iso8859', 'cp125', 'latin', 'ascii')
+
+_ID_LIKE = re.compile(r'^[a-z_0-9]+$')
+_TECHNICAL_KEYS = ('id', 'key', 'type', 'name')
+
+
+def _byte_encoding(encoding: str, filepath: str) -> Tuple[str, int]:
+    """
+    Encoding usado nos padrões em bytes e bytes de BOM a pular.
+
+    Raises:
+        ValueError: Se o encoding não permite busca direta nos bytes (UTF-16,
+            Shift-JIS etc.)
+    """
+    name = codecs.lookup(encoding).name
+    if name == 'utf-8-sig':
+        with open(filepath, 'rb') as f:
+            skip = len(codecs.BOM_UTF8) if f.read(3) == codecs.BOM_UTF8 else 0
+        return 'utf-8', skip
+    if name == 'utf-8' or name.startswith(_SINGLE_BYTE_PREFIXES):
+        return name, 0
+    raise ValueError(f"Encoding não suportado na extração em fluxo: {encoding}")
+
+
+class StreamingExtractor:
+    """
+    Extrator em janelas com memória limitada.
+
+    A memória usada é de uma janela mais duas sobreposições, qualquer que
+    seja o tamanho do arquivo. Ocorrências maiores que max_match_span do
+    perfil não são garantidas.
+    """
+
+    def __init__(self, profile: Optional[RegexProfile] = None, file_type: str = 'xml',
+                 window_bytes: int = STREAMING_WINDOW_BYTES):
+        """
+        Inicializa o extrator.
+
+        Args:
+            profile: Perfil de regex (None = extração padrão do file_type)
+            file_type: Tipo de arquivo usado sem perfil (json ou xml)
+            window_bytes: Bytes lidos do disco por janela
+        """
+        self.profile = profile
+        self.default_filters = profile is None
+        if profile is None:
+            self.profile = DEFAULT_STREAMING_PROFILES.get(file_type, DEFAULT_STREAMING_PROFILES['xml'])
+        self.window_bytes = window_bytes
+
+    def iter_entries(self, filepath: str, encoding: str = None) -> Iterator[TranslationEntry]:
+        """
+        Extrai as entradas do arquivo, em ordem, com memória limitada.
+
+        Args:
+            filepath: Caminho do arquivo
+            encoding: Encoding do arquivo (None = detectar)
+
+        Yields:
+            Entradas com `position` em bytes desde o início do arquivo
+
+        Raises:
+            ValueError: Se o encoding não é suportado em fluxo ou, com
+                seletores, se o XML é malformado
+        """
+        encoding, skip = _byte_encoding(encoding or detect_encoding(filepath), filepath)
+        if self.profile.selectors and self.profile.file_type == 'xml':
+            yield from self._iter_xml_entries(filepath, encoding)
+            return
+
+        compiled = compile_profile(self.profile, encoding)
+        bytes_per_char = 4 if encoding == 'utf-8' else 1
+        overlap = max(1, self.profile.max_match_span) * bytes_per_char
+        # A janela precisa ser maior que a sobreposição para a busca avançar
+        window = max(self.window_bytes, 2 * overlap)
+
+        order_of = {regex: order for order, regex in enumerate(compiled.capture_regexes)}
+
+        index = 0
+        with open(filepath, 'rb') as f:
+            f.seek(skip)
+            buffer = b''
+            base = skip      # posição absoluta de buffer[0]
+            # Início da busca de cada padrão (antes dele só há contexto): depois
+            # da última ocorrência do padrão, como numa passada pelo arquivo todo
+            resume = [0] * len(order_of)
+            accepted = []    # textos aceitos que alcançam esta janela (relativos)
+            carried = []     # regiões excluídas da janela anterior (absolutas)
+
+            while True:
+                chunk = f.read(window)
+                eof = len(chunk) < window
+                buffer += chunk
+
+                # Ocorrências que começam depois do limite ainda podem crescer
+                # com a próxima janela: ficam para ela
+                limit = len(buffer) if eof else len(buffer) - overlap
+
+                excluded = IntervalIndex(carried + [(base + start, base + end) for start, end
+                                                    in compiled.excluded_index(buffer)])
+
+                ends = [max(limit, start) for start in resume]
+                spans = []
+                for match, text_group in compiled.iter_matches(buffer, resume, accepted):
+                    if match.start() >= limit:
+                        break
+                    if not eof and match.end() >= len(buffer):
+                        # Maior que a sobreposição: pode estar truncada
+                        continue
+                    order = order_of[match.re]
+                    ends[order] = max(ends[order], match.end())
+                    if match.start(text_group) >= 0:
+                        spans.append(match.span(text_group))
+
+                    entry = self._make_entry(match, text_group, base, encoding, excluded, index)
+                    if entry is not None:
+                        index += 1
+                        yield entry
+
+                if eof:
+                    return
+
+                # Mantém uma sobreposição antes do limite como contexto (lookbehind)
+                keep_from = max(0, limit - overlap)
+                carried = [(start, end) for start, end in excluded if end > base + keep_from]
+                accepted = [(start - keep_from, end - keep_from)
+                            for start, end in accepted + spans if end > limit]
+                buffer = buffer[keep_from:]
+                base += keep_from
+                resume = [end - keep_from for end in ends]
+
+    def _iter_xml_entries(self, filepath: str, encoding: str) -> Iterator[TranslationEntry]:
+        """Entradas dos seletores do perfil, pelo parser (posições em bytes, BOM incluído)"""
+        selector = XmlSelector(self.profile.selectors)
+        index = 0
+        with open(filepath, 'rb') as f:
+            for node in iter_xml_nodes(f, selector, encoding, chunk_bytes=self.window_bytes):
+                # Ignora textos vazios ou muito curtos
+                if len(node.raw) < 2:
+                    continue
+
+                context = (f'{node.name}="{node.raw}"' if node.attribute
+                           else f'<{node.name}>{node.raw}</{node.name}>')
+                yield TranslationEntry(index=index, original_text=node.raw, position=node.start,
+                                       context=context, path=node.path)
+                index += 1
+
+    def _make_entry(self, match, text_group: int, base: int, encoding: str,
+                    excluded: IntervalIndex, index: int) -> Optional[TranslationEntry]:
+        """Cria a entrada de uma ocorrência (None se ela deve ser ignorada)"""
+        raw = match.group(text_group)
+        if raw is None:
+            return None
+
+        stripped = raw.strip()
+        try:
+            text = stripped.decode(encoding)
+        except UnicodeDecodeError:
+            return None
+
+        # Ignora textos vazios ou muito curtos
+        if len(text) < 2:
+            return None
+
+        # Mesmos filtros da extração padrão: números, valores que parecem IDs
+        # e, no JSON, valores curtos de chaves técnicas (a chave é o grupo anterior)
+        if self.default_filters:
+            if text.isdigit() or _ID_LIKE.match(text):
+                return None
+            if (self.profile.file_type == 'json' and len(text) < 50
+                    and match.group(text_group - 1).decode(encoding, 'replace').lower() in _TECHNICAL_KEYS):
+                return None
+
+        position = base + match.start(text_group) + (len(raw) - len(raw.lstrip()))
+        if excluded.overlaps(position, position + len(stripped)):
+            return None
+
+        return TranslationEntry(
+            index=index,
+            original_text=text,
+            position=position,
+            context=match.group(0).decode(encoding, 'replace')
+        )
+
+    def write_translations(self, source_path: str, output_path: str,
+                           translations: Dict[str, str], encoding: str = None) -> Optional[int]:
+        """
+        Copia o arquivo trocando as ocorrências traduzidas, numa única passada.
+
+        A saída é gravada num arquivo temporário ao lado de output_path e só
+        substitui o destino no final, então output_path pode ser o próprio
+        arquivo original e uma falha no meio não deixa o destino truncado.
+
+        Args:
+            source_path: Arquivo original
+            output_path: Arquivo de saída (pode ser o original)
+            translations: Dicionário {texto_original: texto_traduzido}
+            encoding: Encoding do arquivo (None = detectar)
+
+        Returns:
+            Número de trechos substituídos, ou None em caso de erro
+        """
+        temp_path = None
+        try:
+            encoding = encoding or detect_encoding(source_path)
+            byte_encoding, _ = _byte_encoding(encoding, source_path)
+            replaced = 0
+
+            output_dir = os.path.dirname(os.path.abspath(output_path))
+            fd, temp_path = tempfile.mkstemp(dir=output_dir, suffix='.tmp')
+
+            with open(source_path, 'rb') as source, os.fdopen(fd, 'wb') as target:
+                cursor = 0
+                for entry in self.iter_entries(source_path, encoding):
+                    translated = translations.get(entry.original_text)
+                    if not translated:
+                        continue
+
+                    self._copy_range(source, target, cursor, entry.position)
+                    target.write(translated.encode(byte_encoding))
+                    cursor = entry.position + len(entry.original_text.encode(byte_encoding))
+                    replaced += 1
+
+                self._copy_range(source, target, cursor, None)
+
+            # mkstemp cria com 0600; mantém as permissões do original
+            shutil.copymode(source_path, temp_path)
+            os.replace(temp_path, output_path)
+            temp_path = None
+            return replaced
+
+        except Exception as e:
+            print(f"Erro ao gravar arquivo em fluxo: {e}")
+            return None
+
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    @staticmethod
+    def _copy_range(source, target, start: int, end: Optional[int]):
+        """Copia source[start:end] para target em blocos (end None = até o fim)"""
+        source.seek(start)
+        remaining = None if end is None else end - start
+        while remaining is None or remaining > 0:
+            size = COPY_CHUNK_BYTES if remaining is None else min(COPY_CHUNK_BYTES, remaining)
+            data = source.read(size)
+            if not data:
+                break
+            target.write(data)
+            if remaining is not None:
+                remaining -= len(data)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Testes do Processamento em Lote (batch_processor.py)
+"""
+
+import os
+import sys
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import batch_processor
+from batch_processor import BatchProcessor
+from regex_profiles import RegexProfileManager
+
+
+def _make_tree(root):
+    for i in range(6):
+        folder = root / f'mod{i % 2}'
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f'defs{i}.xml').write_text(
+            f'<Defs><ThingDef><label>Thing label {i}</label></ThingDef></Defs>\n', encoding='utf-8')
+        (folder / f'lang{i}.json').write_text(
+            f'{{"title": "Window title {i}", "id": "x{i}"}}\n', encoding='utf-8')
+    (root / 'removed.xml').write_bytes(b'<Defs/>')
+
+
+def test_parallel_extraction_matches_sequential(tmp_path):
+    _make_tree(tmp_path / 'tree')
+    manager = RegexProfileManager(str(tmp_path / 'profiles'))
+
+    results = {}
+    for workers in (1, 2):
+        processor = BatchProcessor(manager, max_workers=workers)
+        processor.scan_directory(str(tmp_path / 'tree'))
+        # Arquivo que some depois da varredura: erro só nele
+        (tmp_path / 'tree' / 'removed.xml').unlink()
+        progress = []
+        processor.set_progress_callback(lambda current, total, message: progress.append((current, total)))
+
+        entries = processor.extract_all_texts()
+        results[workers] = [(info.filepath, entry.original_text, entry.position)
+                            for info, entry in entries]
+        assert progress == [(i, 13) for i in range(1, 14)]
+        assert [info.status for info in processor.files].count('extracted') == 12
+        (tmp_path / 'tree' / 'removed.xml').write_bytes(b'<Defs/>')
+
+    assert results[1] == results[2]
+    assert len(results[1]) == 12
+
+
+def test_default_workers_are_capped_and_small_batches_stay_sequential(tmp_path, monkeypatch):
+    _make_tree(tmp_path / 'tree')
+    pools = []
+
+    def fake_pool(max_workers):
+        pools.append(max_workers)
+        raise OSError("sem processos")  # cai no caminho sequencial
+
+    monkeypatch.setattr(batch_processor, 'ProcessPoolExecutor', fake_pool)
+    monkeypatch.setattr(batch_processor.os, 'cpu_count', lambda: 64)
+
+    processor = BatchProcessor(RegexProfileManager(str(tmp_path / 'profiles')))
+    processor.scan_directory(str(tmp_path / 'tree'))
+    assert len(processor.extract_all_texts()) == 12
+    assert pools == []
+
+    processor.PARALLEL_MIN_FILES = 1
+    processor.extract_all_texts()
+    assert pools == [BatchProcessor.DEFAULT_MAX_WORKERS]
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Testes do Filtro de Bloom (bloom_filter.py)
+"""
+
+import os
+import sys
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bloom_filter import BloomFilter
+from database import text_hash
+
+
+def test_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(capacity=5000, false_positive_rate=0.01)
+    bloom.update(text_hash(f"present {i}") for i in range(5000))
+
+    assert all(bloom.might_contain(text_hash(f"present {i}")) for i in range(5000))
+
+    false_positives = sum(bloom.might_contain(text_hash(f"absent {i}")) for i in range(20000))
+    assert false_positives / 20000 < 0.03
+    assert not bloom.is_saturated()
+
+
+def test_serialization_round_trip():
+    bloom = BloomFilter(capacity=100)
+    bloom.add(text_hash("Sword"))
+    bloom.add(-1)
+
+    restored = BloomFilter.from_bytes(bloom.to_bytes())
+    assert restored.might_contain(text_hash("Sword"))
+    assert restored.might_contain(-1)
+    assert (restored.num_bits, restored.num_hashes, restored.count) == (
+        bloom.num_bits, bloom.num_hashes, 2
+    )
+
+    assert BloomFilter.from_bytes(b"invalid") is None
+    assert BloomFilter.from_bytes(bloom.to_bytes()[:-1]) is None
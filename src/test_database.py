@@ -0,0 +1,926 @@
+#!/usr/bin/env python3
+"""
+Testes da Memória de Tradução (database.py)
+Valida o comportamento do SQLite: pool de conexões, leituras e escritas
+"""
+
+import gzip
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+import pytest
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from database import ZSTD_AVAILABLE, TranslationMemory, text_hash
+
+
+def _new_memory(tmp_path) -> TranslationMemory:
+    """Cria uma memória de tradução em um diretório temporário"""
+    return TranslationMemory(str(tmp_path / "memory.db"))
+
+
+def test_add_and_get_translation(tmp_path):
+    """Testa inserção e busca simples"""
+    memory = _new_memory(tmp_path)
+    try:
+        assert memory.add_translation("Sword", "Espada")
+        assert memory.get_translation("Sword") == "Espada"
+        assert memory.get_translation("Shield") is None
+    finally:
+        memory.close()
+
+
+def test_reads_do_not_wait_for_writer_transaction(tmp_path):
+    """Leitores devem consultar o banco enquanto o escritor mantém uma transação aberta"""
+    memory = _new_memory(tmp_path)
+    try:
+        memory.add_translation("Sword", "Espada")
+
+        result = {}
+
+        def reader():
+            result['value'] = memory.get_translations_batch(["Sword"])
+
+        # INSERT direto em SQL não passa pelo filtro de Bloom da API
+        memory._bloom_add([text_hash("Shield")])
+
+        with memory._transaction() as cursor:
+            cursor.execute(
+                "INSERT INTO translations (original_text, original_text_hash, translated_text) "
+                "VALUES (?, ?, ?)",
+                ("Shield", text_hash("Shield"), "Escudo")
+            )
+            thread = threading.Thread(target=reader)
+            thread.start()
+            thread.join(timeout=5)
+
+            assert not thread.is_alive()
+            # O leitor enxerga apenas o último commit
+            assert result['value'] == {"Sword": "Espada"}
+
+        assert memory.get_translations_batch(["Shield"]) == {"Shield": "Escudo"}
+    finally:
+        memory.close()
+
+
+def test_reader_connections_are_per_thread(tmp_path):
+    """Cada thread recebe sua própria conexão de leitura; threads mortas são liberadas"""
+    memory = _new_memory(tmp_path)
+    try:
+        memory.get_stats()
+        assert memory._pool.reader_count() == 1
+
+        threads = [threading.Thread(target=memory.get_stats) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Uma nova thread força a limpeza das conexões de threads encerradas
+        thread = threading.Thread(target=memory.get_stats)
+        thread.start()
+        thread.join()
+        assert memory._pool.reader_count() <= 2
+    finally:
+        memory.close()
+
+
+def test_lookups_do_not_write_until_flush(tmp_path):
+    """Buscas acumulam o uso em memória e só escrevem no flush"""
+    memory = _new_memory(tmp_path)
+    try:
+        memory.add_translations_batch([(f"Text {i}", f"Texto {i}") for i in range(50)])
+        changes_before = memory.conn.total_changes
+
+        for _ in range(3):
+            for i in range(50):
+                assert memory.get_translation(f"Text {i}") == f"Texto {i}"
+        assert memory.lookup_translation("Text 0") == "Texto 0"
+
+        assert memory.conn.total_changes == changes_before
+        assert memory.get_pending_usage_count() == 150
+
+        assert memory.flush_usage_counts() == 50
+        assert memory.get_pending_usage_count() == 0
+
+        row = memory.get_all_translations(search_term="Text 7")[0]
+        assert row['usage_count'] == 4  # 1 da inserção + 3 buscas
+    finally:
+        memory.close()
+
+
+def test_pending_usage_is_flushed_on_close(tmp_path):
+    """Contadores pendentes são gravados ao fechar a conexão"""
+    memory = _new_memory(tmp_path)
+    memory.add_translation("Sword", "Espada")
+    memory.get_translation("Sword")
+    memory.close()
+
+    memory = _new_memory(tmp_path)
+    try:
+        assert memory.get_stats()['total_usage'] == 2
+    finally:
+        memory.close()
+
+
+def test_bulk_upsert_streams_generator_with_progress(tmp_path):
+    """Upsert em massa consome geradores em chunks e reporta progresso por commit"""
+    memory = _new_memory(tmp_path)
+    try:
+        progress = []
+        rows = ((f"Text {i}", f"Texto {i}") for i in range(2500))
+
+        inserted, errors = memory.add_translations_bulk(
+            rows, chunk_size=100, commit_every=1000,
+            progress_callback=lambda done, total: progress.append((done, total))
+        )
+
+        assert (inserted, errors) == (2500, 0)
+        assert progress == [(1000, 0), (2000, 0), (2500, 0)]
+        assert memory.get_stats()['total_translations'] == 2500
+    finally:
+        memory.close()
+
+
+def test_bulk_upsert_isolates_bad_rows(tmp_path):
+    """Linhas inválidas contam como erro sem descartar o restante do chunk"""
+    memory = _new_memory(tmp_path)
+    try:
+        rows = [("Sword", "Espada"), ("Broken", None), ("Shield", "Escudo"), ("malformed",)]
+
+        inserted, errors = memory.add_translations_bulk(rows, chunk_size=10)
+
+        assert (inserted, errors) == (2, 2)
+        assert memory.get_translations_batch(["Sword", "Shield", "Broken"]) == {
+            "Sword": "Espada", "Shield": "Escudo"
+        }
+    finally:
+        memory.close()
+
+
+def test_import_from_file_streams_csv(tmp_path):
+    """Importação de CSV usa o caminho em massa e reporta progresso em bytes"""
+    csv_path = tmp_path / "memory.csv"
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        f.write("ID,Original,Tradução,Categoria,Notas,Usos\n")
+        for i in range(300):
+            f.write(f'{i},"Text, {i}",Texto {i},general,,1\n')
+
+    memory = _new_memory(tmp_path)
+    try:
+        progress = []
+        imported, errors = memory.import_from_file(
+            str(csv_path), progress_callback=lambda done, total: progress.append((done, total))
+        )
+
+        assert (imported, errors) == (300, 0)
+        assert progress[-1] == (os.path.getsize(csv_path), os.path.getsize(csv_path))
+        assert memory.get_translation("Text, 42") == "Texto 42"
+    finally:
+        memory.close()
+
+
+def test_language_pairs_are_independent(tmp_path):
+    """Um mesmo texto pode ter traduções diferentes por par de idiomas"""
+    memory = _new_memory(tmp_path)
+    try:
+        memory.add_translation("Sword", "Espada")
+        memory.add_translation("Sword", "Épée", target_lang='fr')
+        memory.add_translations_batch([("Shield", "Bouclier")], target_lang='fr')
+
+        assert memory.get_translation("Sword") == "Espada"
+        assert memory.get_translation("Sword", target_lang='fr') == "Épée"
+        assert memory.get_translations_batch(["Sword", "Shield"], target_lang='fr') == {
+            "Sword": "Épée", "Shield": "Bouclier"
+        }
+
+        memory.set_language_pair('en', 'fr')
+        assert memory.lookup_translation("Shield") == "Bouclier"
+        assert memory.get_language_pairs() == [('en', 'fr'), ('en', 'pt')]
+    finally:
+        memory.close()
+
+
+def test_migrates_version_1_schema(tmp_path):
+    """Bancos 1.x (UNIQUE(original_text)) são migrados preservando os dados"""
+    import sqlite3
+
+    db_path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript('''
+        CREATE TABLE translations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            original_text TEXT NOT NULL UNIQUE,
+            translated_text TEXT NOT NULL,
+            source_language TEXT DEFAULT 'en',
+            target_language TEXT DEFAULT 'pt',
+            category TEXT DEFAULT 'general',
+            notes TEXT DEFAULT '',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            usage_count INTEGER DEFAULT 1
+        );
+        CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT);
+        CREATE INDEX idx_original_text ON translations(original_text);
+        INSERT INTO metadata VALUES ('version', '1.0');
+        INSERT INTO translations (id, original_text, translated_text, notes, usage_count)
+        VALUES (7, 'Sword', 'Espada', 'arma', 5);
+    ''')
+    conn.commit()
+    conn.close()
+
+    memory = TranslationMemory(db_path)
+    try:
+        assert memory.get_metadata('version') == '2.0'
+        row = memory.get_translation_by_id(7)
+        assert (row['original_text'], row['notes'], row['usage_count']) == ('Sword', 'arma', 5)
+        assert memory.get_translation("Sword") == "Espada"
+
+        indexes = {r[0] for r in memory.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'translations'"
+        )}
+        assert 'idx_original_text' not in indexes
+        assert 'idx_language_pair_hash' in indexes
+
+        # Novos pares de idiomas podem coexistir com os dados migrados
+        assert memory.add_translation("Sword", "Espadón", target_lang='es')
+        assert memory.get_stats()['total_translations'] == 2
+    finally:
+        memory.close()
+
+
+def test_fulltext_index_follows_inserts_updates_and_deletes(tmp_path):
+    memory = _new_memory(tmp_path)
+    try:
+        memory.add_translation("The iron sword is sharp", "A espada de ferro é afiada")
+        memory.add_translation("Wooden shield", "Escudo de madeira")
+        memory.add_translation("Short sword", "Espada curta")
+
+        results = memory.search_fulltext("sword")
+        assert {r['original_text'] for r in results} == {
+            "The iron sword is sharp", "Short sword"
+        }
+        assert all('[sword]' in r['original_snippet'] for r in results)
+
+        # A busca também cobre o texto traduzido e acompanha atualizações
+        shield = memory.search_fulltext("Escudo")[0]
+        memory.update_translation(shield['id'], translated_text="Broquel de madeira")
+        assert memory.search_fulltext("Escudo") == []
+        assert memory.search_fulltext("Broquel")[0]['id'] == shield['id']
+
+        memory.delete_translation(shield['id'])
+        assert memory.search_fulltext("madeira") == []
+
+        # Termos curtos caem para LIKE e a paginação funciona nos dois caminhos
+        assert len(memory.search_fulltext("or", limit=1)) == 1
+        assert len(memory.get_all_translations(search_term="sword")) == 2
+        assert memory.search_translations("sword", limit=1)[0][0] in (
+            "The iron sword is sharp", "Short sword"
+        )
+    finally:
+        memory.close()
+
+
+def test_fulltext_index_is_built_for_existing_databases(tmp_path):
+    memory = _new_memory(tmp_path)
+    memory.add_translation("Golden crown", "Coroa dourada")
+    memory.conn.executescript('''
+        DROP TRIGGER translations_fts_ai;
+        DROP TRIGGER translations_fts_ad;
+        DROP TRIGGER translations_fts_au;
+        DROP TABLE translations_fts;
+    ''')
+    memory.close()
+
+    memory = TranslationMemory(str(tmp_path / "memory.db"))
+    try:
+        assert memory.search_fulltext("crown")[0]['translated_text'] == "Coroa dourada"
+    finally:
+        memory.close()
+
+
+def test_keyset_pages_cover_all_rows_in_viewer_order(tmp_path):
+    memory = _new_memory(tmp_path)
+    try:
+        memory.add_translations_batch([(f"Item {i}", f"Item {i} pt") for i in range(25)])
+        # Grupos com o mesmo usage_count atravessam o limite das páginas
+        memory.conn.execute("UPDATE translations SET usage_count = 3 WHERE id % 4 = 0")
+        memory.conn.execute("UPDATE translations SET usage_count = 7 WHERE id IN (5, 11)")
+        memory.conn.commit()
+
+        expected_order = [r[0] for r in memory.conn.execute(
+            "SELECT id FROM translations ORDER BY usage_count DESC, id DESC"
+        )]
+
+        seen = []
+        after = None
+        while True:
+            page = memory.get_translations_page(after=after, limit=4)
+            if not page:
+                break
+            seen.extend(t['id'] for t in page)
+            after = (page[-1]['usage_count'], page[-1]['id'])
+
+        assert seen == expected_order
+        assert memory.get_translations_page(limit=4, category='missing') == []
+    finally:
+        memory.close()
+
+
+def test_export_streams_csv_that_imports_back(tmp_path):
+    memory = _new_memory(tmp_path)
+    try:
+        memory.add_translations_batch([(f"Line {i}", f"Linha {i}, \"citada\"") for i in range(12)])
+
+        progress = []
+        target = str(tmp_path / "memory.csv")
+        assert memory.export_to_file(target, batch_size=5,
+                                     progress_callback=lambda done, total: progress.append((done, total)))
+        assert progress == [(5, 12), (10, 12), (12, 12)]
+
+        other = TranslationMemory(str(tmp_path / "other.db"))
+        try:
+            assert other.import_from_file(target) == (12, 0)
+            assert other.get_translation("Line 3") == 'Linha 3, "citada"'
+        finally:
+            other.close()
+    finally:
+        memory.close()
+
+
+def test_export_tsv_and_compressed_jsonl(tmp_path):
+    memory = _new_memory(tmp_path)
+    try:
+        memory.add_translation("Tab\there", "Tabulação", category='ui')
+        memory.add_translation("Coração", "Heart", target_lang='en-x')
+
+        tsv = tmp_path / "memory.tsv"
+        assert memory.export_to_file(str(tsv))
+        lines = tsv.read_text(encoding='utf-8').splitlines()
+        assert lines[0].split('\t')[:3] == ['ID', 'Original', 'Tradução']
+        assert len(lines) == 3
+
+        jsonl = tmp_path / "memory.jsonl.gz"
+        assert memory.export_to_file(str(jsonl))
+        with gzip.open(jsonl, 'rt', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        assert [r['original_text'] for r in records] == ["Tab\there", "Coração"]
+        assert records[0]['category'] == 'ui'
+        assert records[1]['target_language'] == 'en-x'
+
+        assert TranslationMemory.detect_export_format("a.TSV.zst") == ('tsv', 'zstd')
+        assert not memory.export_to_file(str(tmp_path / "memory.xml"), file_format='xml')
+    finally:
+        memory.close()
+
+
+@pytest.mark.parametrize('name', [
+    'memory.tsv', 'memory.jsonl', 'memory.csv.gz', 'memory.tsv.gz', 'memory.jsonl.gz',
+    'memory.tmx.gz', 'memory.jsonl.zst',
+])
+def test_every_export_format_imports_back(tmp_path, name):
+    if name.endswith('.zst') and not ZSTD_AVAILABLE:
+        pytest.skip("zstandard não instalado")
+
+    memory = _new_memory(tmp_path)
+    try:
+        memory.add_translations_batch([(f"Line {i}", f"Linha\t{i}, \"citada\"") for i in range(9)])
+        memory.add_translation("Line 0", "Línea 0", target_lang='es')
+
+        target = str(tmp_path / name)
+        assert memory.export_to_file(target)
+
+        other = TranslationMemory(str(tmp_path / "other.db"))
+        try:
+            progress = []
+            result = other.import_from_file(target, lambda done, total: progress.append((done, total)))
+            # TMX só importa o par padrão; JSON Lines mantém o par de cada registro
+            assert result == ((9 if '.tmx' in name else 10), 0)
+            assert progress[-1] == (os.path.getsize(target), os.path.getsize(target))
+            assert other.get_translation("Line 4") == 'Linha\t4, "citada"'
+            if '.jsonl' in name:
+                assert other.get_translation("Line 0", target_lang='es') == "Línea 0"
+        finally:
+            other.close()
+    finally:
+        memory.close()
+
+
+def test_tmx_export_imports_back_through_bulk_path(tmp_path):
+    memory = _new_memory(tmp_path)
+    try:
+        memory.add_translations_batch([(f"Quest {i}", f"Missão {i}") for i in range(7)])
+        memory.add_translation("Quest 0", "Misión 0", target_lang='es')
+
+        target = str(tmp_path / "memory.tmx")
+        progress = []
+        assert memory.export_to_file(target, batch_size=3,
+                                     progress_callback=lambda done, total: progress.append(done))
+        assert progress == [3, 6, 8]
+
+        other = TranslationMemory(str(tmp_path / "other.db"))
+        try:
+            other.set_language_pair('en', 'pt-BR')
+            # O par padrão (en, pt-BR) aceita as variantes 'pt' do arquivo
+            assert other.import_from_file(target) == (7, 0)
+            assert other.get_translation("Quest 4") == "Missão 4"
+            assert other.import_from_tmx(target, target_lang='es') == (1, 0)
+            assert other.get_translation("Quest 0", target_lang='es') == "Misión 0"
+        finally:
+            other.close()
+    finally:
+        memory.close()
+
+
+def test_bulk_import_keeps_fulltext_index_consistent(tmp_path):
+    memory = _new_memory(tmp_path)
+    memory.FTS_SUSPEND_MIN_ROWS = 10  # suspende a partir do segundo chunk
+    statements = []
+    memory.conn.set_trace_callback(statements.append)
+    try:
+        memory.add_translation("Existing sword", "Espada antiga")
+        rows = [(f"Bulk sword {i}", f"Espada {i}") for i in range(30)]
+        rows += [("Bulk sword 3", "Espada revisada"), ("Existing sword", "Espada nova")]
+
+        # Lote pequeno: os triggers continuam valendo
+        assert memory.add_translations_bulk(rows[:5]) == (5, 0)
+        assert not any('DROP TRIGGER' in s for s in statements)
+
+        assert memory.add_translations_bulk(iter(rows), chunk_size=7, commit_every=14) == (32, 0)
+        assert any('DROP TRIGGER' in s for s in statements)
+
+        # integrity-check falha se o índice divergir da tabela
+        memory.conn.execute(
+            "INSERT INTO translations_fts(translations_fts, rank) VALUES ('integrity-check', 1)"
+        )
+        assert memory.search_fulltext("antiga") == []
+        assert [r['original_text'] for r in memory.search_fulltext("revisada")] == ["Bulk sword 3"]
+        assert len(memory.search_fulltext("Bulk sword")) == 30
+
+        triggers = {r[0] for r in memory.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+        )}
+        assert triggers == {'translations_fts_ai', 'translations_fts_ad', 'translations_fts_au'}
+    finally:
+        memory.close()
+
+
+def test_lookup_cache_is_invalidated_by_every_write(tmp_path):
+    memory = _new_memory(tmp_path)
+    try:
+        assert memory.get_translation("Shield") is None  # miss em cache
+        memory.add_translation("Shield", "Escudo")
+        assert memory.get_translation("Shield") == "Escudo"
+
+        row_id = memory.get_all_translations()[0]['id']
+        memory.update_translation(row_id, translated_text="Broquel")
+        assert memory.get_translation("Shield") == "Broquel"
+
+        memory.add_translations_bulk([("Shield", "Pavês"), ("Helmet", "Elmo")])
+        assert memory.get_translations_batch(["Shield", "Helmet", "Boots"]) == {
+            "Shield": "Pavês", "Helmet": "Elmo"
+        }
+
+        memory.delete_translation(row_id)
+        assert memory.get_translation("Shield") is None
+
+        helmet_id = memory.get_all_translations()[0]['id']
+        assert memory.get_translation("Helmet") == "Elmo"
+        memory.delete_translations_by_ids([helmet_id])
+        assert memory.lookup_translation("Helmet") is None
+
+        memory.add_translation("Boots", "Botas")
+        assert memory.get_translation("Boots") == "Botas"
+        memory.clear_all()
+        assert memory.get_translation("Boots") is None
+
+        stats = memory.get_stats()['lookup_cache']
+        assert stats['hits'] > 0 and stats['misses'] > 0
+    finally:
+        memory.close()
+
+
+def test_cached_lookups_skip_sqlite(tmp_path):
+    memory = _new_memory(tmp_path)
+    try:
+        memory.add_translation("Sword", "Espada")
+        assert memory.get_translation("Sword") == "Espada"
+        assert memory.get_translation("Unknown") is None
+
+        statements = []
+        reader = memory._pool.get_reader()
+        reader.set_trace_callback(statements.append)
+        try:
+            for _ in range(5):
+                assert memory.get_translation("Sword") == "Espada"
+                assert memory.get_translation("Unknown") is None
+        finally:
+            reader.set_trace_callback(None)
+
+        assert statements == []
+        # O uso continua sendo contado mesmo quando a busca vem do cache
+        assert memory.get_pending_usage_count() == 6
+    finally:
+        memory.close()
+
+
+def test_bloom_filter_skips_sqlite_for_definite_misses(tmp_path):
+    memory = _new_memory(tmp_path)
+    try:
+        memory.add_translation("Sword", "Espada")
+
+        statements = []
+        reader = memory._pool.get_reader()
+        reader.set_trace_callback(statements.append)
+        try:
+            for i in range(50):
+                assert memory.get_translation(f"Base {i:02d}") is None
+            assert memory.get_translations_batch(["Base 99", "Sword"]) == {"Sword": "Espada"}
+        finally:
+            reader.set_trace_callback(None)
+
+        # Com taxa de 1%, no máximo alguns falsos positivos chegam ao banco
+        assert len(statements) <= 5
+        assert memory.get_stats()['bloom_filter']['skipped_lookups'] >= 45
+    finally:
+        memory.close()
+
+
+def test_bloom_filter_is_persisted_and_extended_on_reconnect(tmp_path):
+    memory = _new_memory(tmp_path)
+    memory.add_translations_bulk([(f"Item {i}", f"Item {i} pt") for i in range(100)])
+    memory.close()
+
+    memory = _new_memory(tmp_path)
+    try:
+        assert memory.get_metadata('bloom_filter_max_id') == '100'
+        assert memory.get_stats()['bloom_filter']['keys'] == 100
+
+        # Linhas gravadas por fora da API depois do último salvamento
+        memory.conn.execute(
+            "INSERT INTO translations (original_text, original_text_hash, translated_text) "
+            "VALUES (?, ?, ?)", ("Late row", text_hash("Late row"), "Linha tardia")
+        )
+        memory.conn.commit()
+        memory._bloom_dirty = False
+        memory.close()
+
+        memory = _new_memory(tmp_path)
+        assert memory.get_translation("Late row") == "Linha tardia"
+        assert memory.get_translation("Item 42") == "Item 42 pt"
+    finally:
+        memory.close()
+
+
+def test_bloom_filter_has_no_false_negatives_under_concurrent_rebuilds(tmp_path):
+    memory = _new_memory(tmp_path)
+    memory.BLOOM_MIN_CAPACITY = 16  # filtro pequeno: satura e é reconstruído o tempo todo
+    memory._rebuild_bloom_filter()
+    done = threading.Event()
+
+    def single_writer():
+        for i in range(300):
+            memory.add_translation(f"Single {i}", f"Único {i}")
+
+    def bulk_writer():
+        for i in range(60):
+            memory.add_translations_bulk([(f"Bulk {i}.{j}", f"Lote {i}.{j}") for j in range(5)])
+
+    def rebuilder():
+        while not done.is_set():
+            memory._rebuild_bloom_filter()
+
+    try:
+        writers = [threading.Thread(target=single_writer), threading.Thread(target=bulk_writer)]
+        extra = threading.Thread(target=rebuilder)
+        extra.start()
+        for thread in writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        done.set()
+        extra.join()
+
+        # Reconstrução disparada entre a inclusão no filtro e o commit da linha
+        original_add = memory._bloom_add
+        added = threading.Event()
+
+        def slow_add(hashes):
+            original_add(hashes)
+            added.set()
+            time.sleep(0.2)
+
+        memory._bloom_add = slow_add
+        writer = threading.Thread(target=memory.add_translation, args=("Racing", "Corrida"))
+        writer.start()
+        added.wait(5)
+        memory._rebuild_bloom_filter()
+        writer.join()
+        memory._bloom_add = original_add
+
+        texts = ["Racing"] + [f"Single {i}" for i in range(300)]
+        texts += [f"Bulk {i}.{j}" for i in range(60) for j in range(5)]
+        missing = [t for t in texts if not memory._bloom.might_contain(text_hash(t))]
+        assert missing == []
+        memory._lookup_cache.clear()
+        assert memory.get_translation("Single 299") == "Único 299"
+        assert memory.get_translation("Bulk 59.4") == "Lote 59.4"
+    finally:
+        done.set()
+        memory.close()
+
+
+def test_queued_edits_are_coalesced_readable_and_flushed(tmp_path):
+    memory = _new_memory(tmp_path)
+    memory.WRITE_BEHIND_INTERVAL_MS = 60000  # só o flush grava
+    try:
+        assert memory.queue_translation("Sword", "Espada curta")
+        assert memory.queue_translation("Sword", "Espada")
+        assert memory.queue_translation("Shield", "Escudo")
+
+        # Leituras enxergam as edições antes de irem para o banco
+        assert memory.get_translation("Sword") == "Espada"
+        assert memory.get_translations_batch(["Shield"]) == {"Shield": "Escudo"}
+        assert memory.get_stats()['total_translations'] == 0
+
+        assert memory.flush_writes(timeout=10)
+        assert memory.get_pending_write_count() == 0
+        assert memory.get_stats()['total_translations'] == 2
+        # Duas edições consolidadas em uma gravação
+        rows = {row['original_text']: row for row in memory.get_translations_page(limit=10)}
+        assert rows['Sword']['usage_count'] == 1
+        assert memory.lookup_translation("Sword") == "Espada"
+    finally:
+        memory.close()
+
+
+def test_failed_queued_write_is_kept_and_reported(tmp_path):
+    memory = _new_memory(tmp_path)
+    memory.WRITE_BEHIND_INTERVAL_MS = 60000
+    try:
+        memory.add_translation("Sword", "Espada", notes="arma")
+        memory._UPSERT_SQL = 'INSERT INTO missing_table VALUES (?, ?, ?, ?, ?, ?, ?)'
+        assert memory.queue_translation("Sword", "Espada longa", notes="revisada")
+        assert not memory.flush_writes(timeout=10)
+        assert memory.get_pending_write_count() == 1
+
+        # A próxima gravação bem-sucedida leva o lote que falhou
+        del memory._UPSERT_SQL
+        assert memory.flush_writes(timeout=10)
+        rows = {row['original_text']: row for row in memory.get_translations_page(limit=10)}
+        assert rows['Sword']['translated_text'] == "Espada longa"
+        assert rows['Sword']['notes'] == "revisada"
+        assert rows['Sword']['usage_count'] == 2
+    finally:
+        memory.close()
+
+
+def test_close_writes_pending_queued_edits(tmp_path):
+    memory = _new_memory(tmp_path)
+    memory.WRITE_BEHIND_INTERVAL_MS = 60000
+    for i in range(20):
+        memory.queue_translation(f"Item {i}", f"Item {i} pt")
+    memory.close()
+
+    memory = _new_memory(tmp_path)
+    try:
+        assert memory.get_stats()['total_translations'] == 20
+    finally:
+        memory.close()
+
+
+def test_incremental_vacuum_and_maintenance_step(tmp_path):
+    memory = _new_memory(tmp_path)
+    try:
+        assert memory.get_maintenance_stats()['auto_vacuum'] == 'incremental'
+
+        memory.add_translations_bulk([(f"Line {i}", "x" * 500) for i in range(3000)])
+        memory.clear_all()
+        freelist = memory.get_maintenance_stats()['freelist_count']
+        assert freelist > memory.VACUUM_SLICE_PAGES
+
+        # Uma fatia por passo de manutenção
+        report = memory.run_maintenance()
+        assert report['freed_pages'] == memory.VACUUM_SLICE_PAGES
+        assert report['checkpoint'] is not None
+
+        assert memory.vacuum()
+        assert memory.get_maintenance_stats()['freelist_count'] == 0
+    finally:
+        memory.close()
+
+
+def test_vacuum_converts_legacy_database_to_incremental(tmp_path):
+    db_path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE legacy (x)")
+    conn.commit()
+    conn.close()
+
+    memory = TranslationMemory(db_path)
+    try:
+        assert memory.get_maintenance_stats()['auto_vacuum'] == 'none'
+        assert memory.vacuum()
+        assert memory.get_maintenance_stats()['auto_vacuum'] == 'incremental'
+    finally:
+        memory.close()
+
+
+def test_performance_profile_is_persisted_and_rebuilds_page_size(tmp_path):
+    memory = _new_memory(tmp_path)
+    try:
+        memory.add_translation("Sword", "Espada")
+        assert memory.get_performance_profile() == 'interactive'
+        assert memory.conn.execute("PRAGMA cache_size").fetchone()[0] == -16 * 1024
+
+        assert memory.set_performance_profile('read-only-archive')
+        assert memory.get_maintenance_stats()['page_size'] == 8192
+        assert memory.get_translation("Sword") == "Espada"
+        memory.close()
+
+        memory = _new_memory(tmp_path)
+        assert memory.get_performance_profile() == 'read-only-archive'
+        mmap_size = memory.PERFORMANCE_PROFILES['read-only-archive']['mmap_size']
+        assert memory._pool.get_reader().execute("PRAGMA mmap_size").fetchone()[0] == mmap_size
+        assert not memory.set_performance_profile('unknown')
+    finally:
+        memory.close()
+
+
+
+def test_failed_page_size_rebuild_keeps_memory_connected(tmp_path, monkeypatch):
+    class FailingVacuum(sqlite3.Connection):
+        def execute(self, sql, *args):
+            if sql == 'VACUUM':
+                raise sqlite3.OperationalError('disk I/O error')
+            return super().execute(sql, *args)
+
+    memory = _new_memory(tmp_path)
+    try:
+        memory.add_translation("Sword", "Espada")
+        connect = sqlite3.connect
+        monkeypatch.setattr(sqlite3, 'connect',
+                            lambda *args, **kwargs: connect(*args, factory=FailingVacuum, **kwargs))
+
+        assert not memory.set_performance_profile('read-only-archive')
+        monkeypatch.undo()
+
+        assert memory.is_connected()
+        assert memory.get_translation("Sword") == "Espada"
+        assert memory.get_performance_profile() == 'interactive'
+        assert memory.get_metadata('performance_profile') is None
+        assert memory.get_maintenance_stats()['page_size'] == 4096
+    finally:
+        memory.close()
+
+def test_import_uses_bulk_profile_temporarily(tmp_path):
+    memory = _new_memory(tmp_path)
+    csv_path = tmp_path / "import.csv"
+    csv_path.write_text("id,original,translation\n1,Sword,Espada\n", encoding='utf-8')
+    seen = []
+
+    def progress(done, total):
+        seen.append(memory.conn.execute("PRAGMA cache_size").fetchone()[0])
+
+    try:
+        assert memory.import_from_file(str(csv_path), progress) == (1, 0)
+        assert seen == [-64 * 1024]
+        assert memory.conn.execute("PRAGMA cache_size").fetchone()[0] == -16 * 1024
+    finally:
+        memory.close()
+
+
+def test_attached_memories_are_federated_in_priority_order(tmp_path):
+    glossary = TranslationMemory(str(tmp_path / "glossary.db"))
+    glossary.add_translations_bulk([("Sword", "Espada (glossário)"), ("Shield", "Escudo")])
+    glossary.close()
+
+    shared = TranslationMemory(str(tmp_path / "shared.db"))
+    shared.add_translations_bulk([("Shield", "Broquel"), ("Helmet", "Elmo")])
+    shared.close()
+
+    memory = _new_memory(tmp_path)
+    try:
+        memory.add_translation("Sword", "Espada")
+        assert memory.attach_memory(str(tmp_path / "glossary.db"))
+        assert memory.attach_memory(str(tmp_path / "shared.db"))
+        assert not memory.attach_memory(memory.get_db_path())
+
+        # Projeto primeiro, depois as memórias anexadas na ordem
+        assert memory.get_translation("Sword") == "Espada"
+        assert memory.get_translation("Shield") == "Escudo"
+        assert memory.lookup_translation("Helmet") == "Elmo"
+        assert memory.get_translations_batch(["Sword", "Shield", "Helmet", "Boots"]) == {
+            "Sword": "Espada", "Shield": "Escudo", "Helmet": "Elmo"
+        }
+
+        # Usos de memórias anexadas não viram incremento no banco principal
+        memory.flush_usage_counts()
+
+        memory.close()
+        memory = _new_memory(tmp_path)
+        assert memory.get_attached_memories() == [str(tmp_path / "glossary.db"),
+                                                  str(tmp_path / "shared.db")]
+
+        assert memory.detach_memory(str(tmp_path / "glossary.db"))
+        assert memory.get_translation("Shield") == "Broquel"
+        assert memory.get_stats()['total_translations'] == 1
+    finally:
+        memory.close()
+
+
+def test_attach_migrates_legacy_memory(tmp_path):
+    legacy_path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(str(legacy_path))
+    conn.executescript('''
+        CREATE TABLE translations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            original_text TEXT NOT NULL UNIQUE,
+            translated_text TEXT NOT NULL,
+            source_language TEXT DEFAULT 'en',
+            target_language TEXT DEFAULT 'pt',
+            category TEXT DEFAULT 'general',
+            notes TEXT DEFAULT '',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            usage_count INTEGER DEFAULT 1
+        );
+        CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT);
+        INSERT INTO metadata VALUES ('version', '1.0');
+        INSERT INTO translations (original_text, translated_text) VALUES ('Bow', 'Arco');
+    ''')
+    conn.commit()
+    conn.close()
+
+    memory = _new_memory(tmp_path)
+    try:
+        assert memory.attach_memory(str(legacy_path))
+        assert memory.get_translation("Bow") == "Arco"
+    finally:
+        memory.close()
+
+
+def test_merge_applies_only_the_delta_and_reports_conflicts(tmp_path):
+    remote_path = str(tmp_path / "remote.db")
+    remote = TranslationMemory(remote_path)
+    remote.add_translations_bulk([(f"Item {i}", f"Item {i} pt") for i in range(50)])
+    remote.add_translation("Sword", "Espada", notes="arma")
+    remote.close()
+
+    memory = _new_memory(tmp_path)
+    try:
+        memory.add_translation("Shield", "Escudo")
+        report = memory.merge_from(remote_path)
+        assert (report['inserted'], report['updated'], report['conflict_count']) == (51, 0, 0)
+        assert memory.get_translation_by_id(
+            memory.search_fulltext("Sword")[0]['id'])['notes'] == "arma"
+
+        # Nova rodada: o remoto muda 2 linhas; uma delas também foi editada aqui
+        conn = sqlite3.connect(remote_path)
+        conn.execute("UPDATE translations SET translated_text = 'Item 1 remoto', "
+                     "updated_at = '2999-01-01 00:00:00' WHERE original_text = 'Item 1'")
+        conn.execute("UPDATE translations SET translated_text = 'Item 2 remoto', "
+                     "updated_at = '2999-01-01 00:00:00' WHERE original_text = 'Item 2'")
+        conn.commit()
+        conn.close()
+        memory.conn.execute("UPDATE translations SET translated_text = 'Item 2 local', "
+                            "updated_at = '3000-01-01 00:00:00' WHERE original_text = 'Item 2'")
+        memory.conn.commit()
+
+        snapshot_sql = "SELECT id, translated_text, updated_at, usage_count FROM translations"
+        before = set(memory.conn.execute(snapshot_sql).fetchall())
+        report = memory.merge_from(remote_path)
+        assert report['updated'] == 1
+        assert report['conflict_count'] == 1
+        assert report['conflicts'][0]['resolution'] == 'local'
+        assert memory.get_translation("Item 1") == "Item 1 remoto"
+        assert memory.get_translation("Item 2") == "Item 2 local"
+        # Só a linha aplicada foi regravada
+        assert len(set(memory.conn.execute(snapshot_sql).fetchall()) - before) == 1
+
+        # Remoto inalterado: o conflito já resolvido não volta
+        report = memory.merge_from(remote_path)
+        assert (report['updated'], report['conflict_count']) == (0, 0)
+        assert memory.get_translation("Item 2") == "Item 2 local"
+
+        conn = sqlite3.connect(remote_path)
+        conn.execute("UPDATE translations SET translated_text = 'Item 2 de novo', "
+                     "updated_at = '2999-06-01 00:00:00' WHERE original_text = 'Item 2'")
+        conn.commit()
+        conn.close()
+        memory.conn.execute("UPDATE translations SET updated_at = '3001-01-01 00:00:00' "
+                            "WHERE original_text = 'Item 2'")
+        memory.conn.commit()
+
+        report = memory.merge_from(remote_path, conflict_policy='keep-remote')
+        assert report['conflict_count'] == 1
+        assert memory.get_translation("Item 2") == "Item 2 de novo"
+        assert memory.merge_from(remote_path, conflict_policy='unknown')['updated'] == 0
+    finally:
+        memory.close()
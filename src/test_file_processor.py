@@ -0,0 +1,230 @@
+"""
+Testes do FileProcessor: carregamento mapeado em memória e detecção de encoding
+"""
+
+import codecs
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import file_processor
+from file_processor import FileProcessor, detect_buffer_encoding, detect_encoding
+from regex_profiles import RegexProfile, RegexProfileManager, compile_profile
+
+
+def _write(tmp_path, name, data: bytes) -> str:
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_bom_wins_over_sample(tmp_path):
+    text = '<text>Café</text>\n'
+    path = _write(tmp_path, 'bom.xml', codecs.BOM_UTF8 + text.encode('utf-8'))
+    assert detect_encoding(path) == 'utf-8-sig'
+
+    path = _write(tmp_path, 'utf16.xml', text.encode('utf-16'))
+    processor = FileProcessor()
+    assert processor.load_file(path)
+    assert processor.get_detected_encoding() == 'utf-16'
+    assert processor.original_content == text
+
+
+def test_sample_cut_inside_multibyte_char_is_still_utf8():
+    # 'é' ocupa 2 bytes; a amostra de 5 bytes termina no meio dele
+    data = 'abcdé e mais texto'.encode('utf-8')
+    assert detect_buffer_encoding(data, sample_size=5) == 'utf-8'
+
+
+def test_invalid_utf8_after_sample_is_not_utf8(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_processor, 'ENCODING_SAMPLE_BYTES', 16)
+    data = b'{"name": "' + b'a' * 64 + 'Ação'.encode('latin-1') + b'"}\r\n'
+    path = _write(tmp_path, 'late.json', data)
+    assert detect_encoding(path) != 'utf-8'
+
+    processor = FileProcessor()
+    assert processor.load_file(path)
+    assert processor.get_detected_encoding() == 'latin-1'
+    assert processor.original_content == data.decode('latin-1').replace('\r\n', '\n')
+
+
+def test_detection_cached_until_file_changes(tmp_path, monkeypatch):
+    path = _write(tmp_path, 'cached.json', '{"a": "ação"}'.encode('utf-8'))
+    assert detect_encoding(path) == 'utf-8'
+
+    calls = []
+    monkeypatch.setattr(file_processor, 'detect_buffer_encoding',
+                        lambda buffer: calls.append(1) or 'utf-8')
+    assert detect_encoding(path) == 'utf-8'
+    assert calls == []
+
+    # Tamanho e mtime diferentes invalidam a entrada
+    data = '{"a": "ação", "b": "ç"}'.encode('latin-1')
+    _write(tmp_path, 'cached.json', data)
+    os.utime(path, ns=(1, 1))
+    monkeypatch.undo()
+    assert detect_encoding(path) != 'utf-8'
+
+
+def test_empty_file(tmp_path):
+    path = _write(tmp_path, 'empty.json', b'')
+    processor = FileProcessor()
+    assert processor.load_file(path)
+    assert processor.original_content == ''
+
+
+def test_apply_translations_single_pass_matches_positions(tmp_path):
+    content = '<a>Hello</a>\n<b>World</b>\n<c>Hello again</c>\n'
+    path = _write(tmp_path, 'apply.xml', content.encode('utf-8'))
+
+    processor = FileProcessor()
+    assert processor.load_file(path)
+    entries = processor.extract_texts()
+    assert [e.original_text for e in entries] == ['Hello', 'World', 'Hello again']
+
+    translations = {'Hello': 'Olá', 'Hello again': 'Olá de novo'}
+    expected = '<a>Olá</a>\n<b>World</b>\n<c>Olá de novo</c>\n'
+    assert processor.apply_translations(translations) == expected
+
+    output = tmp_path / 'out.xml'
+    assert processor.save_translations(str(output), translations, create_backup=False)
+    assert output.read_text(encoding='utf-8') == expected
+
+
+def test_profile_single_pass_positions_and_exclusions(tmp_path):
+    content = ('<!-- <string>Hidden text</string> -->\n'
+               '<button id="a" text="Open the gate"/>\n'
+               '<string id="b">  Close the door</string>\n'
+               '<item><name>Iron sword</name></item>\n')
+    path = _write(tmp_path, 'profile.xml', content.encode('utf-8'))
+    profile = RegexProfile('Teste', capture_patterns=[
+        r'text="([^"]+)"',
+        r'<string[^>]*>([^<]+)</string>',
+        r'<([a-zA-Z_]+)>([^<>]+)</\1>',  # retrorreferência: roda separado
+    ], exclude_patterns=[r'<!--.*?-->'], file_type='xml')
+
+    compiled = compile_profile(profile)
+    assert len(compiled.capture_regexes) == 3
+    assert compile_profile(profile) is compiled
+
+    processor = FileProcessor(profile)
+    assert processor.load_file(path)
+    entries = processor.extract_texts()
+    assert [e.original_text for e in entries] == ['Open the gate', 'Close the door', 'Iron sword']
+    for entry in entries:
+        assert content[entry.position:entry.position + len(entry.original_text)] == entry.original_text
+
+    translated = processor.apply_translations({'Open the gate': 'Abra o portão',
+                                               'Close the door': 'Feche a porta'})
+    assert 'text="Abra o portão"/>\n<string id="b">  Feche a porta</string>' in translated
+    assert '<!-- <string>Hidden text</string> -->' in translated
+
+
+def test_bannerlord_profile_keeps_overlapping_patterns(tmp_path):
+    profile = RegexProfileManager(str(tmp_path / 'profiles')).get_profile("Bannerlord XML")
+    # Tag sem fechamento: o parser recusa e a extração usa os padrões do perfil
+    content = ('<strings>\n'
+               '  <string id="a" text="Open the gate">Close the door</string>\n'
+               '  <string id="b">Hold the line</string>\n'
+               '  <button text="Retreat"><br>\n'
+               '</strings>\n')
+    path = _write(tmp_path, 'module_strings.xml', content.encode('utf-8'))
+
+    processor = FileProcessor(profile)
+    assert processor.load_file(path)
+    entries = processor.extract_texts()
+    assert sorted(e.original_text for e in entries) == [
+        'Close the door', 'Hold the line', 'Open the gate', 'Retreat']
+    for entry in entries:
+        assert content[entry.position:entry.position + len(entry.original_text)] == entry.original_text
+
+    translated = processor.apply_translations({'Open the gate': 'Abra o portão',
+                                               'Close the door': 'Feche a porta'})
+    assert 'text="Abra o portão">Feche a porta</string>' in translated
+
+
+def test_exclusions_checked_by_overlap(tmp_path):
+    content = ('<a>Visible text</a>\n'
+               '<!--\n<b>Commented out</b>\n-->\n'
+               '<c>Half <!-- hidden --> Shown part</c>\n')
+    path = _write(tmp_path, 'comments.xml', content.encode('utf-8'))
+
+    processor = FileProcessor()
+    assert processor.load_file(path)
+    assert [e.original_text for e in processor.extract_texts()] == ['Visible text', 'Half', 'Shown part']
+
+    # No perfil, o texto começa antes do comentário mas o contém: é excluído
+    processor = FileProcessor(RegexProfile('Teste', capture_patterns=[r'<c>(.*?)</c>'],
+                                           exclude_patterns=[r'<!--.*?-->']))
+    assert processor.load_file(path)
+    assert processor.extract_texts() == []
+
+
+def test_json_default_extraction_is_structural(tmp_path):
+    content = ('{\n  "id": "sword_01",\n  "name": "Iron",\n'
+               '  "desc": "A \\"sharp\\" blade",\n  "lines": ["Hello there", "Goodbye"]\n}\n')
+    path = _write(tmp_path, 'locale.json', content.encode('utf-8'))
+
+    processor = FileProcessor()
+    assert processor.load_file(path)
+    entries = processor.extract_texts()
+    assert [(e.path, e.original_text) for e in entries] == [
+        ('/desc', 'A \\"sharp\\" blade'), ('/lines/0', 'Hello there'), ('/lines/1', 'Goodbye')]
+
+    translated = processor.apply_translations({'A \\"sharp\\" blade': 'Uma lâmina \\"afiada\\"'})
+    assert translated == content.replace('A \\"sharp\\" blade', 'Uma lâmina \\"afiada\\"')
+
+
+def test_xml_default_is_regex_and_profile_selectors_use_parser(tmp_path):
+    content = ('<Defs>\n  <!-- <label>Old label</label> -->\n'
+               '  <ThingDef><defName>Sword_A</defName><label>Fish &amp; Chips</label></ThingDef>\n'
+               '  <string id="x" text="Long sword"/>\n</Defs>\n')
+    path = _write(tmp_path, 'defs.xml', content.encode('utf-8'))
+
+    processor = FileProcessor()
+    assert processor.load_file(path)
+    entries = processor.extract_texts()
+    assert [(e.path, e.original_text) for e in entries] == [
+        ('', 'Sword_A'), ('', 'Fish &amp; Chips')]
+
+    processor.regex_profile = RegexProfile('Seletores', capture_patterns=[r'>([^<>]+)<'],
+                                           exclude_patterns=[r'<defName>.*?</defName>'],
+                                           file_type='xml', selectors=['//*', '//@text'])
+    entries = processor.extract_texts()
+    assert [e.original_text for e in entries] == ['Fish &amp; Chips', 'Long sword']
+
+    translated = processor.apply_translations({'Long sword': 'Espada longa'})
+    assert translated == content.replace('Long sword', 'Espada longa')
+
+
+def test_default_profiles_saved_before_selectors_are_migrated(tmp_path):
+    profiles_dir = tmp_path / 'profiles'
+    profiles_dir.mkdir()
+    old_rimworld = {
+        "name": "RimWorld XML", "file_type": "xml",
+        "capture_patterns": ["<label>([^<]+)</label>", "<description>([^<]+)</description>",
+                             "<[a-zA-Z_]+>([^<>]+)</[a-zA-Z_]+>"],
+        "exclude_patterns": ["<defName>.*?</defName>", "<!--.*?-->"],
+    }
+    customized = {"name": "Bannerlord XML", "file_type": "xml",
+                  "capture_patterns": ["<text>([^<]+)</text>"], "exclude_patterns": []}
+    (profiles_dir / 'rimworld-xml.json').write_text(json.dumps(old_rimworld), encoding='utf-8')
+    (profiles_dir / 'bannerlord-xml.json').write_text(json.dumps(customized), encoding='utf-8')
+
+    manager = RegexProfileManager(str(profiles_dir))
+    rimworld = manager.get_profile("RimWorld XML")
+    assert rimworld.selectors == ['//label', '//description', '/LanguageData/*']
+    saved = json.loads((profiles_dir / 'rimworld-xml.json').read_text(encoding='utf-8'))
+    assert saved['selectors'] == rimworld.selectors
+    # Perfil personalizado continua só com os padrões de captura
+    assert manager.get_profile("Bannerlord XML").selectors == []
+
+    content = ('<Defs><ThingDef><defName>Gun</defName><label>Rifle</label>'
+               '<description>Long gun</description><soundInteract>Rifle_Sound</soundInteract>'
+               '</ThingDef></Defs>\n')
+    path = _write(tmp_path, 'defs.xml', content.encode('utf-8'))
+    processor = FileProcessor(rimworld)
+    assert processor.load_file(path)
+    assert [e.original_text for e in processor.extract_texts()] == ['Rifle', 'Long gun']
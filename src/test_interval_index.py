@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Testes do Índice de Intervalos (interval_index.py)
+"""
+
+import os
+import re
+import sys
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from interval_index import IntervalIndex
+
+
+def test_spans_are_merged():
+    index = IntervalIndex([(10, 20), (0, 5), (15, 30), (30, 35), (40, 40), (50, 60)])
+    assert list(index) == [(0, 5), (10, 35), (50, 60)]
+
+
+def test_overlap_queries_match_brute_force():
+    spans = [(3, 7), (12, 13), (20, 28), (26, 31), (40, 45)]
+    index = IntervalIndex(spans)
+    covered = {p for start, end in spans for p in range(start, end)}
+
+    for start in range(0, 50):
+        assert index.contains(start) == (start in covered)
+        for end in range(start + 1, 52):
+            expected = any(p in covered for p in range(start, end))
+            assert index.overlaps(start, end) == expected, (start, end)
+
+
+def test_from_matches():
+    content = 'a <!-- x --> b <!-- y -->'
+    index = IntervalIndex.from_matches([re.compile(r'<!--.*?-->')], content)
+    assert len(index) == 2
+    assert index.overlaps(content.index('x'), content.index('x') + 1)
+    assert not index.overlaps(content.index('b'), content.index('b') + 1)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Testes da Extração Estrutural de JSON (json_extractor.py)
+"""
+
+import os
+import sys
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from json_extractor import PathTrie, iter_json_strings
+
+
+def test_pointers_spans_and_escapes():
+    content = ('{"title": "Say \\"hi\\"", "a/b": {"list": ["one", 2, "two"]},\n'
+               ' // comentário "ignored": "x"\n'
+               ' "~k": "tilde"}')
+    values = list(iter_json_strings(content))
+
+    assert [v.pointer for v in values] == ['/title', '/a~1b/list/0', '/a~1b/list/2', '/~0k']
+    assert [v.raw for v in values] == ['Say \\"hi\\"', 'one', 'two', 'tilde']
+    for value in values:
+        assert content[value.start:value.end] == value.raw
+
+
+def test_path_trie_wildcards_and_descendants():
+    trie = PathTrie(['/**/id', '/meta', '/items/*/code'], ignore_case=True)
+    content = ('{"ID": "a", "meta": {"deep": ["b"]}, "items": [{"code": "c", "label": "d"}],'
+               ' "nested": {"x": {"id": "e"}}}')
+    filtered = {v.raw: v.filtered for v in iter_json_strings(content, trie)}
+    assert filtered == {'a': True, 'b': True, 'c': True, 'd': False, 'e': True}
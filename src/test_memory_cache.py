@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Testes do Cache de Buscas (memory_cache.py)
+"""
+
+import os
+import sys
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from memory_cache import LookupCache
+
+
+def test_lru_evicts_least_recently_used_entry():
+    cache = LookupCache(max_entries=2)
+    cache.put(('en', 'pt', 'a'), (1, 'A'), cache.version)
+    cache.put(('en', 'pt', 'b'), None, cache.version)
+
+    assert cache.get(('en', 'pt', 'a')) == (1, 'A')  # 'a' passa a ser o mais recente
+    cache.put(('en', 'pt', 'c'), (3, 'C'), cache.version)
+
+    assert cache.get(('en', 'pt', 'b')) is LookupCache.MISSING
+    assert cache.get(('en', 'pt', 'a')) == (1, 'A')
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['evictions'], stats['entries']) == (2, 1, 1, 2)
+
+
+def test_size_limit_and_negative_entries():
+    cache = LookupCache(max_entries=100, max_bytes=2000)
+    for i in range(10):
+        cache.put(('en', 'pt', f'text {i}'), (i, 'x' * 300), cache.version)
+
+    stats = cache.get_stats()
+    assert stats['size_bytes'] <= 2000
+    assert stats['evictions'] == 10 - stats['entries']
+
+    cache.put(('en', 'pt', 'missing'), None, cache.version)
+    assert cache.get(('en', 'pt', 'missing')) is None
+
+
+def test_invalidation_by_key_and_id_blocks_stale_puts():
+    cache = LookupCache()
+    cache.put(('en', 'pt', 'a'), (1, 'A'), cache.version)
+    cache.put(('en', 'pt', 'b'), (2, 'B'), cache.version)
+
+    cache.invalidate_ids([1])
+    assert cache.get(('en', 'pt', 'a')) is LookupCache.MISSING
+    assert cache.get(('en', 'pt', 'b')) == (2, 'B')
+
+    # Consulta iniciada antes de uma escrita não repovoa o cache
+    version = cache.version
+    cache.invalidate([('en', 'pt', 'b')])
+    cache.put(('en', 'pt', 'b'), (2, 'B antigo'), version)
+    assert cache.get(('en', 'pt', 'b')) is LookupCache.MISSING
+
+    # Acertos de memórias anexadas não têm id: ficam fora do índice por id
+    cache.put(('en', 'pt', 'c'), (None, 'C'), cache.version)
+    cache.put(('en', 'pt', 'd'), (None, 'D'), cache.version)
+    assert None not in cache._keys_by_id
+    cache.invalidate_ids([None])
+    assert cache.get(('en', 'pt', 'c')) == (None, 'C')
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Testes da Extração em Fluxo (streaming_extractor.py)
+"""
+
+import codecs
+import os
+import sys
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from file_processor import FileProcessor
+from regex_profiles import RegexProfile
+from streaming_extractor import StreamingExtractor
+
+
+def _content(count: int) -> str:
+    parts = ['<Defs>\n']
+    for i in range(count):
+        parts.append(f'  <!-- <label>old {i}</label> -->\n'
+                     f'  <Thing text="Ação número {i}"><label>Espada {i} de aço</label></Thing>\n')
+    parts.append('</Defs>\n')
+    return ''.join(parts)
+
+
+PROFILE = RegexProfile('Teste', capture_patterns=[r'text="([^"]+)"', r'<label>([^<]+)</label>'],
+                       exclude_patterns=[r'<!--.*?-->'], file_type='xml', max_match_span=40)
+
+
+def test_windows_find_every_entry_with_byte_offsets(tmp_path):
+    content = _content(300)
+    data = content.encode('utf-8')
+    path = tmp_path / 'big.xml'
+    path.write_bytes(data)
+
+    # Janelas minúsculas forçam muitas fronteiras no meio das ocorrências
+    entries = list(StreamingExtractor(PROFILE, window_bytes=64).iter_entries(str(path)))
+
+    expected = []
+    for i in range(300):
+        expected += [f'Ação número {i}', f'Espada {i} de aço']
+    assert [e.original_text for e in entries] == expected
+    for entry in entries:
+        raw = data[entry.position:entry.position + len(entry.original_text.encode('utf-8'))]
+        assert raw.decode('utf-8') == entry.original_text
+
+
+def test_overlapping_patterns_across_windows(tmp_path):
+    profile = RegexProfile('Bannerlord', capture_patterns=[
+        r'text="([^"]+)"', r'<string[^>]*>([^<]+)</string>'], file_type='xml', max_match_span=60)
+    content = ''.join(f'<string id="s{i}" text="Texto {i}">Conteúdo {i}</string>\n'
+                      for i in range(100))
+    path = tmp_path / 'strings.xml'
+    path.write_bytes(content.encode('utf-8'))
+
+    entries = list(StreamingExtractor(profile, window_bytes=150).iter_entries(str(path)))
+    expected = []
+    for i in range(100):
+        expected += [f'Conteúdo {i}', f'Texto {i}']
+    assert [e.original_text for e in entries] == expected
+
+
+def test_writer_splices_translations(tmp_path):
+    content = _content(50)
+    source = tmp_path / 'in.xml'
+    source.write_bytes(content.encode('utf-8'))
+    output = tmp_path / 'out.xml'
+
+    translations = {f'Espada {i} de aço': f'Sword {i}' for i in range(0, 50, 2)}
+    extractor = StreamingExtractor(PROFILE, window_bytes=100)
+    assert extractor.write_translations(str(source), str(output), translations) == 25
+
+    expected = content
+    for original, translated in translations.items():
+        expected = expected.replace(f'<label>{original}</label>', f'<label>{translated}</label>')
+    assert output.read_text(encoding='utf-8') == expected
+
+
+def test_writer_can_overwrite_source(tmp_path):
+    content = _content(10)
+    source = tmp_path / 'in.xml'
+    source.write_bytes(content.encode('utf-8'))
+
+    translations = {'Espada 3 de aço': 'Sword 3'}
+    extractor = StreamingExtractor(PROFILE, window_bytes=100)
+    assert extractor.write_translations(str(source), str(source), translations) == 1
+
+    expected = content.replace('<label>Espada 3 de aço</label>', '<label>Sword 3</label>')
+    assert source.read_text(encoding='utf-8') == expected
+    assert os.listdir(tmp_path) == ['in.xml']
+
+
+def test_default_profile_matches_file_processor_rules(tmp_path):
+    path = tmp_path / 'data.json'
+    path.write_text('{"id": "sword_01", "name": "Iron", "text": "A sharp blade", '
+                    '"count": "12", /* "note": "Ignored text" */ "desc": "Heavy armor"}',
+                    encoding='latin-1')
+    entries = StreamingExtractor(file_type='json', window_bytes=16).iter_entries(str(path))
+    assert [e.original_text for e in entries] == ['A sharp blade', 'Heavy armor']
+
+
+def test_default_xml_streams_like_file_processor(tmp_path):
+    content = ('<Defs>\n  <!-- <label>Old label</label> -->\n'
+               '  <ThingDef><defName>sword_a</defName><label>Fish &amp; Chips</label>\n'
+               '    <value>42</value><description>Uma <![CDATA[lâmina]]> afiada</description>\n'
+               '  </ThingDef>\n</Defs>\n')
+    path = tmp_path / 'defs.xml'
+    data = content.encode('utf-8')
+    path.write_bytes(data)
+
+    processor = FileProcessor()
+    assert processor.load_file(str(path))
+    expected = [(e.path, e.original_text) for e in processor.extract_texts()]
+
+    entries = list(StreamingExtractor(file_type='xml', window_bytes=16).iter_entries(str(path)))
+    assert [(e.path, e.original_text) for e in entries] == expected
+    for entry in entries:
+        raw = data[entry.position:entry.position + len(entry.original_text.encode('utf-8'))]
+        assert raw.decode('utf-8') == entry.original_text
+
+
+def test_selector_profile_streams_through_parser(tmp_path):
+    content = _content(50)
+    path = tmp_path / 'big.xml'
+    path.write_bytes(codecs.BOM_UTF8 + content.encode('utf-8'))
+    profile = RegexProfile('Seletores', file_type='xml', selectors=['//label', '//Thing/@text'])
+
+    extractor = StreamingExtractor(profile, window_bytes=16)
+    entries = list(extractor.iter_entries(str(path)))
+    assert len(entries) == 100
+    assert entries[0].path == '/Defs/Thing/@text' and entries[1].path == '/Defs/Thing/label'
+
+    output = tmp_path / 'out.xml'
+    assert extractor.write_translations(str(path), str(output), {'Espada 7 de aço': 'Sword 7'}) == 1
+    assert output.read_bytes() == path.read_bytes().replace('Espada 7 de aço'.encode(), b'Sword 7')
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Testes de Leitura e Escrita de TMX (tmx_handler.py)
+"""
+
+import io
+import os
+import sys
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from tmx_handler import iter_tmx_pairs, language_matches, write_tmx
+
+
+SAMPLE_TMX = '''<?xml version="1.0" encoding="UTF-8"?>
+<tmx version="1.4">
+  <header creationtool="Other" datatype="plaintext" segtype="sentence"
+          adminlang="en-US" srclang="en-US" o-tmf="x"/>
+  <body>
+    <tu tuid="1">
+      <tuv xml:lang="en-US"><seg>Open the <bpt i="1">&lt;b&gt;</bpt>gate<ept i="1">&lt;/b&gt;</ept></seg></tuv>
+      <tuv xml:lang="fr-FR"><seg>Ouvrez la porte</seg></tuv>
+      <tuv xml:lang="pt-BR"><seg>Abra o <bpt i="1">&lt;b&gt;</bpt>portão<ept i="1">&lt;/b&gt;</ept></seg></tuv>
+    </tu>
+    <tu tuid="2">
+      <tuv lang="EN"><seg>Only source</seg></tuv>
+    </tu>
+    <tu tuid="3">
+      <tuv xml:lang="en"><seg>Sword</seg></tuv>
+      <tuv xml:lang="pt"><seg>Espada</seg></tuv>
+    </tu>
+  </body>
+</tmx>
+'''
+
+
+def test_language_variants_match_primary_subtag():
+    assert language_matches('pt-BR', 'pt')
+    assert language_matches('pt', 'pt_BR')
+    assert language_matches('EN-us', 'en-US')
+    assert not language_matches('pt-BR', 'es')
+    assert not language_matches('', 'pt')
+
+
+def test_iter_tmx_pairs_maps_variants_and_keeps_inline_codes():
+    pairs = list(iter_tmx_pairs(io.BytesIO(SAMPLE_TMX.encode('utf-8')), target_lang='pt'))
+
+    assert pairs == [
+        ("Open the <b>gate</b>", "Abra o <b>portão</b>"),
+        ("Sword", "Espada"),
+    ]
+
+    # Outro idioma de destino no mesmo arquivo
+    pairs = list(iter_tmx_pairs(io.BytesIO(SAMPLE_TMX.encode('utf-8')), 'en', 'fr'))
+    assert pairs == [("Open the <b>gate</b>", "Ouvrez la porte")]
+
+
+def test_write_tmx_round_trips_special_characters():
+    out = io.StringIO()
+    written = write_tmx(out, [{
+        'id': 1, 'original_text': 'A & B <i>\r\nline\x01', 'translated_text': 'A e "B"',
+        'source_language': 'en', 'target_language': 'pt', 'category': 'ui',
+        'notes': '', 'created_at': '2024-01-02 03:04:05', 'updated_at': None,
+        'usage_count': 3,
+    }], source_lang='en')
+
+    assert written == 1
+    assert 'creationdate="20240102T030405Z"' in out.getvalue()
+
+    pairs = list(iter_tmx_pairs(io.BytesIO(out.getvalue().encode('utf-8')), 'en', 'pt'))
+    assert pairs == [('A & B <i>\r\nline', 'A e "B"')]
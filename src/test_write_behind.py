@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Testes da Fila de Escrita Assíncrona (write_behind.py)
+"""
+
+import os
+import sys
+import threading
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from write_behind import WriteBehindQueue
+
+
+def test_flush_writes_coalesced_batch_off_caller_thread():
+    batches = []
+    writer_threads = set()
+
+    def write_batch(batch):
+        writer_threads.add(threading.current_thread())
+        batches.append(batch)
+
+    queue = WriteBehindQueue(write_batch, flush_interval_ms=60000)
+    try:
+        queue.put('a', 1)
+        queue.put('b', 2)
+        queue.put('a', 3)
+        assert queue.get('a') == 3
+        assert queue.pending_count() == 2
+
+        assert queue.flush(timeout=10)
+        assert batches == [[('b', 2), ('a', 3)]]
+        assert threading.current_thread() not in writer_threads
+        assert queue.get('a') is None
+    finally:
+        queue.close()
+
+
+def test_max_pending_triggers_write_and_close_drains():
+    written = []
+    filled = threading.Event()
+
+    def write_batch(batch):
+        written.extend(batch)
+        filled.set()
+
+    queue = WriteBehindQueue(write_batch, flush_interval_ms=60000, max_pending=3)
+    for i in range(3):
+        queue.put(i, i)
+    assert filled.wait(10)
+
+    queue.put('last', 0)
+    queue.close(timeout=10)
+    assert [key for key, _ in written] == [0, 1, 2, 'last']
+
+
+def test_failed_batch_is_requeued_and_flush_reports_it():
+    calls = []
+
+    def write_batch(batch):
+        calls.append(batch)
+        if len(calls) == 1:
+            raise RuntimeError("disco cheio")
+
+    queue = WriteBehindQueue(write_batch, flush_interval_ms=60000)
+    try:
+        queue.put('a', 1)
+        queue.put('b', 2)
+        assert not queue.flush(timeout=10)
+        assert isinstance(queue.last_error, RuntimeError)
+        assert queue.get('a') == 1
+
+        # Edição mais nova da mesma chave prevalece sobre a devolvida
+        queue.put('b', 3)
+        queue.put('c', 4)
+        assert queue.flush(timeout=10)
+        assert calls[1] == [('a', 1), ('b', 3), ('c', 4)]
+        assert queue.pending_count() == 0
+    finally:
+        queue.close()
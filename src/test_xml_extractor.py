@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Testes da Extração Estrutural de XML (xml_extractor.py)
+"""
+
+import os
+import sys
+
+# Adiciona o diretório src ao path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from xml_extractor import XmlSelector, iter_xml_nodes
+
+DOCUMENT = ('<?xml version="1.0" encoding="utf-8"?>\n'
+            '<!-- <label>comentário</label> -->\n'
+            '<LanguageData>\n'
+            '  <string id="a1" text="Ação &amp; reação"/>\n'
+            '  <Defs><ThingDef><defName>sword</defName><label> Espada longa </label>\n'
+            '    <description><![CDATA[Uma <b>lâmina</b>]]></description></ThingDef></Defs>\n'
+            '</LanguageData>\n')
+
+
+def test_spans_paths_and_small_chunks():
+    data = DOCUMENT.encode('utf-8')
+    selector = XmlSelector(['//*', '//string/@text'])
+
+    # Blocos minúsculos cortam tags, entidades e caracteres multibyte
+    for chunk_bytes in (3, 7, 1024):
+        nodes = list(iter_xml_nodes(data, selector, chunk_bytes=chunk_bytes))
+        assert [(n.path, n.raw) for n in nodes] == [
+            ('/LanguageData/string/@text', 'Ação &amp; reação'),
+            ('/LanguageData/Defs/ThingDef/defName', 'sword'),
+            ('/LanguageData/Defs/ThingDef/label', 'Espada longa'),
+            ('/LanguageData/Defs/ThingDef/description', 'Uma <b>lâmina</b>')]
+        for node in nodes:
+            assert data[node.start:node.end].decode('utf-8') == node.raw
+
+    for node in iter_xml_nodes(data, selector, char_offsets=True):
+        assert DOCUMENT[node.start:node.end] == node.raw
+
+    # Texto já carregado: codificado aos pedaços, posições em caracteres
+    for chunk in (5, 1024):
+        nodes = list(iter_xml_nodes(DOCUMENT, selector, char_offsets=True, chunk_bytes=chunk))
+        assert len(nodes) == 4
+        for node in nodes:
+            assert DOCUMENT[node.start:node.end] == node.raw
+
+
+def test_selectors_and_malformed_documents():
+    data = DOCUMENT.encode('utf-8')
+    nodes = list(iter_xml_nodes(data, XmlSelector(['/LanguageData/Defs/*/label', '@id'])))
+    assert [(n.path, n.attribute) for n in nodes] == [
+        ('/LanguageData/string/@id', True), ('/LanguageData/Defs/ThingDef/label', False)]
+
+    try:
+        list(iter_xml_nodes(b'<a><b>text</a>'))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("XML malformado deveria gerar ValueError")
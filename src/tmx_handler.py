@@ -0,0 +1,193 @@
+"""
+Módulo de Leitura e Escrita de TMX
+Intercâmbio da memória de tradução com outras ferramentas CAT (TMX 1.4)
+
+- Leitura em streaming com iterparse: cada <tu> é descartado após o uso,
+  então arquivos de vários GB são lidos com memória constante
+- Escrita incremental, uma unidade por vez
+- Variantes de idioma (pt-BR, en-US...) associadas ao par da memória
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import BinaryIO, Dict, Generator, Iterable, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+
+TMX_VERSION = '1.4'
+CREATION_TOOL = 'GameTranslator'
+CREATION_TOOL_VERSION = '1.0'
+
+# xml:lang (TMX 1.4) e lang (TMX 1.1)
+_XML_LANG = '{http://www.w3.org/XML/1998/namespace}lang'
+
+# Caracteres proibidos em XML 1.0
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+
+def normalize_language(code: str) -> str:
+    """
+    Normaliza um código de idioma para comparação ('pt_BR' -> 'pt-br')
+
+    Args:
+        code: Código de idioma
+
+    Returns:
+        Código em minúsculas com hífen
+    """
+    return (code or '').strip().replace('_', '-').lower()
+
+
+def language_matches(variant: str, language: str) -> bool:
+    """
+    Verifica se uma variante do TMX corresponde a um idioma da memória.
+
+    Aceita o código exato ou a mesma língua principal em qualquer direção:
+    'pt-BR' corresponde a 'pt' e 'pt' corresponde a 'pt-BR'.
+
+    Args:
+        variant: Idioma declarado no <tuv>
+        language: Idioma da memória
+
+    Returns:
+        True se correspondem
+    """
+    variant = normalize_language(variant)
+    language = normalize_language(language)
+    if not variant or not language:
+        return False
+    return variant == language or variant.split('-')[0] == language.split('-')[0]
+
+
+def _segment_text(tuv: ET.Element) -> Optional[str]:
+    """Texto do <seg> de um <tuv>, incluindo códigos nativos das tags internas"""
+    seg = tuv.find('seg')
+    if seg is None:
+        return None
+    return ''.join(seg.itertext())
+
+
+def iter_tmx_pairs(source: BinaryIO, source_lang: str = None,
+                   target_lang: str = None) -> Generator[Tuple[str, str], None, None]:
+    """
+    Lê pares (original, tradução) de um TMX em streaming.
+
+    Cada <tu> é processado ao ser fechado e removido da árvore em seguida.
+    Unidades sem variante nos dois idiomas são ignoradas. Quando o idioma de
+    origem não é informado, usa o srclang do cabeçalho.
+
+    Args:
+        source: Arquivo TMX aberto em modo binário
+        source_lang: Idioma de origem (None = srclang do cabeçalho)
+        target_lang: Idioma de destino
+
+    Yields:
+        Tuplas (texto_original, texto_traduzido)
+    """
+    body = None
+
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            if elem.tag == 'header' and not source_lang:
+                srclang = elem.get('srclang', '')
+                if srclang and srclang != '*all*':
+                    source_lang = srclang
+            elif elem.tag == 'body':
+                body = elem
+            continue
+
+        if elem.tag != 'tu':
+            continue
+
+        original = None
+        translated = None
+
+        for tuv in elem.iter('tuv'):
+            lang = tuv.get(_XML_LANG) or tuv.get('lang', '')
+            if original is None and language_matches(lang, source_lang):
+                original = _segment_text(tuv)
+            elif translated is None and language_matches(lang, target_lang):
+                translated = _segment_text(tuv)
+
+        # Descarta a unidade já processada: memória constante
+        elem.clear()
+        if body is not None:
+            body.remove(elem)
+
+        if original and translated:
+            yield (original, translated)
+
+
+def _tmx_date(timestamp: Optional[str]) -> Optional[str]:
+    """Converte 'AAAA-MM-DD HH:MM:SS' do SQLite para o formato TMX (AAAAMMDDTHHMMSSZ)"""
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(str(timestamp)).strftime('%Y%m%dT%H%M%SZ')
+    except ValueError:
+        return None
+
+
+def _xml_text(text: str) -> str:
+    """Escapa texto para XML removendo caracteres proibidos"""
+    # \r viraria \n na leitura (normalização de fim de linha do XML)
+    return escape(_INVALID_XML_CHARS.sub('', text or ''), {'\r': '&#13;'})
+
+
+def write_tmx(target, translations: Iterable[Dict], source_lang: str) -> int:
+    """
+    Escreve traduções em TMX 1.4, uma unidade por vez.
+
+    Cada tradução usa o próprio par de idiomas (source_language e
+    target_language do dicionário); categoria e notas são gravadas como
+    <prop type="x-category"> e <note>.
+
+    Args:
+        target: Arquivo de texto aberto para escrita (UTF-8)
+        translations: Iterável de dicionários como os de iter_translations
+        source_lang: Idioma de origem declarado no cabeçalho
+
+    Returns:
+        Número de unidades escritas
+    """
+    target.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    target.write(f'<tmx version="{TMX_VERSION}">\n')
+    target.write(
+        f'  <header creationtool="{CREATION_TOOL}" '
+        f'creationtoolversion="{CREATION_TOOL_VERSION}" datatype="plaintext" '
+        f'segtype="sentence" adminlang="en" srclang={quoteattr(source_lang)} '
+        f'o-tmf="{CREATION_TOOL}"/>\n'
+    )
+    target.write('  <body>\n')
+
+    written = 0
+    for t in translations:
+        attributes = f'tuid="{t["id"]}" usagecount="{t.get("usage_count") or 0}"'
+        created = _tmx_date(t.get('created_at'))
+        if created:
+            attributes += f' creationdate="{created}"'
+        changed = _tmx_date(t.get('updated_at'))
+        if changed:
+            attributes += f' changedate="{changed}"'
+
+        target.write(f'    <tu {attributes}>\n')
+        if t.get('category'):
+            target.write(f'      <prop type="x-category">{_xml_text(t["category"])}</prop>\n')
+        if t.get('notes'):
+            target.write(f'      <note>{_xml_text(t["notes"])}</note>\n')
+        target.write(
+            f'      <tuv xml:lang={quoteattr(t["source_language"])}>'
+            f'<seg>{_xml_text(t["original_text"])}</seg></tuv>\n'
+        )
+        target.write(
+            f'      <tuv xml:lang={quoteattr(t["target_language"])}>'
+            f'<seg>{_xml_text(t["translated_text"])}</seg></tuv>\n'
+        )
+        target.write('    </tu>\n')
+
+        written += 1
+
+    target.write('  </body>\n')
+    target.write('</tmx>\n')
+    return written
@@ -0,0 +1,174 @@
+"""
+Módulo de Fila de Escrita Assíncrona (write-behind)
+Tira as gravações de edições manuais da thread da interface
+
+- Thread escritora própria: put() só enfileira e retorna
+- Edições da mesma chave são consolidadas (vale a última)
+- Lotes gravados a cada intervalo ou ao atingir um número de itens
+- flush() funciona como barreira: retorna quando tudo que foi enfileirado
+  antes da chamada já foi gravado
+- Lotes que falham voltam para a fila (edições mais novas da mesma chave
+  prevalecem) e são regravados no próximo ciclo; flush() retorna False
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+
+class WriteBehindQueue:
+    """
+    Fila de escrita com consolidação por chave e thread escritora.
+
+    A função de gravação recebe a lista de pares (chave, valor) de um lote e
+    roda sempre na thread escritora, nunca na thread que chamou put(). Ela
+    deve levantar uma exceção quando o lote não foi gravado.
+    """
+
+    def __init__(self, write_batch: Callable[[List[Tuple[Hashable, Any]]], None],
+                 flush_interval_ms: int = 250, max_pending: int = 500,
+                 name: str = 'WriteBehindQueue'):
+        """
+        Inicializa a fila e inicia a thread escritora.
+
+        Args:
+            write_batch: Função que grava um lote de pares (chave, valor)
+            flush_interval_ms: Tempo máximo que uma edição espera na fila
+            max_pending: Número de chaves pendentes que dispara a gravação
+            name: Nome da thread escritora
+        """
+        self._write_batch = write_batch
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_pending = max(1, max_pending)
+
+        self._pending: OrderedDict = OrderedDict()
+        self._in_flight: dict = {}
+        self._cond = threading.Condition()
+        self._enqueued = 0  # sequência da última edição enfileirada
+        self._written = 0   # sequência da última edição gravada
+        self._failures = 0  # lotes que falharam desde a criação
+        self.last_error: Optional[Exception] = None
+        self._flush_requested = False
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Enfileira uma gravação, substituindo a pendente da mesma chave.
+
+        Args:
+            key: Chave da edição (edições iguais são consolidadas)
+            value: Valor a gravar
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Fila de escrita já foi fechada")
+
+            self._pending.pop(key, None)
+            self._pending[key] = value
+            self._enqueued += 1
+
+            # Acorda a escritora no primeiro item (inicia o intervalo) e no limite
+            if len(self._pending) == 1 or len(self._pending) >= self.max_pending:
+                self._cond.notify_all()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Retorna o valor ainda não gravado de uma chave (pendente ou em gravação).
+
+        Permite que leituras vejam as próprias edições antes do flush.
+        """
+        with self._cond:
+            if key in self._pending:
+                return self._pending[key]
+            return self._in_flight.get(key, default)
+
+    def pending_count(self) -> int:
+        """Número de chaves aguardando gravação"""
+        with self._cond:
+            return len(self._pending) + len(self._in_flight)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Barreira de durabilidade: grava tudo que foi enfileirado até agora.
+
+        Args:
+            timeout: Tempo máximo de espera em segundos (None = sem limite)
+
+        Returns:
+            True se tudo foi gravado dentro do tempo; False no tempo esgotado
+            ou se a gravação falhou (as edições continuam na fila)
+        """
+        with self._cond:
+            target = self._enqueued
+            if self._written >= target:
+                return True
+            if self._closed and not self._thread.is_alive():
+                return False
+
+            failures = self._failures
+            self._flush_requested = True
+            self._cond.notify_all()
+            self._cond.wait_for(
+                lambda: self._written >= target or self._failures > failures, timeout
+            )
+            return self._written >= target
+
+    def close(self, timeout: Optional[float] = None):
+        """Grava as pendências e encerra a thread escritora (um lote que
+        falhar depois do fechamento é descartado)"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+        self._thread.join(timeout)
+
+    def _run(self):
+        """Laço da thread escritora"""
+        while True:
+            with self._cond:
+                # Dorme até a primeira edição chegar
+                self._cond.wait_for(lambda: self._pending or self._closed)
+
+                # Espera o intervalo para acumular edições, salvo flush/limite/fechamento
+                self._cond.wait_for(
+                    lambda: (self._closed or self._flush_requested
+                             or len(self._pending) >= self.max_pending),
+                    self.flush_interval
+                )
+
+                if not self._pending:
+                    if self._closed:
+                        return
+                    continue
+
+                batch = list(self._pending.items())
+                self._in_flight = dict(self._pending)
+                self._pending.clear()
+                sequence = self._enqueued
+                self._flush_requested = False
+
+            try:
+                self._write_batch(batch)
+                error = None
+            except Exception as e:
+                print(f"Erro na gravação em segundo plano: {e}")
+                error = e
+
+            with self._cond:
+                self._in_flight = {}
+                if error is None:
+                    self._written = sequence
+                else:
+                    self.last_error = error
+                    self._failures += 1
+                    # Devolve o lote à fila, antes das edições mais novas (depois
+                    # do fechamento não há nova tentativa: o lote é descartado)
+                    if not self._closed:
+                        requeued = OrderedDict((key, value) for key, value in batch
+                                               if key not in self._pending)
+                        requeued.update(self._pending)
+                        self._pending = requeued
+                self._cond.notify_all()
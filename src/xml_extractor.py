@@ -0,0 +1,291 @@
+"""
+Módulo de Extração Estrutural de XML
+Extrai textos e atributos de documentos XML com o caminho de cada um
+
+- Usa o parser expat (biblioteca padrão) alimentado em blocos: a memória
+  fica limitada a um bloco mais o texto em andamento, qualquer que seja o
+  tamanho do arquivo (texto já carregado é codificado bloco a bloco)
+- Cada nó sai com o trecho exato do arquivo (entidades como &amp;
+  preservadas), obtido das posições em bytes que o expat informa em cada
+  evento, então a reinserção é byte a byte
+- Cada nó leva seu caminho de elementos, ex.: /Defs/ThingDef/label ou
+  /LanguageData/string/@text
+- Seletores no estilo XPath (//label, /Defs/*/description, //string/@text)
+  são compilados em tries de caminho (PathTrie), avançadas a cada elemento
+- Comentários, instruções de processamento e declarações nunca são extraídos
+"""
+
+import io
+import re
+from dataclasses import dataclass
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Union
+from xml.parsers import expat
+
+from json_extractor import PathTrie
+
+# Bytes entregues ao expat por vez
+XML_CHUNK_BYTES = 1024 * 1024
+
+# Atributo dentro da tag de abertura: nome, aspas e valor bruto
+_ATTRIBUTE = re.compile(rb'\s+([^\s=/>]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+_TAG_NAME = re.compile(rb'<[^\s/>]+')
+# Marcação no início de um evento, seguida dos espaços depois dela (em tags
+# de abertura, um '>' entre aspas não encerra a tag)
+_MARKUP = re.compile(rb'''
+    (?: <!--.*?-->
+      | <!\[CDATA\[
+      | <\?.*?\?>
+      | </[^>]*>
+      | \]\]>
+      | <[^"'>]*(?:(?:"[^"]*"|'[^']*')[^"'>]*)*>
+    )\s*
+''', re.VERBOSE | re.DOTALL)
+_NON_SPACE = re.compile(rb'\S')
+
+
+@dataclass
+class XmlNode:
+    """Texto ou atributo encontrado no documento"""
+    path: str         # Caminho do elemento (atributos terminam em /@nome)
+    name: str         # Nome do elemento ou do atributo
+    raw: str          # Trecho como está no arquivo, sem espaços nas pontas
+    start: int        # Posição do primeiro caractere do trecho
+    end: int          # Posição logo depois do trecho
+    attribute: bool   # True para valores de atributo
+
+
+class XmlSelector:
+    """
+    Conjunto de seletores no estilo XPath.
+
+    Sintaxe aceita: '/' separa elementos, '//' casa qualquer número de
+    níveis, '*' casa um elemento qualquer e um passo final '@nome' (ou '@*')
+    seleciona atributos em vez do texto. Seletores sem '/' inicial valem em
+    qualquer nível. Ex.: '//label', '/Defs/*/description', '//string/@text'.
+
+    Como nas tries de caminho, o texto de um elemento selecionado inclui o
+    texto dos elementos dentro dele.
+    """
+
+    def __init__(self, selectors: Iterable[str]):
+        """
+        Compila os seletores.
+
+        Args:
+            selectors: Seletores de texto e de atributos, misturados
+        """
+        text_patterns = []
+        attribute_patterns = []
+        for selector in selectors:
+            selector = selector.strip()
+            if selector.endswith('/text()'):
+                selector = selector[:-len('/text()')]
+            if not selector:
+                continue
+            if not selector.startswith('/'):
+                selector = '//' + selector
+
+            pattern = selector.replace('//', '/**/')
+            if pattern.rsplit('/', 1)[-1].startswith('@'):
+                attribute_patterns.append(pattern)
+            else:
+                text_patterns.append(pattern)
+
+        # XML diferencia maiúsculas de minúsculas
+        self.text = PathTrie(text_patterns)
+        self.attributes = PathTrie(attribute_patterns)
+
+    def accepts_attribute(self, state, name: str) -> bool:
+        """Indica se o atributo `name` do elemento no estado `state` é selecionado"""
+        attributes = self.attributes
+        return (attributes.accepts(attributes.step(state, '@' + name))
+                or attributes.accepts(attributes.step(state, '@*')))
+
+
+# Extração padrão: o texto de todos os elementos, nenhum atributo
+DEFAULT_XML_SELECTOR = XmlSelector(['//*'])
+
+
+class _XmlScanner:
+    """
+    Recebe os eventos de marcação do expat e monta os nós.
+
+    O texto de um elemento é o trecho entre o fim de uma marcação e o início
+    da próxima (tags, comentários, instruções, seções CDATA), então o parser
+    não precisa entregar o texto em pedaços: basta a posição de cada evento.
+    O fim da marcação anterior só é procurado no buffer quando o elemento
+    atual é selecionado. O buffer guarda só os bytes a partir do último
+    evento (eventos futuros nunca começam antes dele).
+    """
+
+    def __init__(self, selector: XmlSelector, encoding: str, char_offsets: bool):
+        self.selector = selector
+        self.encoding = encoding
+        self.char_offsets = char_offsets
+
+        self.parser = expat.ParserCreate(encoding)
+        self.parser.StartElementHandler = self._start_element
+        self.parser.EndElementHandler = self._end_element
+        self.parser.StartCdataSectionHandler = self._markup
+        self.parser.EndCdataSectionHandler = self._markup
+        self.parser.CommentHandler = self._markup
+        self.parser.ProcessingInstructionHandler = self._markup
+
+        # Pilha de elementos: (caminho, nome, texto selecionado, estado de
+        # texto, estado de atributos)
+        self.stack: List[tuple] = []
+        self.buffer = b''
+        self.base = 0                 # posição em bytes de buffer[0]
+        self.last_event = 0           # posição do último evento
+        self.after_markup = False     # o último evento começa com marcação (não com texto)
+        self.char_byte = 0            # posição em bytes já convertida para caracteres
+        self.char_count = 0           # caracteres antes de char_byte
+        self.ready: List[XmlNode] = []
+
+    def feed(self, data: bytes, final: bool = False) -> List[XmlNode]:
+        """Entrega um bloco ao parser e devolve os nós completados por ele"""
+        self.buffer += data
+        try:
+            self.parser.Parse(data, final)
+        except expat.ExpatError as e:
+            raise ValueError(f"XML inválido: {e}") from e
+
+        keep = self.last_event
+        if keep > self.base:
+            self._to_chars(keep)
+            self.buffer = self.buffer[keep - self.base:]
+            self.base = keep
+
+        ready, self.ready = self.ready, []
+        return ready
+
+    def _to_chars(self, position: int) -> int:
+        """Converte uma posição em bytes (crescente) para a unidade de saída"""
+        if not self.char_offsets:
+            return position
+        if position > self.char_byte:
+            segment = self.buffer[self.char_byte - self.base:position - self.base]
+            self.char_count += len(segment.decode(self.encoding))
+            self.char_byte = position
+        return self.char_count
+
+    def _emit(self, path: str, name: str, start: int, raw_bytes: bytes, attribute: bool):
+        """Cria o nó do trecho que começa em `start` (posição em bytes)"""
+        raw = raw_bytes.decode(self.encoding)
+        position = self._to_chars(start)
+        self.ready.append(XmlNode(path=path, name=name, raw=raw, start=position,
+                                  end=position + (len(raw) if self.char_offsets else len(raw_bytes)),
+                                  attribute=attribute))
+
+    def _event(self, position: int, after_markup: bool = True):
+        """Registra um evento em `position`, fechando o texto anterior a ele"""
+        stack = self.stack
+        if stack and stack[-1][2] and position > self.last_event:
+            base = self.base
+            start = self.last_event - base
+            if self.after_markup:
+                # Pula a marcação do evento anterior e os espaços depois dela
+                start = _MARKUP.match(self.buffer, start).end()
+            else:
+                content = _NON_SPACE.search(self.buffer, start, position - base)
+                start = content.start() if content else position - base
+            if start < position - base:
+                path, name = stack[-1][:2]
+                self._emit(path, name, base + start,
+                           self.buffer[start:position - base].rstrip(), False)
+        self.last_event = position
+        self.after_markup = after_markup
+
+    def _markup(self, *_):
+        self._event(self.parser.CurrentByteIndex)
+
+    def _start_element(self, name: str, attributes: dict):
+        position = self.parser.CurrentByteIndex
+        self._event(position)
+
+        text, attributes_trie = self.selector.text, self.selector.attributes
+        if self.stack:
+            parent_path, _, _, text_state, attribute_state = self.stack[-1]
+        else:
+            parent_path, text_state, attribute_state = '', text.initial, attributes_trie.initial
+        path = f'{parent_path}/{name}'
+        text_state = text.step(text_state, name)
+        attribute_state = attributes_trie.step(attribute_state, name)
+        self.stack.append((path, name, text.accepts(text_state), text_state, attribute_state))
+
+        if not attributes or not attribute_state:
+            return
+
+        # Valores brutos lidos da própria tag, que está inteira no buffer
+        buffer = self.buffer
+        base = self.base
+        cursor = _TAG_NAME.match(buffer, position - base).end()
+        while True:
+            match = _ATTRIBUTE.match(buffer, cursor)
+            if match is None:
+                break
+            cursor = match.end()
+            attribute = match.group(1).decode(self.encoding)
+            if not self.selector.accepts_attribute(attribute_state, attribute):
+                continue
+            group = 2 if match.group(2) is not None else 3
+            raw_bytes = match.group(group)
+            stripped = raw_bytes.strip()
+            if stripped:
+                self._emit(f'{path}/@{attribute}', attribute,
+                           base + match.start(group) + len(raw_bytes) - len(raw_bytes.lstrip()),
+                           stripped, True)
+
+    def _end_element(self, _name: str):
+        position = self.parser.CurrentByteIndex
+        # Em <tag/> o fim é informado logo depois da própria tag: o que vem
+        # a seguir já é texto
+        self._event(position, self.buffer.startswith(b'</', position - self.base))
+        self.stack.pop()
+
+
+def _iter_chunks(source: Union[str, bytes, BinaryIO], chunk_bytes: int) -> Iterator[bytes]:
+    """Blocos de bytes do documento (texto é codificado em UTF-8 aos pedaços,
+    sem cópia do documento inteiro)"""
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_bytes):
+            yield source[start:start + chunk_bytes].encode('utf-8')
+        return
+
+    stream = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+    while True:
+        chunk = stream.read(chunk_bytes)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_xml_nodes(source: Union[str, bytes, BinaryIO], selector: Optional[XmlSelector] = None,
+                   encoding: str = 'utf-8', char_offsets: bool = False,
+                   chunk_bytes: int = XML_CHUNK_BYTES) -> Iterator[XmlNode]:
+    """
+    Percorre os textos e atributos selecionados, em ordem, com memória limitada.
+
+    Args:
+        source: Documento já decodificado, em bytes ou arquivo aberto em
+            modo binário
+        selector: Seletores (None = texto de todos os elementos)
+        encoding: Encoding dos bytes (prevalece sobre a declaração do XML;
+            ignorado para texto, entregue ao parser como UTF-8)
+        char_offsets: Posições em caracteres do texto decodificado em vez
+            de bytes (para usar com o conteúdo já carregado)
+        chunk_bytes: Bytes entregues ao parser por vez
+
+    Yields:
+        Nós na ordem do documento
+
+    Raises:
+        ValueError: Se o documento não é XML bem formado
+    """
+    if isinstance(source, str):
+        encoding = 'utf-8'
+    scanner = _XmlScanner(selector or DEFAULT_XML_SELECTOR, encoding, char_offsets)
+
+    for chunk in _iter_chunks(source, chunk_bytes):
+        yield from scanner.feed(chunk)
+    yield from scanner.feed(b'', final=True)